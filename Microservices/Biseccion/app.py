@@ -1,15 +1,17 @@
 from flask import Flask, request, jsonify
-from sympy import symbols, N
-from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application
 from flask_cors import CORS
 import numpy as np
+from expresiones import obtener_ecuacion, evaluar, evaluar_grilla, cache_ecuaciones
+from lotes import leer_lote, resolver_lote, numero
+from nucleo_biseccion import biseccion_vectorizada, buscar_raices
+
+# Máximo de puntos de la malla de búsqueda y de puntos devueltos para el gráfico
+MAX_PUNTOS_BUSQUEDA = 1000000
+MAX_PUNTOS_GRAFICO = 1000
 
 app = Flask(__name__)
 CORS(app)
 
-# Transformaciones para permitir multiplicación implícita
-transformations = (standard_transformations + (implicit_multiplication_application,))
-
 @app.route('/biseccion', methods=['GET'])
 def metodo_biseccion():
     try:
@@ -29,17 +31,16 @@ def metodo_biseccion():
         if tol_error <= 0 or tol_error >= 1:
             return jsonify({"error": "El error debe ser 0 < tol_error < 1"}), 400
 
-        # Parsear ecuación
-        x = symbols('x')
+        # Parsear y compilar la ecuación (o tomarla de la caché)
         try:
-            ecuacion = parse_expr(ecuacion_str, transformations=transformations)
+            f = obtener_ecuacion(ecuacion_str)["f"]
         except Exception as e:
             return jsonify({"error": f"Error en la ecuación: {str(e)}"}), 400
 
         # Evaluar en los extremos
         try:
-            fxo = N(ecuacion.subs(x, xo))  # Convertir a número flotante
-            fxu = N(ecuacion.subs(x, xu))
+            fxo = evaluar(f, xo)
+            fxu = evaluar(f, xu)
         except Exception as e:
             return jsonify({"error": f"Error al evaluar: {str(e)}"}), 400
 
@@ -59,7 +60,7 @@ def metodo_biseccion():
         while error >= tol_error and nIteracion < 100:
             nIteracion += 1
             xm = (xo + xu) / 2
-            fxm = N(ecuacion.subs(x, xm))
+            fxm = evaluar(f, xm)
 
             # Calcular error relativo porcentual
             if nIteracion > 1:  # No calcular error en primera iteración
@@ -95,13 +96,7 @@ def metodo_biseccion():
 
         # --- DATOS PARA EL GRÁFICO ---
         grafico_x = np.linspace(float(request.args.get('xo')), float(request.args.get('xu')), 100)
-        grafico_y = []
-        for val in grafico_x:
-            try:
-                yval = float(N(ecuacion.subs(x, val)))
-            except:
-                yval = None
-            grafico_y.append(yval)
+        grafico_y = evaluar_grilla(f, grafico_x)
 
         return jsonify({
             "tabla": tabla,
@@ -112,5 +107,99 @@ def metodo_biseccion():
     except Exception as e:
         return jsonify({"error": f"Error inesperado: {str(e)}"}), 500
 
+@app.route('/biseccion/raices', methods=['GET'])
+def metodo_biseccion_raices():
+    try:
+        # Parámetros: ecuacion, intervalo [xo, xu], puntos de la malla y tol_error (opcional)
+        ecuacion_str = request.args.get('ecuacion')
+        xo = request.args.get('xo', type=float)
+        xu = request.args.get('xu', type=float)
+        puntos = request.args.get('puntos', 1000, type=int)
+        tol_error = request.args.get('tol_error', 1e-10, type=float)
+
+        # Validaciones básicas
+        if None in (ecuacion_str, xo, xu):
+            return jsonify({"error": "Parámetros faltantes: necesita 'ecuacion', 'xo' y 'xu'"}), 400
+
+        if xo >= xu:
+            return jsonify({"error": "El valor de 'xo' debe ser menor que 'xu'"}), 400
+
+        if tol_error <= 0 or tol_error >= 1:
+            return jsonify({"error": "El error debe ser 0 < tol_error < 1"}), 400
+
+        if not 2 <= puntos <= MAX_PUNTOS_BUSQUEDA:
+            return jsonify({"error": f"El número de 'puntos' debe estar entre 2 y {MAX_PUNTOS_BUSQUEDA}"}), 400
+
+        # Parsear y compilar la ecuación (o tomarla de la caché)
+        try:
+            f = obtener_ecuacion(ecuacion_str)["f"]
+        except Exception as e:
+            return jsonify({"error": f"Error en la ecuación: {str(e)}"}), 400
+
+        # Malla, cambios de signo y refinamiento simultáneo de todos los intervalos
+        raices, descartados, xs, fxs = buscar_raices(f, xo, xu, puntos, tol_error)
+
+        # --- DATOS PARA EL GRÁFICO (la misma malla, submuestreada) ---
+        paso = -(-puntos // MAX_PUNTOS_GRAFICO)
+        grafico_x = xs[::paso]
+        grafico_y = [v if np.isfinite(v) else None for v in fxs[::paso].tolist()]
+
+        return jsonify({
+            "raices": raices,
+            "descartados": descartados,
+            "puntos": puntos,
+            "grafico_x": grafico_x.tolist(),
+            "grafico_y": grafico_y
+        })
+
+    except Exception as e:
+        return jsonify({"error": f"Error inesperado: {str(e)}"}), 500
+
+def validar_problema(problema):
+    """Valida un problema del lote con las mismas reglas que /biseccion."""
+    ecuacion_str = problema.get('ecuacion')
+    if not isinstance(ecuacion_str, str) or not ecuacion_str.strip():
+        raise ValueError("Falta el parámetro 'ecuacion'.")
+    xo, xu, tol_error = numero(problema, 'xo'), numero(problema, 'xu'), numero(problema, 'tol_error')
+    if xo >= xu:
+        raise ValueError("El valor de 'xo' debe ser menor que 'xu'")
+    if tol_error <= 0 or tol_error >= 1:
+        raise ValueError("El error debe ser 0 < tol_error < 1")
+    return ecuacion_str, (xo, xu, tol_error)
+
+def resolver_grupo(ecuacion, parametros):
+    """Todos los intervalos de una misma ecuación se bisecan a la vez."""
+    xo, xu, tol_error = (np.array(columna) for columna in zip(*parametros))
+    r = biseccion_vectorizada(ecuacion["f"], xo, xu, tol_error)
+    resultados = []
+    for i, mensaje in enumerate(r["mensajes"]):
+        if mensaje:
+            resultados.append({"ok": False, "error": mensaje})
+        else:
+            resultados.append({"ok": True, "raiz": float(r["raiz"][i]), "fx": float(r["fx"][i]),
+                               "error_aproximado": float(r["error"][i]),
+                               "iteraciones": int(r["iteraciones"][i]), "convergio": bool(r["convergio"][i])})
+    return resultados
+
+@app.route('/biseccion/lote', methods=['POST'])
+def metodo_biseccion_lote():
+    try:
+        # Recibe {"problemas": [{"ecuacion", "xo", "xu", "tol_error"}, ...]} y devuelve un
+        # resultado por problema, en el mismo orden, con su propio error si falla
+        try:
+            problemas = leer_lote(request.get_json(silent=True))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        return jsonify({"resultados": resolver_lote(problemas, validar_problema, resolver_grupo)})
+
+    except Exception as e:
+        return jsonify({"error": f"Error inesperado: {str(e)}"}), 500
+
+@app.route('/cache', methods=['GET'])
+def estadisticas_cache():
+    # Aciertos, fallos y desalojos de la caché de ecuaciones parseadas y compiladas
+    return jsonify(cache_ecuaciones.estadisticas())
+
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5002, debug=True)
\ No newline at end of file
@@ -0,0 +1,99 @@
+import numpy as np
+from expresiones import evaluar_arreglo
+
+def biseccion_vectorizada(f, xo, xu, tol_error, max_iter=100):
+    """
+    Bisección sobre muchos intervalos [xo, xu] a la vez, con los mismos pasos y criterio
+    de parada que /biseccion: error relativo entre puntos medios sucesivos (desde la
+    segunda iteración) menor que tol_error, f(xm) == 0 o max_iter iteraciones.
+    En cada iteración f se evalúa una sola vez sobre los puntos medios de los intervalos
+    que siguen activos. Devuelve arreglos con la raíz (último xm), f(raíz), el error,
+    las iteraciones y una lista de mensajes de error (None si el intervalo se resolvió).
+    """
+    xo = np.array(xo, dtype=float)
+    xu = np.array(xu, dtype=float)
+    tol_error = np.broadcast_to(np.asarray(tol_error, dtype=float), xo.shape)
+    m = xo.size
+    mensajes = [None] * m
+
+    fxo = evaluar_arreglo(f, xo)
+    fxu = evaluar_arreglo(f, xu)
+    for i in np.flatnonzero(~(np.isfinite(fxo) & np.isfinite(fxu))):
+        punto = xo[i] if not np.isfinite(fxo[i]) else xu[i]
+        mensajes[i] = f"Error al evaluar: La función no está definida en x = {punto}"
+    sin_cambio = np.isfinite(fxo) & np.isfinite(fxu) & (fxo * fxu >= 0)
+    for i in np.flatnonzero(sin_cambio):
+        mensajes[i] = "No hay cambio de signo en el intervalo [xo, xu]"
+    activos = np.array([mensaje is None for mensaje in mensajes], dtype=bool)
+
+    raiz = np.full(m, np.nan)
+    fraiz = np.full(m, np.nan)
+    error = np.ones(m)
+    iteraciones = np.zeros(m, dtype=int)
+    xm_previo = xo.copy()
+
+    for n_iteracion in range(1, max_iter + 1):
+        idx = np.flatnonzero(activos)
+        if idx.size == 0:
+            break
+        xm = (xo[idx] + xu[idx]) / 2
+        fxm = evaluar_arreglo(f, xm)
+
+        invalidos = ~np.isfinite(fxm)
+        for i, punto in zip(idx[invalidos], xm[invalidos]):
+            mensajes[i] = f"Error al evaluar: La función no está definida en x = {punto}"
+            activos[i] = False
+        idx, xm, fxm = idx[~invalidos], xm[~invalidos], fxm[~invalidos]
+
+        if n_iteracion > 1:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                error[idx] = np.where(xm != 0, np.abs((xm - xm_previo[idx]) / xm), 0.0)
+
+        izquierda = fxo[idx] * fxm < 0
+        xu[idx[izquierda]], fxu[idx[izquierda]] = xm[izquierda], fxm[izquierda]
+        xo[idx[~izquierda]], fxo[idx[~izquierda]] = xm[~izquierda], fxm[~izquierda]
+
+        raiz[idx], fraiz[idx], iteraciones[idx] = xm, fxm, n_iteracion
+        xm_previo[idx] = xm
+        terminados = (error[idx] < tol_error[idx]) | (fxm == 0)
+        activos[idx[terminados]] = False
+
+    return {"raiz": raiz, "fx": fraiz, "error": error, "iteraciones": iteraciones,
+            "convergio": (error < tol_error) | (fraiz == 0), "mensajes": mensajes}
+
+def buscar_raices(f, a, b, puntos=1000, tol_error=1e-10, max_iter=100):
+    """
+    Busca todas las raíces de f en [a, b]: evalúa f de una vez sobre una malla de puntos,
+    detecta cada subintervalo con cambio de signo y los refina todos a la vez con
+    biseccion_vectorizada. Los ceros exactos de la malla se toman como raíces.
+    Un cambio de signo cuyo punto final tiene |f| mayor que en los extremos del
+    subintervalo es un polo (p. ej. tan(x) o 1/x) y se descarta, igual que los
+    subintervalos donde f deja de estar definida. Las raíces de multiplicidad par, sin
+    cambio de signo, solo se detectan si caen en la malla.
+    Devuelve (raices, descartados, xs, fxs), con raices y descartados como listas de dicts.
+    """
+    xs = np.linspace(a, b, puntos)
+    fxs = evaluar_arreglo(f, xs)
+    finitos = np.isfinite(fxs)
+
+    raices = [{"raiz": float(xi), "fx": 0.0, "iteraciones": 0, "intervalo": [float(xi), float(xi)]}
+              for xi in xs[finitos & (fxs == 0)]]
+    descartados = []
+
+    izquierda, derecha = fxs[:-1], fxs[1:]
+    cambios = np.flatnonzero(finitos[:-1] & finitos[1:] & (np.sign(izquierda) * np.sign(derecha) < 0))
+    if cambios.size:
+        r = biseccion_vectorizada(f, xs[cambios], xs[cambios + 1], tol_error, max_iter)
+        cota = np.maximum(np.abs(izquierda[cambios]), np.abs(derecha[cambios]))
+        for k, i in enumerate(cambios):
+            intervalo = [float(xs[i]), float(xs[i + 1])]
+            if r["mensajes"][k]:
+                descartados.append({"intervalo": intervalo, "motivo": r["mensajes"][k]})
+            elif abs(r["fx"][k]) > cota[k]:
+                descartados.append({"intervalo": intervalo, "motivo": "Polo: |f| crece al acercarse al cambio de signo"})
+            else:
+                raices.append({"raiz": float(r["raiz"][k]), "fx": float(r["fx"][k]),
+                               "iteraciones": int(r["iteraciones"][k]), "intervalo": intervalo})
+
+    raices.sort(key=lambda raiz: raiz["raiz"])
+    return raices, descartados, xs, fxs
@@ -0,0 +1,83 @@
+from flask import Flask, request, jsonify
+from flask_cors import CORS
+import numpy as np
+from expresiones import obtener_ecuacion, evaluar_grilla, cache_ecuaciones
+from nucleo_brent import brent, illinois, SinCambioDeSigno
+
+# Máximo de iteraciones que puede pedir un cliente
+MAX_ITERACIONES = 10000
+
+app = Flask(__name__)
+CORS(app)
+
+def metodo_cerrado(metodo):
+    """
+    Parámetros, validaciones y respuesta comunes a /brent y /illinois: los mismos
+    que /biseccion (ecuacion, xo, xu, tol_error) más max_iter opcional (100 por defecto).
+    """
+    try:
+        # Obtener parámetros
+        ecuacion_str = request.args.get('ecuacion')
+        xo = request.args.get('xo', type=float)
+        xu = request.args.get('xu', type=float)
+        tol_error = request.args.get('tol_error', type=float)
+        max_iter = request.args.get('max_iter', 100, type=int)
+
+        # Validaciones básicas
+        if None in (ecuacion_str, xo, xu, tol_error):
+            return jsonify({"error": "Parámetros faltantes: necesita 'ecuacion', 'xo', 'xu' y 'tol_error'"}), 400
+
+        if xo >= xu:
+            return jsonify({"error": "El valor de 'xo' debe ser menor que 'xu'"}), 400
+
+        if tol_error <= 0 or tol_error >= 1:
+            return jsonify({"error": "El error debe ser 0 < tol_error < 1"}), 400
+
+        if not 1 <= max_iter <= MAX_ITERACIONES:
+            return jsonify({"error": f"'max_iter' debe estar entre 1 y {MAX_ITERACIONES}"}), 400
+
+        # Parsear y compilar la ecuación (o tomarla de la caché)
+        try:
+            f = obtener_ecuacion(ecuacion_str)["f"]
+        except Exception as e:
+            return jsonify({"error": f"Error en la ecuación: {str(e)}"}), 400
+
+        try:
+            resultado = metodo(f, xo, xu, tol_error, max_iter)
+        except SinCambioDeSigno as e:
+            return jsonify({
+                "error": str(e),
+                "f(xo)": float(e.fxo),
+                "f(xu)": float(e.fxu)
+            }), 400
+        except ValueError as e:
+            return jsonify({"error": f"Error al evaluar: {str(e)}"}), 400
+
+        # --- DATOS PARA EL GRÁFICO ---
+        grafico_x = np.linspace(xo, xu, 100)
+        grafico_y = evaluar_grilla(f, grafico_x)
+
+        return jsonify({
+            **resultado,
+            "grafico_x": grafico_x.tolist(),
+            "grafico_y": grafico_y
+        })
+
+    except Exception as e:
+        return jsonify({"error": f"Error inesperado: {str(e)}"}), 500
+
+@app.route('/brent', methods=['GET'])
+def metodo_brent():
+    return metodo_cerrado(brent)
+
+@app.route('/illinois', methods=['GET'])
+def metodo_illinois():
+    return metodo_cerrado(illinois)
+
+@app.route('/cache', methods=['GET'])
+def estadisticas_cache():
+    # Aciertos, fallos y desalojos de la caché de ecuaciones parseadas y compiladas
+    return jsonify(cache_ecuaciones.estadisticas())
+
+if __name__ == '__main__':
+    app.run(host='0.0.0.0', port=5011, debug=True)
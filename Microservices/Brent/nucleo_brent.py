@@ -0,0 +1,174 @@
+import sys
+from expresiones import evaluar
+
+EPS = sys.float_info.epsilon
+
+def _evaluar(f, valor):
+    """evaluar, convirtiendo también las divisiones entre cero de Python en ValueError."""
+    try:
+        return evaluar(f, valor)
+    except ArithmeticError:
+        raise ValueError(f"La función no está definida en x = {valor}")
+
+def _error_relativo(actual, previo):
+    """Error relativo entre dos aproximaciones sucesivas (0 si la actual es 0)."""
+    return abs((actual - previo) / actual) if actual != 0 else 0.0
+
+class SinCambioDeSigno(ValueError):
+    """f tiene el mismo signo en ambos extremos del intervalo."""
+    def __init__(self, fxo, fxu):
+        super().__init__("No hay cambio de signo en el intervalo [xo, xu]")
+        self.fxo, self.fxu = fxo, fxu
+
+def _cambio_de_signo(f, xo, xu):
+    """Evalúa f en los extremos y lanza SinCambioDeSigno si no hay cambio de signo."""
+    fxo = _evaluar(f, xo)
+    fxu = _evaluar(f, xu)
+    if fxo * fxu > 0:
+        raise SinCambioDeSigno(fxo, fxu)
+    return fxo, fxu
+
+def brent(f, xo, xu, tol_error, max_iter=100):
+    """
+    Método de Brent: combina interpolación cuadrática inversa, secante y bisección
+    manteniendo siempre un intervalo con cambio de signo, por lo que converge siempre
+    y, cerca de la raíz, de forma superlineal. Una evaluación de f por iteración.
+    Se detiene cuando la mitad del intervalo es menor que tol_error relativo a la
+    aproximación, con piso absoluto tol_error cuando |x| < 1 para que una raíz en 0 también
+    converja (más el redondeo de máquina), o f(x) == 0.
+    Devuelve un diccionario con la tabla de iteraciones, la raíz, f(raíz), los
+    contadores y si convergió. Lanza ValueError si f no está definida y SinCambioDeSigno
+    si no hay cambio de signo.
+    """
+    a, b = xo, xu
+    fa, fb = _cambio_de_signo(f, a, b)
+    evaluaciones = 2
+    if fa == 0:
+        b, fb = a, fa
+    c, fc = a, fa
+    d = e = b - a
+    tabla = []
+    convergio = fb == 0
+
+    for n_iteracion in range(1, max_iter + 1):
+        if convergio:
+            break
+        # c es el extremo opuesto a b (f cambia de signo entre b y c)
+        if (fb > 0) == (fc > 0):
+            c, fc = a, fa
+            d = e = b - a
+        # b es siempre la mejor aproximación
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tolerancia = 2 * EPS * abs(b) + 0.5 * tol_error * max(abs(b), 1.0)
+        medio = 0.5 * (c - b)
+        if abs(medio) <= tolerancia:
+            convergio = True
+            break
+
+        paso = "biseccion"
+        if abs(e) >= tolerancia and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Secante
+                p, q = 2 * medio * s, 1 - s
+                tipo = "secante"
+            else:
+                # Interpolación cuadrática inversa
+                q, r = fa / fc, fb / fc
+                p = s * (2 * medio * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+                tipo = "interpolacion_inversa"
+            if p > 0:
+                q = -q
+            p = abs(p)
+            # Se acepta la interpolación solo si cae dentro del intervalo y reduce el paso lo suficiente
+            if 2 * p < min(3 * medio * q - abs(tolerancia * q), abs(e * q)):
+                e, d = d, p / q
+                paso = tipo
+            else:
+                d = e = medio
+        else:
+            d = e = medio
+
+        a, fa = b, fb
+        b += d if abs(d) > tolerancia else (tolerancia if medio > 0 else -tolerancia)
+        fb = _evaluar(f, b)
+        evaluaciones += 1
+
+        extremos = sorted((b, c))
+        tabla.append({
+            "nIteracion": n_iteracion,
+            "xo": float(extremos[0]),
+            "xu": float(extremos[1]),
+            "xr": float(b),
+            "fxr": float(fb),
+            "paso": paso,
+            "error": float(_error_relativo(b, a))
+        })
+        if fb == 0:
+            convergio = True
+
+    return {"tabla": tabla, "raiz": float(b), "fx": float(fb), "iteraciones": len(tabla),
+            "evaluaciones": evaluaciones, "convergio": bool(convergio)}
+
+def illinois(f, xo, xu, tol_error, max_iter=100):
+    """
+    Regla falsa con la modificación de Illinois: si el mismo extremo se conserva dos
+    iteraciones seguidas, su valor de f se divide entre dos, lo que evita el estancamiento
+    de la regla falsa clásica y da convergencia superlineal. Una evaluación por iteración.
+    Se detiene cuando el cambio entre aproximaciones sucesivas es menor que tol_error
+    relativo a xr, con el mismo piso absoluto que brent cuando |xr| < 1, o f(xr) == 0.
+    Devuelve lo mismo que brent.
+    """
+    fxo, fxu = _cambio_de_signo(f, xo, xu)
+    evaluaciones = 2
+    if fxo == 0 or fxu == 0:
+        raiz, fraiz = (xo, fxo) if fxo == 0 else (xu, fxu)
+        return {"tabla": [], "raiz": float(raiz), "fx": float(fraiz), "iteraciones": 0,
+                "evaluaciones": evaluaciones, "convergio": True}
+
+    tabla = []
+    xr_previo = None
+    xr, fxr = xo, fxo
+    retenido = 0  # +1: se conservó xo la última vez, -1: se conservó xu
+    error = 1.0
+    convergio = False
+
+    for n_iteracion in range(1, max_iter + 1):
+        xr = xu - fxu * (xo - xu) / (fxo - fxu)
+        fxr = _evaluar(f, xr)
+        evaluaciones += 1
+        if xr_previo is not None:
+            error = _error_relativo(xr, xr_previo)
+
+        tabla.append({
+            "nIteracion": n_iteracion,
+            "xo": float(xo),
+            "xu": float(xu),
+            "xr": float(xr),
+            "fxr": float(fxr),
+            "error": float(error)
+        })
+
+        if fxr == 0 or (xr_previo is not None and abs(xr - xr_previo) < tol_error * max(abs(xr), 1.0)):
+            convergio = True
+            break
+
+        if fxo * fxr < 0:
+            # La raíz está en [xo, xr]: se conserva xo
+            xu, fxu = xr, fxr
+            if retenido == 1:
+                fxo /= 2
+            retenido = 1
+        else:
+            xo, fxo = xr, fxr
+            if retenido == -1:
+                fxu /= 2
+            retenido = -1
+        xr_previo = xr
+
+    return {"tabla": tabla, "raiz": float(xr), "fx": float(fxr), "iteraciones": len(tabla),
+            "evaluaciones": evaluaciones, "convergio": convergio}
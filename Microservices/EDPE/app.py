@@ -1,46 +1,105 @@
-from flask import Flask, request, jsonify
+import json
+from flask import Flask, request, jsonify, Response
 from flask_cors import CORS
-import numpy as np
+from placa import (inicializar_placa, fijar_nodos, diccionario_fijos, resolver, generar_ecuaciones,
+                   tolerancia_efectiva, METODOS, PRECISIONES)
+
+# Por encima de este n, /edpe no incluye las ecuaciones salvo que se pidan explícitamente
+LIMITE_ECUACIONES = 20
 
 app = Flask(__name__)
 CORS(app)
 
-def resolver_placa(n, top, bottom, left, right, tol=1e-4, max_iter=10000):
-    # Inicializar la matriz de temperaturas
-    T = np.zeros((n+2, n+2))
-    T[0, :] = top
-    T[-1, :] = bottom
-    T[:, 0] = left
-    T[:, -1] = right
+def resolver_placa(n, top, bottom, left, right, tol=1e-4, max_iter=10000, metodo='sor', omega=None,
+                   incluir_ecuaciones=True, ny=None, nodos_fijos=(), precision='float64'):
+    # Inicializar la matriz de temperaturas (nx = n columnas, ny filas) y los nodos fijos
+    T = inicializar_placa(n, top, bottom, left, right, ny, PRECISIONES[precision])
+    fijos = fijar_nodos(T, nodos_fijos)
 
-    # Generar ecuaciones de diferencias finitas
+    # Generar ecuaciones de diferencias finitas solo si se van a devolver
     ecuaciones = []
-    for i in range(1, n+1):
-        for j in range(1, n+1):
-            ecuaciones.append(f"T[{i},{j}] = 0.25 * (T[{i+1},{j}] + T[{i-1},{j}] + T[{i},{j+1}] + T[{i},{j-1}])")
-
-    # Resolver el sistema de ecuaciones utilizando diferencias finitas
-    for _ in range(max_iter):
-        T_old = T.copy()
-        for i in range(1, n+1):
-            for j in range(1, n+1):
-                T[i, j] = 0.25 * (T[i+1, j] + T[i-1, j] + T[i, j+1] + T[i, j-1])
-        if np.max(np.abs(T - T_old)) < tol:
-            break
-    return T, ecuaciones
-
-@app.route('/edpe', methods=['GET'])
+    if incluir_ecuaciones:
+        ecuaciones = list(generar_ecuaciones(n, ny, fijos=diccionario_fijos(n, T.shape[0] - 2, nodos_fijos)))
+
+    # Resolver el sistema de ecuaciones con el método elegido, directamente sobre T, con una
+    # tolerancia que la precisión elegida pueda alcanzar
+    tol = tolerancia_efectiva(T, tol, metodo, omega)
+    iteraciones = resolver(T, metodo, tol, max_iter, omega, fijos)
+    return T, ecuaciones, iteraciones, tol
+
+def _obtener_parametro():
+    """Función para leer parámetros de la URL (GET) o de un cuerpo JSON (POST)."""
+    if request.method == 'POST':
+        datos = request.get_json(silent=True)
+        if not isinstance(datos, dict):
+            raise ValueError("El cuerpo de la petición debe ser un objeto JSON.")
+        return datos.get
+    return request.args.get
+
+def leer_fijos(valor):
+    """Nodos fijos como lista de {"i", "j", "valor"}; en la URL, la misma lista como texto JSON."""
+    if isinstance(valor, str):
+        valor = json.loads(valor)
+    return [(int(nodo["i"]), int(nodo["j"]), float(nodo["valor"])) for nodo in valor or []]
+
+def leer_parametros():
+    """
+    Parámetros de la placa desde la URL (GET) o desde un cuerpo JSON (POST). En JSON los
+    bordes pueden ser números o arreglos por nodo y 'fijos' es una lista de {"i", "j", "valor"}.
+    """
+    obtener = _obtener_parametro()
+
+    def borde(nombre, defecto):
+        valor = obtener(nombre, defecto)
+        return [float(v) for v in valor] if isinstance(valor, list) else float(valor)
+
+    nx = int(obtener('nx', obtener('n', 3)))
+    ny = int(obtener('ny', nx))
+    parametros = {
+        "nx": nx,
+        "ny": ny,
+        "top": borde('top', 100),
+        "bottom": borde('bottom', 100),
+        "left": borde('left', 0),
+        "right": borde('right', 0),
+        "tol": float(obtener('tol', 1e-4)),
+        "max_iter": int(obtener('max_iter', 10000)),
+        "metodo": obtener('metodo', 'sor'),
+        "omega": None if obtener('omega') is None else float(obtener('omega')),
+        "precision": obtener('precision', 'float64'),
+        "fijos": leer_fijos(obtener('fijos', None))
+    }
+    incluir = obtener('incluir_ecuaciones', nx * ny <= LIMITE_ECUACIONES ** 2)
+    parametros["incluir_ecuaciones"] = incluir if isinstance(incluir, bool) else str(incluir).lower() == 'true'
+    return parametros
+
+@app.route('/edpe', methods=['GET', 'POST'])
 def edpe():
     try:
-        n = int(request.args.get('n', 3))
-        top = float(request.args.get('top', 100))
-        bottom = float(request.args.get('bottom', 100))
-        left = float(request.args.get('left', 0))
-        right = float(request.args.get('right', 0))
-        tol = float(request.args.get('tol', 1e-4))
-        max_iter = int(request.args.get('max_iter', 10000))
+        try:
+            p = leer_parametros()
+        except (ValueError, TypeError, KeyError) as e:
+            return jsonify({"error": f"Parámetros inválidos: {e}"}), 400
+        n, ny = p["nx"], p["ny"]
+        metodo, omega = p["metodo"], p["omega"]
 
-        T, ecuaciones = resolver_placa(n, top, bottom, left, right, tol, max_iter)
+        if n < 1 or ny < 1:
+            return jsonify({"error": "Los valores de 'nx' y 'ny' deben ser mayores que 0."}), 400
+        if p["max_iter"] < 1:
+            return jsonify({"error": "El valor de 'max_iter' debe ser mayor o igual que 1."}), 400
+        if metodo not in METODOS:
+            return jsonify({"error": f"El 'metodo' debe ser uno de: {', '.join(METODOS)}."}), 400
+        if omega is not None and not 0 < omega < 2:
+            return jsonify({"error": "El valor de 'omega' debe cumplir 0 < omega < 2."}), 400
+        if p["precision"] not in PRECISIONES:
+            return jsonify({"error": f"La 'precision' debe ser una de: {', '.join(PRECISIONES)}."}), 400
+
+        try:
+            T, ecuaciones, iteraciones, tol = resolver_placa(n, p["top"], p["bottom"], p["left"], p["right"],
+                                                        p["tol"], p["max_iter"], metodo, omega,
+                                                        p["incluir_ecuaciones"], ny, p["fijos"], p["precision"])
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
         # Solo la matriz interna (sin los bordes)
         matriz_resultado = T[1:-1, 1:-1].tolist()
@@ -48,13 +107,68 @@ def edpe():
         return jsonify({
             "matriz": matriz_resultado,
             "ecuaciones": ecuaciones,
+            "ecuaciones_incluidas": p["incluir_ecuaciones"],
+            "total_ecuaciones": n * ny,
             "n": n,
-            "top": top,
-            "bottom": bottom,
-            "left": left,
-            "right": right,
+            "nx": n,
+            "ny": ny,
+            "top": p["top"],
+            "bottom": p["bottom"],
+            "left": p["left"],
+            "right": p["right"],
             "tol": tol,
-            "max_iter": max_iter
+            "tol_ajustada": tol != p["tol"],
+            "max_iter": p["max_iter"],
+            "metodo": metodo,
+            "precision": p["precision"],
+            "fijos": [{"i": i, "j": j, "valor": valor} for i, j, valor in p["fijos"]],
+            "iteraciones": iteraciones
+        })
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/edpe/ecuaciones', methods=['GET', 'POST'])
+def edpe_ecuaciones():
+    """
+    Ecuaciones de diferencias finitas de la placa, por páginas (pagina, tamano) o,
+    con stream=true, como texto plano enviado línea a línea a medida que se generan.
+    Acepta los mismos 'fijos' que /edpe para que las ecuaciones coincidan con el sistema resuelto.
+    """
+    try:
+        try:
+            obtener = _obtener_parametro()
+            n = int(obtener('nx', obtener('n', 3)))
+            ny = int(obtener('ny', n))
+            pagina = int(obtener('pagina', 1))
+            tamano = int(obtener('tamano', 100))
+            nodos_fijos = leer_fijos(obtener('fijos', None))
+        except (ValueError, TypeError, KeyError) as e:
+            return jsonify({"error": f"Parámetros inválidos: {e}"}), 400
+        if n < 1 or ny < 1:
+            return jsonify({"error": "Los valores de 'nx' y 'ny' deben ser mayores que 0."}), 400
+        try:
+            valores_fijos = diccionario_fijos(n, ny, nodos_fijos)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        if str(obtener('stream', 'false')).lower() == 'true':
+            return Response((ecuacion + "\n" for ecuacion in generar_ecuaciones(n, ny, fijos=valores_fijos)),
+                            mimetype='text/plain')
+
+        if pagina < 1 or tamano < 1:
+            return jsonify({"error": "Los valores de 'pagina' y 'tamano' deben ser mayores que 0."}), 400
+
+        total = n * ny
+        inicio = (pagina - 1) * tamano
+        return jsonify({
+            "ecuaciones": list(generar_ecuaciones(n, ny, inicio, inicio + tamano, valores_fijos)),
+            "pagina": pagina,
+            "tamano": tamano,
+            "paginas": (total + tamano - 1) // tamano,
+            "total_ecuaciones": total,
+            "n": n,
+            "nx": n,
+            "ny": ny
         })
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -0,0 +1,284 @@
+import math
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import spsolve
+
+METODOS = ('sor', 'jacobi', 'directo', 'multigrid')
+
+# Esquinas de los cuatro sub-bloques de paso 2 del interior: los dos primeros son
+# los nodos rojos (i + j par) y los dos últimos los negros
+BLOQUES_ROJO_NEGRO = ((1, 1), (2, 2), (1, 2), (2, 1))
+
+PRECISIONES = {'float64': np.float64, 'float32': np.float32}
+
+def _asignar_borde(T, lado, valor):
+    """
+    Asigna un borde de T. El valor puede ser un escalar, un arreglo con un valor por nodo
+    interior del borde o un arreglo que incluya también las dos esquinas.
+    """
+    completo = {'top': T[0, :], 'bottom': T[-1, :], 'left': T[:, 0], 'right': T[:, -1]}[lado]
+    valor = np.asarray(valor, dtype=T.dtype)
+    if valor.ndim == 0 or valor.shape[0] == completo.shape[0]:
+        completo[:] = valor
+    elif valor.ndim == 1 and valor.shape[0] == completo.shape[0] - 2:
+        completo[1:-1] = valor
+    else:
+        raise ValueError(f"El borde '{lado}' debe ser un número o un arreglo de "
+                         f"{completo.shape[0] - 2} o {completo.shape[0]} valores.")
+
+def inicializar_placa(nx, top, bottom, left, right, ny=None, dtype=np.float64):
+    """
+    Matriz de temperaturas (ny+2)x(nx+2) con las condiciones de frontera y el interior en cero.
+    Si no se da ny la malla es cuadrada. Es el único arreglo que usan los métodos iterativos.
+    """
+    ny = nx if ny is None else ny
+    T = np.zeros((ny+2, nx+2), dtype=dtype)
+    _asignar_borde(T, 'top', top)
+    _asignar_borde(T, 'bottom', bottom)
+    _asignar_borde(T, 'left', left)
+    _asignar_borde(T, 'right', right)
+    return T
+
+def diccionario_fijos(nx, ny, nodos):
+    """
+    Nodos fijos como diccionario {(i, j): valor}. nodos es una lista de (i, j, valor) con i en
+    1..ny y j en 1..nx; lanza ValueError si alguno no es un nodo interior.
+    """
+    for i, j, _ in nodos:
+        if not (1 <= i <= ny and 1 <= j <= nx):
+            raise ValueError(f"El nodo fijo ({i}, {j}) no es un nodo interior de la placa.")
+    return {(i, j): valor for i, j, valor in nodos}
+
+def fijar_nodos(T, nodos):
+    """
+    Fija la temperatura de nodos interiores (ver diccionario_fijos). Escribe los valores en T
+    y devuelve la máscara (ny, nx) de nodos fijos.
+    """
+    ny, nx = T.shape[0] - 2, T.shape[1] - 2
+    fijos = np.zeros((ny, nx), dtype=bool)
+    for (i, j), valor in diccionario_fijos(nx, ny, nodos).items():
+        T[i, j] = valor
+        fijos[i-1, j-1] = True
+    return fijos
+
+def ecuacion_nodo(nx, k, fijos=None):
+    """Ecuación de diferencias finitas del k-ésimo nodo interior (orden por filas, desde 0)."""
+    i, j = k // nx + 1, k % nx + 1
+    if fijos and (i, j) in fijos:
+        return f"T[{i},{j}] = {fijos[(i, j)]}"
+    return f"T[{i},{j}] = 0.25 * (T[{i+1},{j}] + T[{i-1},{j}] + T[{i},{j+1}] + T[{i},{j-1}])"
+
+def generar_ecuaciones(nx, ny=None, inicio=0, fin=None, fijos=None):
+    """
+    Generador de las ecuaciones de los nodos interiores entre las posiciones inicio y fin.
+    Cada texto se construye solo cuando se pide, sin armar la lista de nx*ny ecuaciones.
+    fijos es un diccionario opcional {(i, j): valor} de nodos con temperatura fija.
+    """
+    total = nx * (nx if ny is None else ny)
+    fin = total if fin is None else min(fin, total)
+    for k in range(inicio, fin):
+        yield ecuacion_nodo(nx, k, fijos)
+
+def omega_optimo(nx, ny=None):
+    """Relajación óptima de SOR para el laplaciano de 5 puntos en una malla nx x ny."""
+    ny = nx if ny is None else ny
+    rho = 0.5 * (math.cos(math.pi / (nx + 1)) + math.cos(math.pi / (ny + 1)))
+    return 2 / (1 + math.sqrt(1 - rho * rho))
+
+def resolver_jacobi(T, tol, max_iter, fijos=None):
+    """
+    Barridos de Jacobi vectorizados con rebanadas: todo el interior se actualiza a la vez
+    a partir del barrido anterior, usando dos buffers preasignados del tamaño del interior.
+    Los nodos fijos conservan su valor.
+    """
+    interior = T[1:-1, 1:-1]
+    nuevo = np.empty_like(interior)
+    diferencia = np.empty_like(interior)
+    iteracion = 0
+    for iteracion in range(1, max_iter + 1):
+        np.add(T[2:, 1:-1], T[:-2, 1:-1], out=nuevo)
+        nuevo += T[1:-1, 2:]
+        nuevo += T[1:-1, :-2]
+        nuevo *= 0.25
+        if fijos is not None:
+            np.copyto(nuevo, interior, where=fijos)
+        np.subtract(nuevo, interior, out=diferencia)
+        np.abs(diferencia, out=diferencia)
+        cambio = diferencia.max()
+        interior[...] = nuevo
+        if cambio < tol:
+            break
+    return iteracion
+
+def resolver_sor(T, tol, max_iter, omega=None, fijos=None):
+    """
+    SOR rojo-negro vectorizado: primero se actualizan todos los nodos rojos y luego
+    todos los negros, cada grupo con rebanadas de paso 2 y directamente sobre T.
+    Los buffers de cada bloque se preasignan una vez; los nodos fijos no se actualizan.
+    """
+    ny, nx = T.shape[0] - 2, T.shape[1] - 2
+    if omega is None:
+        omega = omega_optimo(nx, ny)
+
+    bloques = []
+    for i0, j0 in BLOQUES_ROJO_NEGRO:
+        if i0 > ny or j0 > nx:
+            continue
+        centro = T[i0:ny+1:2, j0:nx+1:2]
+        vecinos = (T[i0-1:ny:2, j0:nx+1:2], T[i0+1:ny+2:2, j0:nx+1:2],
+                   T[i0:ny+1:2, j0-1:nx:2], T[i0:ny+1:2, j0+1:nx+2:2])
+        libres = None if fijos is None else ~fijos[i0-1::2, j0-1::2]
+        bloques.append((centro, vecinos, libres, np.empty_like(centro)))
+
+    iteracion = 0
+    for iteracion in range(1, max_iter + 1):
+        cambio = 0.0
+        for centro, (arriba, abajo, izquierda, derecha), libres, delta in bloques:
+            np.add(arriba, abajo, out=delta)
+            delta += izquierda
+            delta += derecha
+            delta *= 0.25
+            delta -= centro
+            delta *= omega
+            if libres is not None:
+                delta *= libres
+            centro += delta
+            np.abs(delta, out=delta)
+            cambio = max(cambio, float(delta.max()))
+        if cambio < tol:
+            break
+    return iteracion
+
+def sistema_laplaciano(T, fijos=None):
+    """
+    Sistema disperso A u = b del laplaciano de 5 puntos sobre los nodos interiores
+    (ordenados por filas); las temperaturas de la frontera pasan al lado derecho.
+    Cada nodo fijo queda como una fila identidad y su columna pasa al lado derecho,
+    así A sigue siendo simétrica.
+    """
+    ny, nx = T.shape[0] - 2, T.shape[1] - 2
+    uno_x = sparse.diags([1.0, 1.0], [-1, 1], shape=(nx, nx))
+    uno_y = sparse.diags([1.0, 1.0], [-1, 1], shape=(ny, ny))
+    A = (4 * sparse.identity(nx * ny) - sparse.kron(sparse.identity(ny), uno_x)
+         - sparse.kron(uno_y, sparse.identity(nx))).tocsr()
+
+    b = np.zeros((ny, nx))
+    b[0, :] += T[0, 1:-1]
+    b[-1, :] += T[-1, 1:-1]
+    b[:, 0] += T[1:-1, 0]
+    b[:, -1] += T[1:-1, -1]
+    b = b.ravel()
+
+    if fijos is not None and fijos.any():
+        fijo = fijos.ravel()
+        valores = np.where(fijo, T[1:-1, 1:-1].ravel(), 0.0)
+        libre = sparse.diags((~fijo).astype(float))
+        b = np.where(fijo, valores, b - A @ valores)
+        A = (libre @ A @ libre + sparse.diags(fijo.astype(float))).tocsr()
+    return A, b
+
+def resolver_directo(T, fijos=None):
+    """Resuelve el laplaciano de 5 puntos con una factorización dispersa directa."""
+    ny, nx = T.shape[0] - 2, T.shape[1] - 2
+    A, b = sistema_laplaciano(T, fijos)
+    T[1:-1, 1:-1] = spsolve(A.tocsc(), b).reshape(ny, nx)
+    return 1
+
+def _prolongacion_1d(n):
+    """
+    Interpolación lineal de la malla gruesa (n // 2 nodos, en los índices finos 2k) a la
+    fina (n nodos). Sirve para n par o impar.
+    """
+    nc = n // 2
+    filas, columnas, valores = [], [], []
+    for f in range(n):
+        i = f + 1  # índice fino desde 1
+        if i % 2 == 0:
+            filas.append(f); columnas.append(i // 2 - 1); valores.append(1.0)
+        else:
+            for k in ((i - 1) // 2, (i + 1) // 2):
+                if 1 <= k <= nc:
+                    filas.append(f); columnas.append(k - 1); valores.append(0.5)
+    return sparse.csr_matrix((valores, (filas, columnas)), shape=(n, nc))
+
+def _niveles_multigrid(A, nx, ny, libres=None, tamano_minimo=7):
+    """
+    Jerarquía de Galerkin: (A, P, 1/diag(A)) por nivel, A_grueso = P^T A P.
+    En el nivel fino la prolongación no toca los nodos fijos (filas de P en cero); los
+    nodos gruesos que quedan sin acoplamiento reciben una fila identidad.
+    """
+    niveles = []
+    while min(nx, ny) > tamano_minimo:
+        P = sparse.kron(_prolongacion_1d(ny), _prolongacion_1d(nx)).tocsr()
+        if libres is not None and not niveles:
+            P = (sparse.diags(libres.astype(float)) @ P).tocsr()
+        niveles.append((A, P, 1.0 / A.diagonal()))
+        A = (P.T @ A @ P).tocsr()
+        vacias = A.diagonal() == 0
+        if vacias.any():
+            A = (A + sparse.diags(vacias.astype(float))).tocsr()
+        nx, ny = nx // 2, ny // 2
+    niveles.append((A, None, 1.0 / A.diagonal()))
+    return niveles
+
+def _ciclo_v(niveles, nivel, u, b, suavizados=2, peso=0.8):
+    """Un ciclo V con Jacobi ponderado como suavizador y solución directa en la malla más gruesa."""
+    A, P, inv_d = niveles[nivel]
+    if P is None:
+        return spsolve(A.tocsc(), b)
+    for _ in range(suavizados):
+        u = u + peso * inv_d * (b - A @ u)
+    residuo_grueso = P.T @ (b - A @ u)
+    correccion = _ciclo_v(niveles, nivel + 1, np.zeros(P.shape[1]), residuo_grueso, suavizados, peso)
+    u = u + P @ correccion
+    for _ in range(suavizados):
+        u = u + peso * inv_d * (b - A @ u)
+    return u
+
+def resolver_multigrid(T, tol, max_iter, fijos=None):
+    """Multimalla geométrica: ciclos V hasta que el cambio máximo entre ciclos sea menor que tol."""
+    ny, nx = T.shape[0] - 2, T.shape[1] - 2
+    A, b = sistema_laplaciano(T, fijos)
+    niveles = _niveles_multigrid(A, nx, ny, None if fijos is None else ~fijos.ravel())
+    u = T[1:-1, 1:-1].ravel().astype(float)
+    iteracion = 0
+    for iteracion in range(1, max_iter + 1):
+        u_nuevo = _ciclo_v(niveles, 0, u, b)
+        cambio = np.max(np.abs(u_nuevo - u))
+        u = u_nuevo
+        if cambio < tol:
+            break
+    T[1:-1, 1:-1] = u.reshape(ny, nx)
+    return iteracion
+
+def tolerancia_efectiva(T, tol, metodo='sor', omega=None):
+    """
+    Tolerancia alcanzable con la precisión de T: el cambio entre barridos no baja del redondeo,
+    unas pocas veces eps * max|T| (~5e-5 con float32 y temperaturas de 100), y en SOR la
+    sobrerrelajación lo amplifica en omega / (2 - omega). Una tolerancia menor haría correr
+    siempre max_iter barridos, así que se sube hasta ese piso.
+    """
+    piso = 4 * float(np.finfo(T.dtype).eps) * float(np.abs(T).max())
+    if metodo == 'sor':
+        if omega is None:
+            omega = omega_optimo(T.shape[1] - 2, T.shape[0] - 2)
+        piso *= max(1.0, omega / (2 - omega))
+    return max(tol, piso)
+
+def resolver(T, metodo='sor', tol=1e-4, max_iter=10000, omega=None, fijos=None):
+    """
+    Resuelve la placa en el mismo arreglo T con el método pedido; devuelve las iteraciones usadas.
+    fijos es una máscara opcional (ny, nx) de nodos interiores cuya temperatura no cambia.
+    tol debe venir ya ajustada con tolerancia_efectiva.
+    """
+    if fijos is not None and not fijos.any():
+        fijos = None
+    if metodo == 'sor':
+        return resolver_sor(T, tol, max_iter, omega, fijos)
+    if metodo == 'jacobi':
+        return resolver_jacobi(T, tol, max_iter, fijos)
+    if metodo == 'directo':
+        return resolver_directo(T, fijos)
+    if metodo == 'multigrid':
+        return resolver_multigrid(T, tol, max_iter, fijos)
+    raise ValueError(f"Método desconocido '{metodo}'. Opciones: {', '.join(METODOS)}.")
@@ -1,79 +1,221 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
+import json
 import numpy as np
+from funciones import compilar_funcion, compilar_sistema, verificar_dimension
+import integradores
+
+# Por encima de este n, la tabla fila por fila no se incluye salvo que se pida
+LIMITE_TABLA = 10000
+
+# Por defecto x, y y f_vals se submuestrean a lo sumo a este número de puntos (con
+# max_puntos=0 se devuelven todos): serializar millones de valores a JSON cuesta más
+# que la integración
+MAX_PUNTOS = LIMITE_TABLA + 1
 
 app = Flask(__name__)
 CORS(app)
 
+def leer_lista(texto, nombre):
+    """Interpreta un parámetro escrito como arreglo JSON, p. ej. f=["y1","-y0"] o y0=[1,0]."""
+    try:
+        valor = json.loads(texto)
+    except json.JSONDecodeError:
+        raise ValueError(f"El parámetro '{nombre}' no es un arreglo JSON válido.")
+    if not isinstance(valor, list) or not valor:
+        raise ValueError(f"El parámetro '{nombre}' debe ser un arreglo no vacío.")
+    return valor
+
+def leer_problema():
+    """
+    Lee el problema de valor inicial común a todos los métodos: f (str), x0, y0, xf, n
+    y max_puntos (puntos devueltos en la respuesta).
+    Para un sistema, f es un arreglo JSON de expresiones en x, y0, y1, ... (p. ej.
+    f=["y1","-y0"]) e y0 el arreglo de condiciones iniciales. Compila f una sola vez
+    (sólo x, y, np y funciones matemáticas). Lanza ValueError con un mensaje para el
+    usuario si algún parámetro no es válido.
+    """
+    f_str = request.args.get('f')
+    x0 = float(request.args.get('x0', 0))
+    xf = float(request.args.get('xf', 1))
+    n = int(request.args.get('n', 10))
+    max_puntos = int(request.args.get('max_puntos', MAX_PUNTOS))
+    if f_str is None or f_str.strip() == "":
+        raise ValueError("Debes enviar la función f como parámetro de la forma f='x+y'.")
+    if n < 1:
+        raise ValueError("El número de pasos n debe ser mayor que 0.")
+    if max_puntos < 0 or max_puntos == 1:
+        raise ValueError("El valor de 'max_puntos' debe ser 0 (todos los puntos) o al menos 2.")
+
+    if f_str.strip().startswith('['):
+        fuentes = [str(fuente) for fuente in leer_lista(f_str, 'f')]
+        y0 = [float(v) for v in leer_lista(request.args.get('y0', '[]'), 'y0')]
+        if len(y0) != len(fuentes):
+            raise ValueError(f"El sistema tiene {len(fuentes)} ecuaciones pero y0 tiene {len(y0)} valores.")
+        f, usadas = compilar_sistema(fuentes, ("x",), "y")
+        verificar_dimension(f, x0, y0)
+        return {"f_str": fuentes, "f": f, "depende_de_y": any(v != "x" for v in usadas),
+                "x0": x0, "y0": y0, "y0_arreglo": np.array(y0), "xf": xf, "n": n, "sistema": True,
+                "max_puntos": max_puntos}
+
+    y0 = float(request.args.get('y0', 0))
+    f, usadas = compilar_funcion(f_str, ("x", "y"))
+    verificar_dimension(f, x0, y0)
+    return {"f_str": f_str, "f": f, "depende_de_y": "y" in usadas, "x0": x0, "y0": y0,
+            "y0_arreglo": y0, "xf": xf, "n": n, "sistema": False, "max_puntos": max_puntos}
+
+def comparar_con_real(xs, ys):
+    """
+    Si el usuario proporciona la solución exacta y_real, la evalúa sobre todos los x
+    a la vez y devuelve (y_real, errores); si no, o si falla, dos listas vacías.
+    En un sistema, y_real es un arreglo JSON con una expresión en x por componente.
+    """
+    y_real_func_str = request.args.get("y_real", None)
+    if not y_real_func_str:
+        return [], []
+    try:
+        if y_real_func_str.strip().startswith('['):
+            y_real, _ = compilar_sistema(leer_lista(y_real_func_str, 'y_real'), ("x",), None)
+        else:
+            y_real, _ = compilar_funcion(y_real_func_str, ("x",))
+        with np.errstate(all="ignore"):
+            valores = np.broadcast_to(np.asarray(y_real(xs), dtype=float), ys.shape)
+        return valores.tolist(), np.abs(ys - valores).tolist()
+    except Exception:
+        return [], []
+
+def indices_submuestreo(puntos, max_puntos):
+    """
+    Índices de los puntos devueltos: uno de cada 'paso', siempre con el primero y el último.
+    Devuelve (indices, paso); con max_puntos = 0 o suficiente, todos los puntos y paso 1.
+    """
+    if max_puntos == 0 or puntos <= max_puntos:
+        return np.arange(puntos), 1
+    paso = -(-(puntos - 1) // (max_puntos - 1))
+    indices = np.arange(0, puntos, paso)
+    if indices[-1] != puntos - 1:
+        indices = np.append(indices, puntos - 1)
+    return indices, int(paso)
+
+def respuesta(problema, metodo, xs, ys, fs, h, evaluaciones, **extra):
+    """
+    Respuesta común de los integradores: tabla, arreglos, errores y contadores. Con más
+    puntos que max_puntos, los arreglos y la tabla se submuestrean ('i' conserva el índice
+    original); 'pasos' y los contadores siempre corresponden a la integración completa.
+    """
+    puntos = len(xs)
+    indices, paso = indices_submuestreo(puntos, problema["max_puntos"])
+    if paso > 1:
+        xs, ys, fs = xs[indices], ys[indices], fs[indices]
+        if isinstance(h, list):
+            h = [h[i - 1] for i in indices[1:].tolist()]
+    y_real_vals, errores = comparar_con_real(xs, ys)
+    incluir_tabla = request.args.get('incluir_tabla', str(puntos <= LIMITE_TABLA + 1)).lower() == 'true'
+
+    xs, ys, fs = xs.tolist(), ys.tolist(), fs.tolist()
+    tabla = []
+    if incluir_tabla:
+        tabla = [{"i": i, "x": xs[k], "y": ys[k], "f": fs[k], "error": errores[k] if errores else None, "y_real": y_real_vals[k] if y_real_vals else None} for k, i in enumerate(indices.tolist())]
+
+    return jsonify({
+        "tabla": tabla,
+        "h": h,
+        "x": xs,
+        "y": ys,
+        "f_vals": fs,
+        "n": puntos - 1,
+        "f": problema["f_str"],
+        "x0": problema["x0"],
+        "y0": problema["y0"],
+        "xf": problema["xf"],
+        "errores": errores,
+        "y_real": y_real_vals,
+        "metodo": metodo,
+        "sistema": problema["sistema"],
+        "pasos": puntos - 1,
+        "evaluaciones": evaluaciones,
+        "puntos_devueltos": len(indices),
+        "submuestreo": paso,
+        **extra
+    })
+
 @app.route('/euler', methods=['GET'])
 def euler():
     try:
         # Recibe: f (str), x0 (float), y0 (float), xf (float), n (int)
-        f_str = request.args.get('f')
-        x0 = float(request.args.get('x0', 0))
-        y0 = float(request.args.get('y0', 0))
-        xf = float(request.args.get('xf', 1))
-        n = int(request.args.get('n', 10))
-        if f_str is None or f_str.strip() == "":
-            return jsonify({"error": "Debes enviar la función f como parámetro de la forma f='x+y'."}), 400
-        if n < 1:
-            return jsonify({"error": "El número de pasos n debe ser mayor que 0."}), 400
-
-        # Define la función usando eval de forma segura (sólo x, y, np)
-        def f(x, y):
-            return eval(f_str, {"x": x, "y": y, "np": np, "__builtins__": {}})
-
-        h = (xf - x0) / n
-        xs = [x0]
-        ys = [y0]
-        fs = []
-        for i in range(n):
-            xn = xs[-1]
-            yn = ys[-1]
-            fn = f(xn, yn)
-            fs.append(fn)
-            yn1 = yn + h * fn
-            xn1 = xn + h
-            xs.append(xn1)
-            ys.append(yn1)
-        # Calcula f para el último punto
-        fs.append(f(xs[-1], ys[-1]))
-
-        # Calcular error si el usuario proporciona la solución exacta
-        y_real_func_str = request.args.get("y_real", None)
-        errores = []
-        y_real_vals = []
-        if y_real_func_str:
-            try:
-                def y_real(x):
-                    return eval(y_real_func_str, {"x": x, "np": np, "__builtins__": {}})
-                y_real_vals = [y_real(x) for x in xs]
-                errores = [abs(ys[i] - y_real_vals[i]) for i in range(len(xs))]
-            except Exception as e:
-                y_real_vals = []
-                errores = []
-        else:
-            y_real_vals = []
-            errores = []
-
-        tabla = [{"i": i, "x": xs[i], "y": ys[i], "f": fs[i], "error": errores[i] if errores else None, "y_real": y_real_vals[i] if y_real_vals else None} for i in range(n+1)]
-
-        return jsonify({
-            "tabla": tabla,
-            "h": h,
-            "x": xs,
-            "y": ys,
-            "f_vals": fs,
-            "n": n,
-            "f": f_str,
-            "x0": x0,
-            "y0": y0,
-            "xf": xf,
-            "errores": errores,
-            "y_real": y_real_vals
-        })
+        try:
+            p = leer_problema()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        h = (p["xf"] - p["x0"]) / p["n"]
+        xs, ys, fs = integradores.euler(p["f"], p["x0"], p["y0_arreglo"], p["xf"], p["n"], p["depende_de_y"])
+        return respuesta(p, "euler", xs, ys, fs, h, p["n"] + 1)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/rk2', methods=['GET'])
+def rk2():
+    try:
+        # Recibe lo mismo que /euler y la variante: heun (por defecto), punto_medio o ralston
+        try:
+            p = leer_problema()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        variante = request.args.get('variante', 'heun')
+        if variante not in integradores.VARIANTES_RK2:
+            return jsonify({"error": f"La 'variante' debe ser una de: {', '.join(integradores.VARIANTES_RK2)}."}), 400
+
+        h = (p["xf"] - p["x0"]) / p["n"]
+        xs, ys, fs, evaluaciones = integradores.runge_kutta(p["f"], p["x0"], p["y0_arreglo"], p["xf"], p["n"],
+                                                            integradores.tabla_rk2(variante), p["depende_de_y"])
+        return respuesta(p, "rk2", xs, ys, fs, h, evaluaciones, variante=variante)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/rk4', methods=['GET'])
+def rk4():
+    try:
+        # Recibe lo mismo que /euler
+        try:
+            p = leer_problema()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        h = (p["xf"] - p["x0"]) / p["n"]
+        xs, ys, fs, evaluaciones = integradores.runge_kutta(p["f"], p["x0"], p["y0_arreglo"], p["xf"], p["n"],
+                                                            integradores.RK4, p["depende_de_y"])
+        return respuesta(p, "rk4", xs, ys, fs, h, evaluaciones)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/rk45', methods=['GET'])
+def rk45():
+    try:
+        # Recibe f, x0, y0, xf y, en lugar de n, la tolerancia tol, el paso inicial h0
+        # (opcional) y el máximo de pasos max_pasos
+        try:
+            p = leer_problema()
+            tol = float(request.args.get('tol', 1e-6))
+            h0 = request.args.get('h0', type=float)
+            max_pasos = int(request.args.get('max_pasos', 100000))
+            if tol <= 0:
+                raise ValueError("La tolerancia 'tol' debe ser mayor que 0.")
+            if h0 is not None and h0 <= 0:
+                raise ValueError("El paso inicial 'h0' debe ser mayor que 0.")
+            if max_pasos < 1:
+                raise ValueError("El valor de 'max_pasos' debe ser mayor que 0.")
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        try:
+            r = integradores.dormand_prince(p["f"], p["x0"], p["y0_arreglo"], p["xf"], tol, h0, max_pasos)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        return respuesta(p, "rk45", r["xs"], r["ys"], r["fs"], r["hs"], r["evaluaciones"],
+                         tol=tol, rechazados=r["rechazados"])
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 if __name__ == "__main__":
-    app.run(host='0.0.0.0', port=5010, debug=True)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=5010, debug=True)
@@ -0,0 +1,128 @@
+import ast
+import numpy as np
+
+# Funciones y constantes que se pueden usar sin el prefijo np. (además de np.<nombre>)
+FUNCIONES = {
+    nombre: getattr(np, nombre)
+    for nombre in ("sin", "cos", "tan", "arcsin", "arccos", "arctan", "sinh", "cosh", "tanh",
+                   "exp", "log", "log10", "log2", "sqrt", "abs", "pi", "e")
+}
+
+OPERADORES = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+              ast.USub, ast.UAdd)
+
+def _validar(nodo, variables):
+    """
+    Recorre el árbol de la expresión y rechaza todo lo que no sea aritmética, números,
+    las variables permitidas, FUNCIONES o atributos públicos de np.
+    """
+    if isinstance(nodo, ast.Expression):
+        _validar(nodo.body, variables)
+    elif isinstance(nodo, ast.Constant):
+        if not isinstance(nodo.value, (int, float)) or isinstance(nodo.value, bool):
+            raise ValueError(f"Constante no permitida: {nodo.value!r}.")
+    elif isinstance(nodo, ast.Name):
+        if nodo.id not in variables and nodo.id not in FUNCIONES and nodo.id != "np":
+            raise ValueError(f"Nombre no permitido: '{nodo.id}'.")
+    elif isinstance(nodo, ast.Attribute):
+        if not (isinstance(nodo.value, ast.Name) and nodo.value.id == "np") or nodo.attr.startswith("_") \
+                or not hasattr(np, nodo.attr):
+            raise ValueError(f"Atributo no permitido: '{ast.unparse(nodo)}'.")
+    elif isinstance(nodo, ast.BinOp):
+        if not isinstance(nodo.op, OPERADORES):
+            raise ValueError("Operador no permitido.")
+        _validar(nodo.left, variables)
+        _validar(nodo.right, variables)
+    elif isinstance(nodo, ast.UnaryOp):
+        if not isinstance(nodo.op, OPERADORES):
+            raise ValueError("Operador no permitido.")
+        _validar(nodo.operand, variables)
+    elif isinstance(nodo, ast.Call):
+        if nodo.keywords:
+            raise ValueError("No se permiten argumentos con nombre.")
+        _validar(nodo.func, variables)
+        for argumento in nodo.args:
+            _validar(argumento, variables)
+    else:
+        raise ValueError(f"Expresión no permitida: {type(nodo).__name__}.")
+
+def analizar(fuente, variables=("x", "y")):
+    """Árbol validado de la expresión y el conjunto de variables que realmente usa."""
+    try:
+        arbol = ast.parse(fuente.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"La expresión '{fuente}' no es válida: {e.msg}.")
+    _validar(arbol, variables)
+    usadas = {nodo.id for nodo in ast.walk(arbol) if isinstance(nodo, ast.Name) and nodo.id in variables}
+    return arbol, usadas
+
+def _crear_lambda(argumentos, cuerpo):
+    """Compila un lambda con los argumentos y el cuerpo (nodo AST) dados."""
+    argumentos = ast.arguments(posonlyargs=[], args=[ast.arg(arg=a) for a in argumentos],
+                               kwonlyargs=[], kw_defaults=[], defaults=[])
+    lambda_ = ast.fix_missing_locations(ast.Expression(body=ast.Lambda(args=argumentos, body=cuerpo)))
+    return eval(compile(lambda_, "<funcion>", "eval"),
+                {"__builtins__": {}, "np": np, "_apilar": _apilar, **FUNCIONES})
+
+def compilar_funcion(fuente, variables=("x", "y")):
+    """
+    Compila la expresión una sola vez como lambda de Python sobre las variables dadas.
+    Funciona con escalares y con arreglos de NumPy. Devuelve (funcion, variables_usadas).
+    """
+    arbol, usadas = analizar(fuente, variables)
+    return _crear_lambda(variables, arbol.body), usadas
+
+def verificar_dimension(f, x0, y0):
+    """
+    Evalúa f una vez en (x0, y0) y comprueba que devuelva un valor por componente del
+    estado (un escalar si y0 lo es). Lanza ValueError si la forma no coincide.
+    """
+    y0 = np.asarray(y0, dtype=float)
+    try:
+        with np.errstate(all="ignore"):
+            valor = np.asarray(f(np.float64(x0), y0 if y0.ndim else np.float64(y0)))
+    except Exception as e:
+        raise ValueError(f"No se pudo evaluar f en x0 = {x0}: {e}.")
+    if valor.shape != y0.shape:
+        esperado = "un escalar" if not y0.ndim else f"{y0.shape[0]} componentes"
+        raise ValueError(f"f debe devolver {esperado}, pero devuelve un arreglo de forma {valor.shape}.")
+
+class _Indexar(ast.NodeTransformer):
+    """Reescribe cada componente yK como y[K] para evaluar sobre el vector de estado."""
+    def __init__(self, vector, componentes):
+        self.vector = vector
+        self.indices = {f"{vector}{k}": k for k in range(componentes)}
+
+    def visit_Name(self, nodo):
+        if nodo.id not in self.indices:
+            return nodo
+        return ast.copy_location(ast.Subscript(value=ast.Name(id=self.vector, ctx=ast.Load()),
+                                               slice=ast.Constant(value=self.indices[nodo.id]),
+                                               ctx=ast.Load()), nodo)
+
+def _apilar(*componentes):
+    """
+    Une los componentes en un vector. Con escalares da un arreglo (m,); si algún componente
+    es un arreglo de N puntos, da (N, m) repitiendo los componentes constantes.
+    """
+    if not any(np.ndim(c) for c in componentes):
+        return np.array(componentes, dtype=float)
+    return np.stack(np.broadcast_arrays(*componentes), axis=-1).astype(float)
+
+def compilar_sistema(fuentes, escalares=("x",), vector="y"):
+    """
+    Compila un sistema de expresiones como un único lambda (escalares..., vector) que
+    devuelve todos los componentes en un arreglo, con una sola llamada por evaluación.
+    Las componentes del vector se escriben y0, y1, ... (hasta len(fuentes) - 1).
+    Con vector=None el lambda solo recibe los escalares. Devuelve (funcion, variables_usadas).
+    """
+    componentes = len(fuentes)
+    nombres_vector = tuple(f"{vector}{k}" for k in range(componentes)) if vector else ()
+    cuerpos, usadas = [], set()
+    for fuente in fuentes:
+        arbol, usadas_fuente = analizar(fuente, tuple(escalares) + nombres_vector)
+        cuerpos.append(_Indexar(vector, componentes).visit(arbol).body if vector else arbol.body)
+        usadas |= usadas_fuente
+    cuerpo = ast.Call(func=ast.Name(id="_apilar", ctx=ast.Load()), args=cuerpos, keywords=[])
+    argumentos = tuple(escalares) + ((vector,) if vector else ())
+    return _crear_lambda(argumentos, cuerpo), usadas
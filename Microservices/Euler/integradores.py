@@ -0,0 +1,161 @@
+import numpy as np
+
+# Tablas de Butcher (c, A, pesos) de los métodos de Runge-Kutta de paso fijo
+VARIANTES_RK2 = {'heun': 1.0, 'punto_medio': 0.5, 'ralston': 2 / 3}
+
+RK4 = (
+    (0.0, 0.5, 0.5, 1.0),
+    ((), (0.5,), (0.0, 0.5), (0.0, 0.0, 1.0)),
+    (1 / 6, 1 / 3, 1 / 3, 1 / 6),
+)
+
+# Dormand-Prince 5(4): c, A, pesos de orden 5 y diferencia entre los pesos de orden 5 y 4
+DP_C = (0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0, 1.0)
+DP_A = (
+    (),
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+    (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+)
+DP_B = (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0.0)
+DP_E = (71 / 57600, 0.0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40)
+
+def tabla_rk2(variante='heun'):
+    """Tabla de Butcher del método de dos etapas con nodo c2 = a."""
+    a = VARIANTES_RK2[variante]
+    return (0.0, a), ((), (a,)), (1 - 1 / (2 * a), 1 / (2 * a))
+
+def euler(f, x0, y0, xf, n, depende_de_y=True):
+    """
+    Método de Euler con paso fijo h = (xf - x0) / n sobre arreglos preasignados.
+    y0 puede ser un escalar o un vector (sistema de EDOs); entonces ys y fs tienen una
+    fila por punto. Si f no depende de y, f se evalúa una sola vez sobre todos los x y
+    la solución es una suma acumulada. Devuelve (xs, ys, fs), con fs evaluada también
+    en el último punto.
+    """
+    h = (xf - x0) / n
+    xs = x0 + h * np.arange(n + 1)
+    forma = (n + 1,) + np.shape(y0)
+
+    if not depende_de_y:
+        fs = np.broadcast_to(np.asarray(f(xs, 0.0), dtype=float), forma).copy()
+        incrementos = np.empty(forma)
+        incrementos[0] = y0
+        np.multiply(h, fs[:-1], out=incrementos[1:])
+        return xs, np.cumsum(incrementos, axis=0), fs
+
+    ys = np.empty(forma)
+    fs = np.empty(forma)
+    y = y0
+    for i, x in enumerate(xs.tolist()):
+        ys[i] = y
+        fs[i] = fn = f(x, y)
+        y = y + h * fn
+    return xs, ys, fs
+
+def runge_kutta(f, x0, y0, xf, n, tabla, depende_de_y=True):
+    """
+    Runge-Kutta explícito de paso fijo con la tabla de Butcher (c, A, pesos), con y0
+    escalar o vectorial. Si f no depende de y, cada etapa se evalúa de una vez sobre
+    todos los pasos. Devuelve (xs, ys, fs, evaluaciones), con fs = f(x_i, y_i) en cada punto.
+    """
+    c, A, pesos = tabla
+    etapas = len(c)
+    h = (xf - x0) / n
+    xs = x0 + h * np.arange(n + 1)
+    forma = (n + 1,) + np.shape(y0)
+
+    if not depende_de_y:
+        fs = np.broadcast_to(np.asarray(f(xs, 0.0), dtype=float), forma).copy()
+        incrementos = np.empty(forma)
+        incrementos[0] = y0
+        incrementos[1:] = 0.0
+        evaluaciones = n + 1
+        etapas_por_nodo = {0.0: fs[:-1], 1.0: fs[1:]}
+        for ci, peso in zip(c, pesos):
+            if peso == 0:
+                continue
+            if ci not in etapas_por_nodo:
+                etapas_por_nodo[ci] = np.broadcast_to(np.asarray(f(xs[:-1] + ci * h, 0.0), dtype=float),
+                                                      (n,) + forma[1:])
+                evaluaciones += n
+            incrementos[1:] += (h * peso) * etapas_por_nodo[ci]
+        return xs, np.cumsum(incrementos, axis=0), fs, evaluaciones
+
+    ys = np.empty(forma)
+    fs = np.empty(forma)
+    y = y0
+    k = [None] * etapas
+    for i, x in enumerate(xs.tolist()):
+        ys[i] = y
+        fs[i] = k[0] = f(x, y)
+        if i == n:
+            break
+        for s in range(1, etapas):
+            k[s] = f(x + c[s] * h, y + h * sum(a * k[j] for j, a in enumerate(A[s]) if a))
+        y = y + h * sum(p * k[s] for s, p in enumerate(pesos) if p)
+    return xs, ys, fs, etapas * n + 1
+
+def _norma_error(error, y, y_nuevo, tol):
+    """Norma RMS del error local escalado con la tolerancia relativa y absoluta tol."""
+    escala = tol + tol * np.maximum(np.abs(y), np.abs(y_nuevo))
+    return float(np.sqrt(np.mean(np.square(np.asarray(error) / escala))))
+
+def dormand_prince(f, x0, y0, xf, tol=1e-6, h0=None, max_pasos=100000):
+    """
+    Runge-Kutta embebido de Dormand-Prince 5(4) con control adaptativo del paso, con y0
+    escalar o vectorial (la norma del error es la RMS de las componentes).
+    Cada paso aceptado cuesta 6 evaluaciones (la última etapa se reutiliza como la
+    primera del siguiente paso). Devuelve un diccionario con xs, ys, fs, los tamaños
+    de paso aceptados y los contadores de pasos, rechazos y evaluaciones.
+    """
+    direccion = 1.0 if xf >= x0 else -1.0
+    longitud = abs(xf - x0)
+    x, y = x0, y0
+    k1 = f(x, y)
+    evaluaciones = 1
+
+    if h0 is None:
+        d0 = float(np.sqrt(np.mean(np.square(y0)))) / tol
+        d1 = float(np.sqrt(np.mean(np.square(k1)))) / tol
+        h0 = 0.01 * d0 / d1 if d0 > 1e-5 and d1 > 1e-5 else 1e-6
+        h0 = min(h0, longitud)
+    h = direccion * min(abs(h0), longitud)
+
+    xs, ys, fs, hs = [x], [y], [k1], []
+    rechazados = 0
+    k = [None] * 7
+    while direccion * (xf - x) > 0:
+        if len(hs) >= max_pasos:
+            raise ValueError(f"Se alcanzó el máximo de {max_pasos} pasos antes de llegar a xf.")
+        if direccion * (x + h - xf) > 0:
+            h = xf - x
+        if abs(h) <= 1e-14 * max(1.0, abs(x)):
+            raise ValueError(f"El paso se volvió demasiado pequeño cerca de x = {x}.")
+
+        k[0] = k1
+        for s in range(1, 7):
+            k[s] = f(x + DP_C[s] * h, y + h * sum(a * k[j] for j, a in enumerate(DP_A[s]) if a))
+        evaluaciones += 6
+        y_nuevo = y + h * sum(b * k[s] for s, b in enumerate(DP_B) if b)
+        error = h * sum(e * k[s] for s, e in enumerate(DP_E) if e)
+        norma = _norma_error(error, y, y_nuevo, tol)
+
+        if norma <= 1.0:
+            x = xf if direccion * (x + h - xf) >= 0 else x + h
+            y, k1 = y_nuevo, k[6]
+            xs.append(x)
+            ys.append(y)
+            fs.append(k1)
+            hs.append(abs(h))
+            factor = 5.0 if norma == 0 else min(5.0, 0.9 * norma ** -0.2)
+        else:
+            rechazados += 1
+            factor = max(0.2, 0.9 * norma ** -0.2) if np.isfinite(norma) else 0.2
+        h *= factor
+
+    return {"xs": np.asarray(xs), "ys": np.asarray(ys), "fs": np.asarray(fs), "hs": hs,
+            "pasos": len(hs), "rechazados": rechazados, "evaluaciones": evaluaciones}
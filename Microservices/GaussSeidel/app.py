@@ -1,10 +1,15 @@
 from flask import Flask, request, jsonify
 import numpy as np
-import json
-from sympy import symbols, Eq, parse_expr, linear_eq_to_matrix
+from sympy import Eq, parse_expr
 from sympy.parsing.sympy_parser import standard_transformations, implicit_multiplication_application
 from flask_cors import CORS
-from collections import defaultdict
+from nucleo_gauss_seidel import gauss_seidel, resolver_omega, colores_barrido, orden_barrido, METODOS
+from convergencia import estimar_radio_gauss_seidel, MonitorDivergencia, analisis_convergencia
+from sistemas import (ecuaciones_a_matriz, matriz_desde_json, matriz_desde_binario, variables_numericas,
+                      leer_vector, reordenar_sistema, verificar_dominancia_diagonal)
+
+# Por encima de este número de incógnitas la tabla no incluye x en cada iteración salvo que se pida
+LIMITE_VALORES = 100
 
 app = Flask(__name__)
 CORS(app)
@@ -12,151 +17,161 @@ CORS(app)
 # Transformaciones para el parser de ecuaciones
 transformations = (standard_transformations + (implicit_multiplication_application,))
 
-def reordenar_ecuaciones(sym_ecuaciones, variables):
-    """
-    Reordena las ecuaciones para evitar ceros en la diagonal y mejorar la dominancia diagonal.
-    Devuelve las ecuaciones reordenadas y las variables en el nuevo orden.
-    """
-    # Convertir a matriz para análisis
-    sym_vars = symbols(variables)
-    A_sym, _ = linear_eq_to_matrix([eq.lhs - eq.rhs for eq in sym_ecuaciones], sym_vars)
-    A = np.array(A_sym, dtype=float)
-    
-    n = len(variables)
-    nuevo_orden = []
-    ecuaciones_disponibles = list(range(n))
-    variables_disponibles = list(range(n))
-    
-    # Primera pasada: asegurar elementos no cero en la diagonal
-    for i in range(n):
-        mejor_ecuacion = None
-        mejor_puntaje = -1
-        
-        for eq_idx in ecuaciones_disponibles:
-            for var_idx in variables_disponibles:
-                if A[eq_idx, var_idx] != 0:
-                    # Puntaje basado en dominancia diagonal
-                    puntaje = abs(A[eq_idx, var_idx]) - sum(abs(A[eq_idx, j]) for j in range(n) if j != var_idx)
-                    
-                    if puntaje > mejor_puntaje:
-                        mejor_puntaje = puntaje
-                        mejor_ecuacion = eq_idx
-                        mejor_variable = var_idx
-        
-        if mejor_ecuacion is None:
-            raise ValueError("No se puede reordenar el sistema para evitar ceros en la diagonal")
-            
-        nuevo_orden.append((mejor_ecuacion, mejor_variable))
-        ecuaciones_disponibles.remove(mejor_ecuacion)
-        variables_disponibles.remove(mejor_variable)
-    
-    # Reordenar ecuaciones y variables según el nuevo orden
-    ecuaciones_ordenadas = [sym_ecuaciones[eq_idx] for eq_idx, _ in nuevo_orden]
-    variables_ordenadas = [variables[var_idx] for _, var_idx in nuevo_orden]
-    
-    return ecuaciones_ordenadas, variables_ordenadas
+def _booleano(valor):
+    return str(valor).lower() == 'true'
 
 @app.route('/gauss-seidel', methods=['GET', 'POST'])
 def metodo_gauss_seidel():
     try:
         # Obtener parámetros según el método HTTP usado
-        if request.method == 'POST':
+        A = b = None
+        if request.method == 'POST' and request.is_json:
             data = request.get_json()
             ecuaciones = data.get('ecuaciones', [])
             x0_str = data.get('x0')
             tol_error = data.get('tol_error')
             max_iter = data.get('max_iter', 100)
+            metodo = data.get('metodo', 'gauss_seidel')
+            omega = data.get('omega')
+            incluir_valores = data.get('incluir_valores')
+
+            # El sistema también puede llegar directamente como matriz numérica
+            if 'A' in data:
+                try:
+                    A, b = matriz_desde_json(data)
+                except Exception as e:
+                    return jsonify({"error": f"Error en la matriz: {str(e)}"}), 400
+        elif request.method == 'POST':
+            # Carga binaria (.npy o float64 crudos); los parámetros van en la URL o en el formulario
+            try:
+                A, b = matriz_desde_binario(request)
+            except Exception as e:
+                return jsonify({"error": f"Error en la matriz: {str(e)}"}), 400
+            ecuaciones = []
+            x0_str = request.values.get('x0')
+            tol_error = request.values.get('tol_error', type=float)
+            max_iter = request.values.get('max_iter', type=int, default=100)
+            metodo = request.values.get('metodo', 'gauss_seidel')
+            omega = request.values.get('omega')
+            incluir_valores = request.values.get('incluir_valores')
         else:
             ecuaciones = request.args.getlist('ecuaciones[]')
             x0_str = request.args.get('x0')
             tol_error = request.args.get('tol_error', type=float)
             max_iter = request.args.get('max_iter', type=int, default=100)
+            metodo = request.args.get('metodo', 'gauss_seidel')
+            omega = request.args.get('omega')
+            incluir_valores = request.args.get('incluir_valores')
+
+        # Validar el método y el factor de relajación ('auto' = estimado a partir del radio espectral)
+        if metodo not in METODOS:
+            return jsonify({"error": f"El 'metodo' debe ser uno de: {', '.join(METODOS)}."}), 400
+        try:
+            if omega == '':
+                omega = None
+            elif omega not in (None, 'auto'):
+                omega = float(omega)
+        except ValueError:
+            return jsonify({"error": "El valor de 'omega' debe ser un número entre 0 y 2 o 'auto'."}), 400
+        if isinstance(omega, float) and not 0 < omega < 2:
+            return jsonify({"error": "El valor de 'omega' debe cumplir 0 < omega < 2."}), 400
 
         # Validar parámetros mínimos
-        if not ecuaciones or not x0_str or tol_error is None:
-            return jsonify({"error": "Debes proporcionar 'ecuaciones', 'x0' y 'tol_error'."}), 400
+        if (A is None and not ecuaciones) or x0_str is None or tol_error is None:
+            return jsonify({"error": "Debes proporcionar 'ecuaciones' (o 'A' y 'b'), 'x0' y 'tol_error'."}), 400
+
+        if A is None:
+            # Procesar ecuaciones
+            try:
+                sym_ecuaciones = []
+                for eq in ecuaciones:
+                    if "=" not in eq:
+                        return jsonify({"error": f"La ecuación '{eq}' no contiene '='."}), 400
+                    lado_izq, lado_der = eq.split("=")
+                    expr_izq = parse_expr(lado_izq.replace(" ", ""), transformations=transformations)
+                    expr_der = parse_expr(lado_der.replace(" ", ""), transformations=transformations)
+                    sym_ecuaciones.append(Eq(expr_izq, expr_der))
 
-        # Procesar ecuaciones
+                # Extraer variables iniciales
+                variables = sorted(set().union(*[eq.free_symbols for eq in sym_ecuaciones]), key=lambda v: str(v))
+                variables = [str(var) for var in variables]
+            except Exception as e:
+                return jsonify({"error": f"Error al procesar ecuaciones: {str(e)}"}), 400
+
+            # Convertir a forma matricial
+            try:
+                A, b = ecuaciones_a_matriz(sym_ecuaciones, variables)
+            except Exception as e:
+                return jsonify({"error": f"Error al convertir a matriz: {str(e)}"}), 400
+        else:
+            variables = variables_numericas(len(b))
+
+        # Reordenar ecuaciones y variables para evitar ceros en la diagonal
         try:
-            sym_ecuaciones = []
-            for eq in ecuaciones:
-                if "=" not in eq:
-                    return jsonify({"error": f"La ecuación '{eq}' no contiene '='."}), 400
-                lado_izq, lado_der = eq.split("=")
-                expr_izq = parse_expr(lado_izq.replace(" ", ""), transformations=transformations)
-                expr_der = parse_expr(lado_der.replace(" ", ""), transformations=transformations)
-                sym_ecuaciones.append(Eq(expr_izq, expr_der))
-            
-            # Extraer variables iniciales
-            variables = sorted(set().union(*[eq.free_symbols for eq in sym_ecuaciones]), key=lambda v: str(v))
-            variables = [str(var) for var in variables]
-            
-            # Reordenar ecuaciones para evitar ceros en la diagonal
-            sym_ecuaciones, variables = reordenar_ecuaciones(sym_ecuaciones, variables)
+            A, b, variables = reordenar_sistema(A, b, variables)
         except Exception as e:
             return jsonify({"error": f"Error al procesar ecuaciones: {str(e)}"}), 400
 
         # Convertir y validar vector inicial
         try:
-            x0 = np.array(json.loads(x0_str), dtype=float)
+            x0 = leer_vector(x0_str)
             if len(x0) != len(variables):
                 return jsonify({"error": "El tamaño del vector inicial no coincide con el número de variables."}), 400
         except Exception as e:
             return jsonify({"error": f"Error en el vector inicial: {str(e)}"}), 400
 
-        # Convertir a forma matricial
-        try:
-            sym_vars = symbols(variables)
-            A_sym, b_sym = linear_eq_to_matrix([eq.lhs - eq.rhs for eq in sym_ecuaciones], sym_vars)
-            A = np.array(A_sym, dtype=float)
-            b = np.array(b_sym, dtype=float).flatten()
-        except Exception as e:
-            return jsonify({"error": f"Error al convertir a matriz: {str(e)}"}), 400
-
         # Verificar dominancia diagonal
-        es_diagonal_dominante = all(2 * abs(A[i, i]) >= np.sum(np.abs(A[i, :])) for i in range(A.shape[0]))
-        if not es_diagonal_dominante:
-            print("Advertencia: La matriz no es estrictamente diagonal dominante, la convergencia no está garantizada")
-
-        # Algoritmo de Gauss-Seidel
-        n = len(b)
-        x = x0.copy()
-        tabla = []
-
-        for iteracion in range(max_iter):
-            x_nuevo = x.copy()
-            for i in range(n):
-                suma = np.dot(A[i, :i], x_nuevo[:i]) + np.dot(A[i, i+1:], x[i+1:])
-                if A[i, i] == 0:
-                    return jsonify({
-                        "error": f"División por cero en la diagonal (A[{i}, {i}] = 0).",
-                        "sugerencia": "Intente reordenar las ecuaciones manualmente o use otro método numérico."
-                    }), 400
-                
-                x_nuevo[i] = (b[i] - suma) / A[i, i]
-
-            error = np.linalg.norm(x_nuevo - x, ord=np.inf)
-            tabla.append({
-                "iteracion": iteracion + 1,
-                "x": [round(val, 6) for val in x_nuevo],
-                "error": round(float(error), 6)
-            })
-            
-            if error < tol_error:
-                return jsonify({
-                    "tabla": tabla,
-                    "mensaje": "Convergencia alcanzada",
-                    "variables": variables,
-                    "diagonal_dominante": es_diagonal_dominante
-                })
-            
-            x = x_nuevo.copy()
+        es_diagonal_dominante = verificar_dominancia_diagonal(A)
+        advertencia = None if es_diagonal_dominante else "Advertencia: La matriz no es estrictamente diagonal dominante, la convergencia no está garantizada"
+
+        # Evitar división por cero en la diagonal
+        ceros_diagonal = np.flatnonzero(A.diagonal() == 0)
+        if len(ceros_diagonal) > 0:
+            i = int(ceros_diagonal[0])
+            return jsonify({
+                "error": f"División por cero en la diagonal (A[{i}, {i}] = 0).",
+                "sugerencia": "Intente reordenar las ecuaciones manualmente o use otro método numérico."
+            }), 400
+
+        # Análisis previo: radio espectral de la matriz de iteración con el omega y el orden del
+        # barrido, solo si la dominancia diagonal estricta (con omega <= 1) no garantiza la convergencia
+        # (omega y los colores se calculan una sola vez y se pasan al motor)
+        omega = resolver_omega(A, metodo, omega)
+        colores = colores_barrido(A, metodo)
+        garantizada = verificar_dominancia_diagonal(A, estricta=True) and omega <= 1
+        rho = None if garantizada else estimar_radio_gauss_seidel(A, omega, orden_barrido(colores))
+        monitor = MonitorDivergencia(rho)
+
+        # x en cada fila de la tabla: por defecto solo en sistemas pequeños
+        if incluir_valores is None:
+            incluir_valores = len(variables) <= LIMITE_VALORES
+        else:
+            incluir_valores = _booleano(incluir_valores)
+
+        # Algoritmo de Gauss-Seidel (barrido por filas, SOR o rojo-negro), detenido si diverge
+        resultado = gauss_seidel(A, b, x0, tol_error, max_iter, metodo, omega, monitor, colores, incluir_valores)
+        analisis = analisis_convergencia(rho, monitor, tol_error)
+
+        if resultado["convergio"]:
+            mensaje = "Convergencia alcanzada"
+        elif analisis["detenido_por_divergencia"]:
+            causa = "" if rho is None else f" (radio espectral ≈ {rho:.4g} >= 1)"
+            mensaje = f"El método diverge{causa}; se detuvo en la iteración {analisis['iteracion_detenida']}"
+        else:
+            mensaje = "No se alcanzó la convergencia en el número máximo de iteraciones"
 
         return jsonify({
-            "tabla": tabla,
-            "mensaje": "No se alcanzó la convergencia en el número máximo de iteraciones",
+            "tabla": resultado["historial"],
+            "mensaje": mensaje,
+            "solucion": dict(zip(variables, resultado["x"].tolist())) if resultado["convergio"] else None,
+            "iteraciones": resultado["iteraciones"],
             "variables": variables,
-            "diagonal_dominante": es_diagonal_dominante
+            "advertencia": advertencia,
+            "diagonal_dominante": es_diagonal_dominante,
+            "metodo": metodo,
+            "omega": resultado["omega"],
+            "incluir_valores": incluir_valores,
+            "analisis_convergencia": analisis
         })
 
     except Exception as e:
@@ -0,0 +1,136 @@
+import math
+import numpy as np
+from scipy import sparse
+from convergencia import estimar_radio_jacobi
+
+METODOS = ('gauss_seidel', 'sor', 'rojo_negro')
+
+def omega_optimo(A):
+    """
+    Factor de relajación óptimo de SOR, omega = 2 / (1 + sqrt(1 - rho_J^2)), a partir del
+    radio espectral estimado de Jacobi. Si Jacobi no converge (rho_J >= 1) se usa omega = 1.
+    """
+    rho = estimar_radio_jacobi(A)
+    if rho >= 1:
+        return 1.0
+    return 2 / (1 + math.sqrt(1 - rho * rho))
+
+def colorear(A):
+    """
+    Agrupa las filas en colores tales que dos filas del mismo color no están acopladas
+    (coloreado voraz del grafo de A + A^T). En una malla de 5 puntos da el orden rojo-negro.
+    Devuelve una lista de arreglos de índices, uno por color.
+    """
+    patron = sparse.csr_matrix(A, dtype=bool)
+    patron = (patron + patron.T).tocsr()
+    n = A.shape[0]
+    color = np.full(n, -1)
+    indptr, indices = patron.indptr, patron.indices
+    for i in range(n):
+        usados = set(color[indices[indptr[i]:indptr[i + 1]]].tolist())
+        c = 0
+        while c in usados:
+            c += 1
+        color[i] = c
+    return [np.flatnonzero(color == c) for c in range(color.max() + 1)]
+
+def _barrido_filas(A, b, d, x, omega):
+    """
+    Un barrido de Gauss-Seidel/SOR fila por fila, actualizando x en el mismo arreglo
+    (sin copias). Devuelve el mayor cambio absoluto del barrido.
+    """
+    error = 0.0
+    if sparse.issparse(A):
+        indptr, indices, datos = A.indptr, A.indices, A.data
+        for i in range(len(b)):
+            inicio, fin = indptr[i], indptr[i + 1]
+            cambio = omega * (b[i] - datos[inicio:fin] @ x[indices[inicio:fin]]) / d[i]
+            x[i] += cambio
+            error = max(error, abs(cambio))
+    else:
+        for i in range(len(b)):
+            cambio = omega * (b[i] - A[i] @ x) / d[i]
+            x[i] += cambio
+            error = max(error, abs(cambio))
+    return error
+
+def _barrido_colores(bloques, x, omega):
+    """
+    Un barrido por colores: todas las filas de un color se actualizan a la vez
+    con un producto matriz-vector, porque no dependen entre sí.
+    """
+    error = 0.0
+    for filas, A_bloque, b_bloque, d_bloque in bloques:
+        cambio = omega * (b_bloque - A_bloque @ x) / d_bloque
+        x[filas] += cambio
+        error = max(error, float(np.max(np.abs(cambio))))
+    return error
+
+def resolver_omega(A, metodo, omega):
+    """
+    Factor de relajación efectivo de cada variante: 1 en 'gauss_seidel'; en 'sor' el dado
+    o el óptimo estimado; en 'rojo_negro' 1 por defecto o el óptimo con omega='auto'.
+    """
+    if metodo == 'gauss_seidel':
+        return 1.0
+    if omega == 'auto' or (omega is None and metodo == 'sor'):
+        return omega_optimo(A)
+    return 1.0 if omega is None else omega
+
+def colores_barrido(A, metodo):
+    """Colores del barrido en 'rojo_negro' (ver colorear); None en los métodos con orden natural."""
+    return colorear(A) if metodo == 'rojo_negro' else None
+
+def orden_barrido(colores):
+    """Orden en que el barrido recorre las filas: el de los colores, o None (natural) sin colores."""
+    return None if colores is None else np.concatenate(colores)
+
+def gauss_seidel(A, b, x0, tol_error, max_iter, metodo='gauss_seidel', omega=None, monitor=None,
+                 colores=None, guardar_valores=True):
+    """
+    Motor de Gauss-Seidel con tres variantes:
+    - 'gauss_seidel': barrido fila por fila (omega = 1)
+    - 'sor': sobre-relajación sucesiva con omega dado o estimado automáticamente
+    - 'rojo_negro': orden por colores (rojo-negro en mallas), vectorizado por bloques;
+      por defecto omega = 1, con omega='auto' se relaja con el omega óptimo estimado
+    A puede ser densa o dispersa (CSR). Un omega numérico y los colores ya calculados
+    (colores_barrido) se usan tal cual; si faltan se calculan aquí. Con un monitor
+    (convergencia.MonitorDivergencia) la iteración se detiene en cuanto la divergencia es
+    evidente. Devuelve la solución, el error y el historial (con x en cada iteración solo
+    si guardar_valores).
+    """
+    if metodo not in METODOS:
+        raise ValueError(f"Método desconocido '{metodo}'. Opciones: {', '.join(METODOS)}.")
+    if omega is None or omega == 'auto':
+        omega = resolver_omega(A, metodo, omega)
+
+    d = np.asarray(A.diagonal(), dtype=float)
+    x = np.array(x0, dtype=float)
+
+    if metodo == 'rojo_negro':
+        A_csr = sparse.csr_matrix(A)
+        if colores is None:
+            colores = colorear(A_csr)
+        bloques = [(filas, A_csr[filas], b[filas], d[filas]) for filas in colores]
+        barrer = lambda: _barrido_colores(bloques, x, omega)
+    else:
+        barrer = lambda: _barrido_filas(A, b, d, x, omega)
+
+    historial = []
+    error = float("inf")
+    for iteracion in range(1, max_iter + 1):
+        error = barrer()
+        fila = {"iteracion": iteracion, "error": round(float(error), 6)}
+        if guardar_valores:
+            fila["x"] = x.round(6).tolist()
+        historial.append(fila)
+        detener = monitor is not None and monitor.actualizar(float(error))
+        if error < tol_error:
+            return {"x": x, "convergio": True, "iteraciones": iteracion, "error": float(error),
+                    "omega": omega, "historial": historial}
+        if detener:
+            return {"x": x, "convergio": False, "iteraciones": iteracion, "error": float(error),
+                    "omega": omega, "historial": historial}
+
+    return {"x": x, "convergio": False, "iteraciones": max_iter, "error": float(error),
+            "omega": omega, "historial": historial}
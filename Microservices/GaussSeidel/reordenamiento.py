@@ -0,0 +1,57 @@
+import numpy as np
+from scipy import sparse
+from scipy.optimize import linear_sum_assignment
+from scipy.sparse.csgraph import min_weight_full_bipartite_matching
+
+MENSAJE_SIN_DIAGONAL = "No se puede reordenar el sistema para evitar ceros en la diagonal"
+
+def _orden_por_puntaje(filas, columnas, puntajes):
+    """Lista de pares (ecuacion, variable), de mayor a menor puntaje, como el orden voraz original."""
+    orden = np.argsort(-puntajes, kind='stable')
+    return [(int(filas[k]), int(columnas[k])) for k in orden]
+
+def _asignacion_densa(A):
+    """Asignación de máximo puntaje con el método húngaro sobre la matriz completa."""
+    abs_A = np.abs(A)
+    suma_filas = abs_A.sum(axis=1)
+    # Puntaje de poner la variable j en la diagonal de la ecuación i: |a_ij| - sum_{k != j} |a_ik|
+    puntajes = 2 * abs_A - suma_filas[:, None]
+    costo = np.where(A != 0, -puntajes, np.inf)
+    try:
+        filas, columnas = linear_sum_assignment(costo)
+    except ValueError:
+        raise ValueError(MENSAJE_SIN_DIAGONAL)
+    return _orden_por_puntaje(filas, columnas, puntajes[filas, columnas])
+
+def _asignacion_dispersa(A):
+    """Asignación de máximo puntaje usando solo los coeficientes no nulos (emparejamiento bipartito)."""
+    A = sparse.csr_matrix(A, dtype=float)
+    A.eliminate_zeros()
+    abs_A = abs(A)
+    suma_filas = np.asarray(abs_A.sum(axis=1)).ravel()
+    filas_nnz = np.repeat(np.arange(A.shape[0]), np.diff(A.indptr))
+    puntajes = 2 * abs_A.data - suma_filas[filas_nnz]
+
+    # El emparejamiento minimiza costos positivos: se desplazan los puntajes (todas las
+    # asignaciones completas usan n aristas, así que el desplazamiento no cambia el óptimo)
+    costo = sparse.csr_matrix((puntajes.max() + 1 - puntajes, A.indices, A.indptr), shape=A.shape)
+    try:
+        filas, columnas = min_weight_full_bipartite_matching(costo)
+    except ValueError:
+        raise ValueError(MENSAJE_SIN_DIAGONAL)
+
+    # Puntaje de la arista elegida en cada fila (hay exactamente una por fila)
+    columna_de_fila = np.empty(A.shape[0], dtype=int)
+    columna_de_fila[filas] = columnas
+    elegidas = A.indices == columna_de_fila[filas_nnz]
+    return _orden_por_puntaje(np.arange(A.shape[0]), columna_de_fila, puntajes[elegidas])
+
+def orden_pivoteo(A):
+    """
+    Elige qué ecuación y qué variable van en cada posición de la diagonal, evitando ceros y
+    maximizando la dominancia diagonal total, como un problema de asignación de máximo peso.
+    Los puntajes se calculan vectorizados una sola vez. Devuelve [(ecuacion, variable), ...].
+    """
+    if sparse.issparse(A):
+        return _asignacion_dispersa(A)
+    return _asignacion_densa(A)
@@ -0,0 +1,157 @@
+import math
+import time
+import numpy as np
+from scipy import sparse
+from scipy.linalg import solve_triangular
+from scipy.sparse.linalg import LinearOperator, eigs, splu, ArpackNoConvergence
+
+# Hasta este tamaño la matriz de iteración se forma y se calculan sus autovalores directamente
+LIMITE_DENSO = 200
+
+# Iteraciones seguidas sin que el error disminuya para dar por evidente la divergencia
+VENTANA_DIVERGENCIA = 5
+
+# Radios estimados a menos de este margen de 1 se tratan como 1: la estimación arrastra
+# errores de redondeo y, aunque fuera algo menor, la convergencia sería inútilmente lenta
+MARGEN_RADIO = 1e-6
+
+# Límites de la estimación en sistemas grandes: reinicios y tamaño del subespacio de ARPACK,
+# y tiempo máximo (en segundos) del método de la potencia si ARPACK no converge
+MAX_REINICIOS_ARPACK = 30
+DIMENSION_SUBESPACIO = 20
+PRESUPUESTO_POTENCIA = 0.5
+
+def _radio_potencia(operador, n, iteraciones=200, presupuesto=PRESUPUESTO_POTENCIA):
+    """
+    Método de la potencia: crecimiento medio de ||T^k v|| en la segunda mitad de las
+    iteraciones, estable aunque haya autovalores ±rho de igual módulo. Se corta al agotar
+    el presupuesto de tiempo (con al menos 10 iteraciones).
+    """
+    v = np.random.default_rng(0).standard_normal(n)
+    v /= np.linalg.norm(v)
+    logs = []
+    inicio = time.monotonic()
+    for k in range(iteraciones):
+        v = operador(v)
+        norma = np.linalg.norm(v)
+        if norma == 0:
+            return 0.0
+        logs.append(math.log(norma))
+        v /= norma
+        if k >= 10 and time.monotonic() - inicio > presupuesto:
+            break
+    segunda_mitad = logs[len(logs) // 2:]
+    return math.exp(sum(segunda_mitad) / len(segunda_mitad))
+
+def _radio_operador(operador, n):
+    """
+    Radio espectral de un operador lineal con ARPACK, con reinicios y subespacio acotados para
+    que el costo no crezca con n; si no converge, el método de la potencia con tiempo limitado.
+    """
+    try:
+        valores = eigs(LinearOperator((n, n), matvec=operador, dtype=float), k=1, which='LM', tol=1e-4,
+                       ncv=min(DIMENSION_SUBESPACIO, n - 1), maxiter=MAX_REINICIOS_ARPACK,
+                       return_eigenvectors=False)
+        return float(np.abs(valores).max())
+    except ArpackNoConvergence:
+        return _radio_potencia(operador, n)
+
+def _densa(A):
+    return A.toarray() if sparse.issparse(A) else np.asarray(A, dtype=float)
+
+def estimar_radio_jacobi(A):
+    """
+    Estima el radio espectral de la matriz de iteración de Jacobi T = I - D^-1 A sin formarla
+    (salvo en sistemas pequeños, donde se calculan sus autovalores directamente).
+    Para sistemas grandes se usa ARPACK y, si no converge, el método de la potencia.
+    """
+    n = A.shape[0]
+    d = np.asarray(A.diagonal(), dtype=float)
+    if n <= LIMITE_DENSO:
+        return float(np.max(np.abs(np.linalg.eigvals(np.eye(n) - _densa(A) / d[:, None]))))
+    return _radio_operador(lambda v: v - (A @ v) / d, n)
+
+def estimar_radio_gauss_seidel(A, omega=1.0, orden=None):
+    """
+    Estima el radio espectral de la matriz de iteración de Gauss-Seidel/SOR,
+    T = I - M^-1 A con M = D / omega + L, en el orden de filas dado (por ejemplo el de
+    los colores en rojo-negro). Cada aplicación de T es una sustitución hacia adelante.
+    """
+    if orden is not None:
+        A = A[orden][:, orden] if sparse.issparse(A) else np.asarray(A)[np.ix_(orden, orden)]
+    n = A.shape[0]
+    d = np.asarray(A.diagonal(), dtype=float)
+    if n <= LIMITE_DENSO:
+        densa = _densa(A)
+        M = np.tril(densa, -1) + np.diag(d / omega)
+        T = np.eye(n) - solve_triangular(M, densa, lower=True)
+        return float(np.max(np.abs(np.linalg.eigvals(T))))
+    A = sparse.csr_matrix(A)
+    # M es triangular: splu con orden natural y sin pivoteo la guarda una sola vez para
+    # sustituciones rápidas (spsolve_triangular revalida la matriz en cada llamada)
+    M = splu((sparse.tril(A, -1) + sparse.diags(d / omega)).tocsc(), permc_spec='NATURAL',
+             diag_pivot_thresh=0, options={"SymmetricMode": True})
+    return _radio_operador(lambda v: v - M.solve(A @ v), n)
+
+def converge(rho):
+    """True si el radio espectral estimado queda claramente por debajo de 1."""
+    return rho < 1 - MARGEN_RADIO
+
+def iteraciones_estimadas(rho, error_inicial, tol_error):
+    """
+    Iteraciones esperadas para llevar el error de error_inicial a tol_error si el error se
+    reduce un factor rho por iteración: 1 + log(tol / e1) / log(rho). None si rho >= 1.
+    """
+    if not converge(rho) or not math.isfinite(error_inicial):
+        return None
+    if error_inicial <= tol_error or rho == 0:
+        return 1
+    return 1 + math.ceil(math.log(tol_error / error_inicial) / math.log(rho))
+
+class MonitorDivergencia:
+    """
+    Vigila el error de cada iteración y decide cuándo la divergencia es evidente:
+    - el error deja de ser finito, o
+    - el radio espectral estimado es >= 1 (salvo MARGEN_RADIO) y el error no ha disminuido
+      de forma apreciable en las últimas VENTANA_DIVERGENCIA iteraciones (estancamiento)
+    Con rho < 1 el método converge aunque el error crezca al principio, así que no se corta.
+    rho es None cuando no se estimó (matriz diagonal dominante): solo se vigila que el error sea finito.
+    """
+    def __init__(self, rho):
+        self.rho = rho
+        self.errores = []
+        self.detenido_en = None
+
+    def actualizar(self, error):
+        """Registra el error de la iteración; devuelve True si hay que detenerse."""
+        self.errores.append(error)
+        if not math.isfinite(error):
+            self.detenido_en = len(self.errores)
+            return True
+        if self.rho is not None and not converge(self.rho) and len(self.errores) > VENTANA_DIVERGENCIA:
+            if min(self.errores[-VENTANA_DIVERGENCIA:]) >= self.errores[-VENTANA_DIVERGENCIA - 1] * (1 - MARGEN_RADIO):
+                self.detenido_en = len(self.errores)
+                return True
+        return False
+
+    def razon_observada(self):
+        """Media geométrica de e_k / e_{k-1} en las últimas iteraciones (estimación empírica de rho)."""
+        errores = [e for e in self.errores[-VENTANA_DIVERGENCIA - 1:] if math.isfinite(e)]
+        if len(errores) < 2 or errores[0] <= 0 or errores[-1] <= 0:
+            return None
+        return (errores[-1] / errores[0]) ** (1 / (len(errores) - 1))
+
+def analisis_convergencia(rho, monitor, tol_error):
+    """
+    Resumen para la respuesta: radio espectral, iteraciones esperadas y si se detuvo por divergencia.
+    Sin estimación previa (rho None) el radio, la predicción y 'converge' quedan en None.
+    """
+    error_inicial = monitor.errores[0] if monitor.errores else float("inf")
+    return {
+        "radio_espectral": rho,
+        "converge": None if rho is None else converge(rho),
+        "iteraciones_estimadas": None if rho is None else iteraciones_estimadas(rho, error_inicial, tol_error),
+        "razon_observada": monitor.razon_observada(),
+        "detenido_por_divergencia": monitor.detenido_en is not None,
+        "iteracion_detenida": monitor.detenido_en
+    }
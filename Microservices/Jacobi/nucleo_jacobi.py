@@ -0,0 +1,63 @@
+import numpy as np
+from scipy import sparse
+
+def a_dispersa(A):
+    """Convierte la matriz de coeficientes a formato CSR."""
+    return sparse.csr_matrix(A, dtype=float)
+
+def _producto(A, x, salida):
+    """Calcula salida = A x sin reservar memoria nueva cuando A es densa."""
+    if sparse.issparse(A):
+        salida[:] = A @ x
+    else:
+        np.dot(A, x, out=salida)
+
+def jacobi(A, b, x0, tol_error, max_iter, guardar_valores=True, monitor=None):
+    """
+    Iteración de Jacobi vectorizada: x(k+1) = D^-1 (b - R x(k)) = x(k) + D^-1 (b - A x(k)).
+    Hace un solo producto matriz-vector por iteración sobre buffers preasignados, y ese
+    mismo producto da el residuo de la iteración. A puede ser densa o dispersa (CSR);
+    se asume que la diagonal no tiene ceros. Con un monitor (convergencia.MonitorDivergencia)
+    la iteración se detiene en cuanto la divergencia es evidente.
+    Devuelve un diccionario con la solución, el error, el residuo y el historial por iteración.
+    """
+    n = len(b)
+    inv_diagonal = 1.0 / np.asarray(A.diagonal(), dtype=float)
+    x = np.array(x0, dtype=float)
+    Ax = np.empty(n)
+    r = np.empty(n)
+    delta = np.empty(n)
+
+    _producto(A, x, Ax)
+    np.subtract(b, Ax, out=r)
+
+    historial = []
+    error = residuo = float("inf")
+    for iteracion in range(1, max_iter + 1):
+        # x(k+1) - x(k) = D^-1 r(k)
+        np.multiply(r, inv_diagonal, out=delta)
+        x += delta
+        error = max(delta.max(), -delta.min())
+
+        # El residuo de x(k+1) se reutiliza en la siguiente iteración
+        _producto(A, x, Ax)
+        np.subtract(b, Ax, out=r)
+        residuo = max(r.max(), -r.min())
+
+        historial.append({
+            "iteracion": iteracion,
+            "valores": x.copy() if guardar_valores else None,
+            "error": float(error),
+            "residuo": float(residuo)
+        })
+
+        detener = monitor is not None and monitor.actualizar(float(error))
+        if error < tol_error:
+            return {"x": x, "convergio": True, "iteraciones": iteracion,
+                    "error": float(error), "residuo": float(residuo), "historial": historial}
+        if detener:
+            return {"x": x, "convergio": False, "iteraciones": iteracion,
+                    "error": float(error), "residuo": float(residuo), "historial": historial}
+
+    return {"x": x, "convergio": False, "iteraciones": max_iter,
+            "error": float(error), "residuo": float(residuo), "historial": historial}
@@ -0,0 +1,166 @@
+from flask import Flask, request, jsonify
+import numpy as np
+from scipy import sparse
+import urllib.parse
+from sympy import Eq, parse_expr
+from sympy.parsing.sympy_parser import standard_transformations, implicit_multiplication_application
+from flask_cors import CORS
+from krylov import resolver, MatrizNoSPD, METODOS, PRECONDICIONADORES
+from sistemas import (ecuaciones_a_matriz, matriz_desde_json, matriz_desde_binario, variables_numericas,
+                      leer_vector, reordenar_sistema)
+
+app = Flask(__name__)
+CORS(app)
+
+# Transformaciones para el parser de ecuaciones
+transformations = (standard_transformations + (implicit_multiplication_application,))
+
+def decode_equation(eq):
+    """Decodifica la ecuación reemplazando %3D por = y otros caracteres especiales"""
+    decoded = urllib.parse.unquote(eq)  # Decodifica %3D a =
+    decoded = decoded.replace(" ", "")  # Elimina espacios
+    return decoded
+
+def _booleano(valor):
+    return str(valor).lower() == 'true'
+
+@app.route('/krylov', methods=['GET', 'POST'])
+def metodo_krylov():
+    try:
+        # Obtener parámetros según el método HTTP usado (mismas entradas que /jacobi)
+        A = b = None
+        if request.method == 'POST' and request.is_json:
+            data = request.get_json()
+            ecuaciones = data.get('ecuaciones', [])
+            if 'A' in data:
+                try:
+                    A, b = matriz_desde_json(data)
+                except Exception as e:
+                    return jsonify({"error": f"Error en la matriz: {str(e)}"}), 400
+            parametros = data
+        elif request.method == 'POST':
+            # Carga binaria (.npy o float64 crudos); los parámetros van en la URL o en el formulario
+            try:
+                A, b = matriz_desde_binario(request)
+            except Exception as e:
+                return jsonify({"error": f"Error en la matriz: {str(e)}"}), 400
+            ecuaciones = []
+            parametros = request.values
+        else:
+            # Para GET, decodificar cada ecuación
+            ecuaciones = [decode_equation(eq) for eq in request.args.getlist('ecuaciones[]')]
+            parametros = request.args
+
+        x0_str = parametros.get('x0')
+        metodo = parametros.get('metodo', 'gmres')
+        tipo_precondicionador = parametros.get('precondicionador', 'ninguno')
+        disperso = _booleano(parametros.get('disperso', False))
+        incluir_valores = _booleano(parametros.get('incluir_valores', True))
+        reordenar = _booleano(parametros.get('reordenar', False))
+        try:
+            tol_error = parametros.get('tol_error')
+            tol_error = None if tol_error is None else float(tol_error)
+            max_iter = int(parametros.get('max_iter', 1000))
+            reinicio = int(parametros.get('reinicio', 30))
+        except (TypeError, ValueError):
+            return jsonify({"error": "'tol_error', 'max_iter' y 'reinicio' deben ser numéricos."}), 400
+
+        # Validar parámetros mínimos
+        if (A is None and not ecuaciones) or tol_error is None:
+            return jsonify({"error": "Debes proporcionar 'ecuaciones' (o 'A' y 'b') y 'tol_error'."}), 400
+
+        if metodo not in METODOS:
+            return jsonify({"error": f"El 'metodo' debe ser uno de: {', '.join(METODOS)}."}), 400
+
+        if tipo_precondicionador not in PRECONDICIONADORES:
+            return jsonify({"error": f"El 'precondicionador' debe ser uno de: {', '.join(PRECONDICIONADORES)}."}), 400
+
+        if tol_error <= 0 or max_iter < 1 or reinicio < 1:
+            return jsonify({"error": "Se requiere tol_error > 0, max_iter >= 1 y reinicio >= 1."}), 400
+
+        if reordenar and metodo == 'cg':
+            return jsonify({"error": "'reordenar' rompe la simetría que necesita CG; úselo con gmres o bicgstab."}), 400
+
+        if A is None:
+            # Procesar ecuaciones
+            try:
+                sym_ecuaciones = []
+                for eq in ecuaciones:
+                    if "=" not in eq:
+                        return jsonify({"error": f"La ecuación '{eq}' no contiene '='."}), 400
+                    lado_izq, lado_der = eq.split("=", 1)  # Split en el primer = solamente
+                    expr_izq = parse_expr(lado_izq, transformations=transformations)
+                    expr_der = parse_expr(lado_der, transformations=transformations)
+                    sym_ecuaciones.append(Eq(expr_izq, expr_der))
+
+                # Extraer variables iniciales
+                variables = sorted(set().union(*[eq.free_symbols for eq in sym_ecuaciones]), key=lambda v: str(v))
+                variables = [str(var) for var in variables]
+            except Exception as e:
+                return jsonify({"error": f"Error al procesar ecuaciones: {str(e)}"}), 400
+
+            # Convertir a forma matricial
+            try:
+                A, b = ecuaciones_a_matriz(sym_ecuaciones, variables)
+            except Exception as e:
+                return jsonify({"error": f"Error al convertir a matriz: {str(e)}"}), 400
+        else:
+            variables = variables_numericas(len(b))
+
+        # Reordenar solo si se pide (por ejemplo, para que los precondicionadores tengan diagonal sin ceros)
+        if reordenar:
+            try:
+                A, b, variables = reordenar_sistema(A, b, variables)
+            except Exception as e:
+                return jsonify({"error": f"Error al procesar ecuaciones: {str(e)}"}), 400
+
+        # Convertir y validar vector inicial (por defecto, ceros)
+        try:
+            x0 = np.zeros(len(variables)) if x0_str is None else leer_vector(x0_str)
+            if len(x0) != len(variables):
+                return jsonify({"error": "El tamaño del vector inicial no coincide con el número de variables."}), 400
+        except Exception as e:
+            return jsonify({"error": f"Error en el vector inicial: {str(e)}"}), 400
+
+        # Método de Krylov (densa o CSR) con el precondicionador elegido
+        disperso = disperso or sparse.issparse(A)
+        if disperso:
+            A = sparse.csr_matrix(A, dtype=float)
+        try:
+            resultado = resolver(A, b, x0, tol_error, max_iter, metodo, tipo_precondicionador, reinicio,
+                                 incluir_valores)
+        except MatrizNoSPD as e:
+            return jsonify({"error": str(e), "sugerencia": "Use metodo=gmres o metodo=bicgstab."}), 400
+        except ValueError as e:
+            return jsonify({"error": str(e), "sugerencia": "Pruebe reordenar=true u otro precondicionador."}), 400
+
+        tabla = []
+        for fila in resultado["historial"]:
+            if fila["valores"] is not None:
+                fila["valores"] = dict(zip(variables, fila["valores"].tolist()))
+            else:
+                del fila["valores"]
+            tabla.append(fila)
+
+        return jsonify({
+            "convergio": resultado["convergio"],
+            "iteraciones": resultado["iteraciones"],
+            "residuo_final": resultado["residuo"],
+            "residuo_relativo_final": resultado["residuo_relativo"],
+            "solucion": dict(zip(variables, resultado["x"].tolist())) if resultado["convergio"] else None,
+            "variables": variables,
+            "matriz_A": None if sparse.issparse(A) else A.tolist(),
+            "vector_b": b.tolist(),
+            "tabla": tabla,
+            "mensaje": resultado["mensaje"],
+            "metodo": metodo,
+            "precondicionador": tipo_precondicionador,
+            "reinicio": reinicio if metodo == 'gmres' else None,
+            "disperso": disperso
+        })
+
+    except Exception as e:
+        return jsonify({"error": f"Error inesperado: {str(e)}"}), 500
+
+if __name__ == '__main__':
+    app.run(host='0.0.0.0', port=5013, debug=True)
@@ -0,0 +1,307 @@
+import numpy as np
+from scipy import sparse
+from scipy.linalg import solve_triangular
+from scipy.sparse.linalg import splu
+
+METODOS = ('cg', 'gmres', 'bicgstab')
+PRECONDICIONADORES = ('ninguno', 'jacobi', 'ilu0')
+
+# Reducción relativa mínima del residuo en un ciclo de GMRES(m) para no darlo por estancado
+ESTANCAMIENTO_GMRES = 1e-12
+
+# Hasta este tamaño se comprueba que A sea definida positiva con una factorización de Cholesky
+LIMITE_CHOLESKY = 2000
+
+class MatrizNoSPD(ValueError):
+    """La matriz no es simétrica definida positiva (requisito del gradiente conjugado)."""
+
+def verificar_spd(A, tol=1e-12):
+    """
+    Comprueba que A sea simétrica y definida positiva: simetría con tolerancia relativa,
+    diagonal positiva y, en sistemas de hasta LIMITE_CHOLESKY incógnitas, Cholesky.
+    En sistemas mayores la definición positiva se vigila dentro de CG (p^T A p > 0).
+    Lanza MatrizNoSPD con el motivo.
+    """
+    escala = abs(A).max() if sparse.issparse(A) else np.abs(A).max()
+    asimetria = abs(A - A.T).max() if sparse.issparse(A) else np.abs(A - A.T).max()
+    if asimetria > tol * max(escala, 1.0):
+        raise MatrizNoSPD(f"La matriz no es simétrica (máx |A - A^T| = {asimetria:.3g}).")
+    if np.any(np.asarray(A.diagonal()) <= 0):
+        raise MatrizNoSPD("La matriz tiene elementos no positivos en la diagonal, no es definida positiva.")
+    if A.shape[0] <= LIMITE_CHOLESKY:
+        try:
+            np.linalg.cholesky(A.toarray() if sparse.issparse(A) else A)
+        except np.linalg.LinAlgError:
+            raise MatrizNoSPD("La matriz no es definida positiva (falla la factorización de Cholesky).")
+
+def _ilu0_disperso(A):
+    """
+    ILU(0) fila por fila sobre el patrón de A en CSR (sin relleno). Devuelve (L, U) en CSR.
+    Las filas tienen pocas entradas, así que se recorren con listas de Python: con
+    operaciones de NumPy por pareja de filas el costo fijo de cada llamada domina.
+    """
+    A = sparse.csr_matrix(A, dtype=float)
+    A.sort_indices()
+    n = A.shape[0]
+    indptr, indices = A.indptr.tolist(), A.indices.tolist()
+    datos = A.data.tolist()
+    diagonal = [0] * n
+    for i in range(n):
+        for p in range(indptr[i], indptr[i + 1]):
+            if indices[p] == i:
+                diagonal[i] = p
+                break
+        else:
+            raise ValueError(f"ILU(0) requiere el elemento diagonal A[{i}, {i}] en el patrón.")
+
+    for i in range(1, n):
+        inicio, fin = indptr[i], indptr[i + 1]
+        posiciones = {indices[p]: p for p in range(inicio, fin)}
+        for p in range(inicio, diagonal[i]):
+            k = indices[p]
+            pivote = datos[diagonal[k]]
+            if pivote == 0:
+                raise ValueError(f"Pivote nulo en ILU(0) (fila {k}).")
+            l_ik = datos[p] = datos[p] / pivote
+            # a_ij -= l_ik u_kj solo para j > k dentro del patrón de la fila i
+            for q in range(diagonal[k] + 1, indptr[k + 1]):
+                destino = posiciones.get(indices[q])
+                if destino is not None:
+                    datos[destino] -= l_ik * datos[q]
+
+    LU = sparse.csr_matrix((np.array(datos), A.indices, A.indptr), shape=(n, n))
+    return sparse.tril(LU, -1, format='csr') + sparse.identity(n, format='csr'), sparse.triu(LU, format='csr')
+
+def _ilu0_denso(A):
+    """ILU(0) sobre una matriz densa: eliminación sin pivoteo restringida al patrón de no ceros."""
+    LU = np.array(A, dtype=float)
+    patron = LU != 0
+    n = LU.shape[0]
+    for k in range(n - 1):
+        if LU[k, k] == 0:
+            raise ValueError(f"Pivote nulo en ILU(0) (fila {k}).")
+        LU[k + 1:, k] = np.where(patron[k + 1:, k], LU[k + 1:, k] / LU[k, k], 0.0)
+        LU[k + 1:, k + 1:] -= np.outer(LU[k + 1:, k], LU[k, k + 1:]) * patron[k + 1:, k + 1:]
+    return np.tril(LU, -1) + np.eye(n), np.triu(LU)
+
+def precondicionador(A, tipo):
+    """
+    Devuelve una función r -> M^-1 r:
+    - 'ninguno': identidad
+    - 'jacobi': M = diag(A)
+    - 'ilu0': M = L U, factorización LU incompleta sin relleno (mismo patrón que A)
+    Lanza ValueError si la diagonal tiene ceros o ILU(0) encuentra un pivote nulo.
+    """
+    if tipo == 'ninguno':
+        return lambda r: r
+    d = np.asarray(A.diagonal(), dtype=float)
+    if np.any(d == 0):
+        raise ValueError(f"El precondicionador '{tipo}' requiere una diagonal sin ceros.")
+    if tipo == 'jacobi':
+        inv_d = 1.0 / d
+        return lambda r: r * inv_d
+    if sparse.issparse(A):
+        # Los factores ya son triangulares: splu con orden natural y sin pivoteo solo los guarda
+        # para sustituciones rápidas (spsolve_triangular revalida la matriz en cada llamada)
+        L, U = (splu(F.tocsc(), permc_spec='NATURAL', diag_pivot_thresh=0,
+                     options={"SymmetricMode": True}) for F in _ilu0_disperso(A))
+        return lambda r: U.solve(L.solve(r))
+    L, U = _ilu0_denso(A)
+    return lambda r: solve_triangular(U, solve_triangular(L, r, lower=True, unit_diagonal=True), lower=False)
+
+def _fila(iteracion, x, residuo, norma_b, guardar_valores):
+    return {
+        "iteracion": iteracion,
+        "valores": x.copy() if guardar_valores and x is not None else None,
+        "residuo": float(residuo),
+        "residuo_relativo": float(residuo / norma_b)
+    }
+
+def _resultado(x, convergio, iteraciones, residuo, norma_b, historial, mensaje=None):
+    return {"x": x, "convergio": convergio, "iteraciones": iteraciones, "residuo": float(residuo),
+            "residuo_relativo": float(residuo / norma_b), "historial": historial, "mensaje": mensaje}
+
+def gradiente_conjugado(A, b, x0, tol_error, max_iter, M=lambda r: r, guardar_valores=True):
+    """
+    Gradiente conjugado precondicionado para A simétrica definida positiva.
+    Un producto A p por iteración. Se detiene cuando ||r||_2 / ||b||_2 < tol_error.
+    Lanza MatrizNoSPD si encuentra una dirección con p^T A p <= 0.
+    """
+    x = np.array(x0, dtype=float)
+    norma_b = np.linalg.norm(b) or 1.0
+    r = b - A @ x
+    z = M(r)
+    p = z.copy()
+    rz = r @ z
+    residuo = np.linalg.norm(r)
+    historial = []
+    if residuo / norma_b < tol_error:
+        return _resultado(x, True, 0, residuo, norma_b, historial)
+
+    for iteracion in range(1, max_iter + 1):
+        Ap = A @ p
+        curvatura = p @ Ap
+        if not curvatura > 0:
+            raise MatrizNoSPD("La matriz no es definida positiva (p^T A p <= 0 durante CG).")
+        alfa = rz / curvatura
+        x += alfa * p
+        r -= alfa * Ap
+        residuo = np.linalg.norm(r)
+        historial.append(_fila(iteracion, x, residuo, norma_b, guardar_valores))
+        if residuo / norma_b < tol_error:
+            return _resultado(x, True, iteracion, residuo, norma_b, historial)
+        z = M(r)
+        rz_nuevo = r @ z
+        p = z + (rz_nuevo / rz) * p
+        rz = rz_nuevo
+
+    return _resultado(x, False, max_iter, residuo, norma_b, historial)
+
+def gmres(A, b, x0, tol_error, max_iter, M=lambda r: r, reinicio=30, guardar_valores=True):
+    """
+    GMRES(m) con precondicionamiento por la derecha, A M^-1 u = b, x = M^-1 u: Arnoldi con
+    Gram-Schmidt modificado y rotaciones de Givens, de modo que el residuo ||b - A x||_2 se
+    conoce en cada paso sin formar x. Se reinicia cada m = reinicio pasos; si un ciclo completo
+    no reduce el residuo (sistema singular o reinicio demasiado corto) se detiene con un mensaje,
+    porque los ciclos siguientes repetirían el mismo resultado.
+    Con guardar_valores, x se reconstruye en cada paso para la tabla (O(n m) adicional).
+    """
+    x = np.array(x0, dtype=float)
+    n = len(b)
+    norma_b = np.linalg.norm(b) or 1.0
+    m = max(1, min(reinicio, n))
+    historial = []
+    iteracion = 0
+    r = b - A @ x
+    residuo = np.linalg.norm(r)
+    if residuo / norma_b < tol_error:
+        return _resultado(x, True, 0, residuo, norma_b, historial)
+
+    while iteracion < max_iter:
+        residuo_ciclo = residuo
+        V = np.zeros((m + 1, n))
+        H = np.zeros((m + 1, m))
+        cs, sn = np.zeros(m), np.zeros(m)
+        g = np.zeros(m + 1)
+        g[0] = residuo
+        V[0] = r / residuo
+        x_base = x.copy()
+
+        def solucion(k):
+            y = solve_triangular(H[:k, :k], g[:k])
+            return x_base + M(V[:k].T @ y)
+
+        k = 0
+        while k < m and iteracion < max_iter:
+            w = A @ M(V[k])
+            for j in range(k + 1):
+                H[j, k] = w @ V[j]
+                w -= H[j, k] * V[j]
+            H[k + 1, k] = np.linalg.norm(w)
+            if H[k + 1, k] != 0:
+                V[k + 1] = w / H[k + 1, k]
+            # Rotaciones de Givens acumuladas sobre la nueva columna
+            for j in range(k):
+                H[j, k], H[j + 1, k] = cs[j] * H[j, k] + sn[j] * H[j + 1, k], -sn[j] * H[j, k] + cs[j] * H[j + 1, k]
+            denominador = np.hypot(H[k, k], H[k + 1, k])
+            if denominador == 0:
+                return _resultado(x, False, iteracion, residuo, norma_b, historial,
+                                  "Ruptura de GMRES: la matriz es singular en el subespacio de Krylov.")
+            cs[k], sn[k] = H[k, k] / denominador, H[k + 1, k] / denominador
+            H[k, k], H[k + 1, k] = denominador, 0.0
+            g[k + 1] = -sn[k] * g[k]
+            g[k] = cs[k] * g[k]
+            k += 1
+            iteracion += 1
+            residuo = abs(g[k])
+            historial.append(_fila(iteracion, solucion(k) if guardar_valores else None, residuo, norma_b,
+                                   guardar_valores))
+            if residuo / norma_b < tol_error:
+                return _resultado(solucion(k), True, iteracion, residuo, norma_b, historial)
+
+        # Reinicio desde la solución del ciclo con el residuo verdadero
+        x = solucion(k)
+        r = b - A @ x
+        residuo = np.linalg.norm(r)
+        if residuo / norma_b < tol_error:
+            return _resultado(x, True, iteracion, residuo, norma_b, historial)
+        if not residuo < residuo_ciclo * (1 - ESTANCAMIENTO_GMRES):
+            # Se devuelve el iterado del inicio del ciclo: con H casi singular el del final puede ser peor
+            return _resultado(x_base, False, iteracion, residuo_ciclo, norma_b, historial,
+                              f"GMRES se estancó: el residuo no disminuyó en un ciclo de {m} pasos "
+                              "(la matriz puede ser singular); pruebe un 'reinicio' mayor u otro precondicionador.")
+
+    return _resultado(x, False, iteracion, residuo, norma_b, historial)
+
+def bicgstab(A, b, x0, tol_error, max_iter, M=lambda r: r, guardar_valores=True):
+    """
+    BiCGSTAB precondicionado (van der Vorst) para matrices no simétricas: dos productos
+    A v por iteración y memoria fija. Se detiene cuando ||r||_2 / ||b||_2 < tol_error;
+    si rho, omega o r_sombra^T v se anulan, o el residuo deja de ser finito, devuelve el
+    último iterado válido con un mensaje de ruptura.
+    """
+    x = np.array(x0, dtype=float)
+    norma_b = np.linalg.norm(b) or 1.0
+    r = b - A @ x
+    r_sombra = r.copy()
+    residuo = np.linalg.norm(r)
+    historial = []
+    if residuo / norma_b < tol_error:
+        return _resultado(x, True, 0, residuo, norma_b, historial)
+
+    def ruptura(iteracion, motivo):
+        return _resultado(x, False, iteracion - 1, residuo, norma_b, historial,
+                          f"Ruptura de BiCGSTAB ({motivo}); pruebe GMRES.")
+
+    rho = alfa = omega = 1.0
+    v = np.zeros_like(x)
+    p = np.zeros_like(x)
+    for iteracion in range(1, max_iter + 1):
+        rho_nuevo = r_sombra @ r
+        if rho_nuevo == 0 or omega == 0:
+            return ruptura(iteracion, "rho u omega nulos")
+        beta = (rho_nuevo / rho) * (alfa / omega)
+        rho = rho_nuevo
+        p = r + beta * (p - omega * v)
+        p_gorro = M(p)
+        v = A @ p_gorro
+        sigma = r_sombra @ v
+        if sigma == 0 or not np.isfinite(sigma):
+            return ruptura(iteracion, "r_sombra^T v nulo")
+        alfa = rho / sigma
+        s = r - alfa * v
+        if np.linalg.norm(s) / norma_b < tol_error:
+            x += alfa * p_gorro
+            residuo = np.linalg.norm(s)
+            historial.append(_fila(iteracion, x, residuo, norma_b, guardar_valores))
+            return _resultado(x, True, iteracion, residuo, norma_b, historial)
+        s_gorro = M(s)
+        t = A @ s_gorro
+        tt = t @ t
+        omega = (t @ s) / tt if tt != 0 else 0.0
+        r_nuevo = s - omega * t
+        residuo_nuevo = np.linalg.norm(r_nuevo)
+        if not np.isfinite(residuo_nuevo):
+            return ruptura(iteracion, "residuo no finito")
+        x += alfa * p_gorro + omega * s_gorro
+        r, residuo = r_nuevo, residuo_nuevo
+        historial.append(_fila(iteracion, x, residuo, norma_b, guardar_valores))
+        if residuo / norma_b < tol_error:
+            return _resultado(x, True, iteracion, residuo, norma_b, historial)
+
+    return _resultado(x, False, max_iter, residuo, norma_b, historial)
+
+def resolver(A, b, x0, tol_error, max_iter, metodo='gmres', tipo_precondicionador='ninguno',
+             reinicio=30, guardar_valores=True):
+    """
+    Punto de entrada del servicio: construye el precondicionador y aplica el método.
+    Para 'cg' se comprueba antes que A sea simétrica definida positiva.
+    """
+    if metodo == 'cg':
+        verificar_spd(A)
+    M = precondicionador(A, tipo_precondicionador)
+    if metodo == 'cg':
+        return gradiente_conjugado(A, b, x0, tol_error, max_iter, M, guardar_valores)
+    if metodo == 'gmres':
+        return gmres(A, b, x0, tol_error, max_iter, M, reinicio, guardar_valores)
+    return bicgstab(A, b, x0, tol_error, max_iter, M, guardar_valores)
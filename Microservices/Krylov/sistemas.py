@@ -0,0 +1,92 @@
+import io
+import json
+import numpy as np
+from scipy import sparse
+from sympy import symbols, linear_eq_to_matrix
+from reordenamiento import orden_pivoteo
+
+def ecuaciones_a_matriz(sym_ecuaciones, variables):
+    """Convierte las ecuaciones simbólicas a la forma matricial A x = b (una sola vez)."""
+    A_sym, b_sym = linear_eq_to_matrix([eq.lhs - eq.rhs for eq in sym_ecuaciones], symbols(variables))
+    return np.array(A_sym, dtype=float), np.array(b_sym, dtype=float).flatten()
+
+def variables_numericas(n):
+    """Nombres de las incógnitas cuando el sistema llega como matriz: x1, x2, ..., xn."""
+    return [f"x{i + 1}" for i in range(n)]
+
+def _validar_dimensiones(A, b):
+    """Comprueba que A sea cuadrada y que b tenga una entrada por ecuación."""
+    if len(A.shape) != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError(f"La matriz 'A' debe ser cuadrada, se recibió una de forma {A.shape}.")
+    if b.shape != (A.shape[0],):
+        raise ValueError(f"El vector 'b' debe tener {A.shape[0]} elementos, se recibieron {b.size}.")
+    return A, b
+
+def leer_matriz(valor, n):
+    """
+    Lee A enviada como arreglo JSON ([[...], ...]) o dispersa en formato de coordenadas
+    ({"filas": [...], "columnas": [...], "valores": [...], "n": ...}, se guarda como CSR).
+    n es el orden por defecto de la forma dispersa si no trae "n".
+    """
+    if isinstance(valor, dict):
+        n = int(valor.get('n', n))
+        return sparse.csr_matrix((np.array(valor['valores'], dtype=float), (valor['filas'], valor['columnas'])),
+                                 shape=(n, n))
+    return np.array(valor, dtype=float)
+
+def matriz_desde_json(data):
+    """
+    Lee A y b enviados como arreglos JSON: {"A": [[...], ...], "b": [...]}.
+    A también puede llegar dispersa en formato de coordenadas:
+    {"A": {"filas": [...], "columnas": [...], "valores": [...]}, "b": [...]}; se guarda como CSR.
+    """
+    b = np.array(data['b'], dtype=float).flatten()
+    return _validar_dimensiones(leer_matriz(data['A'], len(b)), b)
+
+def matriz_desde_binario(req):
+    """
+    Lee A y b de una carga binaria, sin pasar por sympy:
+    - multipart/form-data con archivos .npy 'A' y 'b'
+    - application/octet-stream con float64 crudos: A (n x n) por filas seguida de b (n)
+    """
+    if 'A' in req.files and 'b' in req.files:
+        A = np.load(io.BytesIO(req.files['A'].read()), allow_pickle=False).astype(float)
+        b = np.load(io.BytesIO(req.files['b'].read()), allow_pickle=False).astype(float).flatten()
+        return _validar_dimensiones(A, b)
+
+    datos = np.frombuffer(req.get_data(), dtype='<f8')
+    # len = n^2 + n  =>  n = (-1 + sqrt(1 + 4 len)) / 2
+    n = int(round((-1 + np.sqrt(1 + 4 * datos.size)) / 2))
+    if n < 1 or n * n + n != datos.size:
+        raise ValueError(f"La carga binaria tiene {datos.size} valores float64; se esperaban n*n + n.")
+    return _validar_dimensiones(datos[:n * n].reshape(n, n).copy(), datos[n * n:].copy())
+
+def leer_vector(valor):
+    """Acepta el vector inicial como texto JSON ("[0, 0]") o como lista."""
+    if isinstance(valor, str):
+        valor = json.loads(valor)
+    return np.array(valor, dtype=float).flatten()
+
+def reordenar_sistema(A, b, variables):
+    """
+    Reordena filas (ecuaciones) y columnas (variables) de A x = b según orden_pivoteo.
+    Devuelve la matriz, el vector y las variables en el nuevo orden.
+    """
+    nuevo_orden = orden_pivoteo(A)
+    filas = [eq_idx for eq_idx, _ in nuevo_orden]
+    columnas = [var_idx for _, var_idx in nuevo_orden]
+    if sparse.issparse(A):
+        A_ordenada = A[filas][:, columnas].tocsr()
+    else:
+        A_ordenada = A[np.ix_(filas, columnas)]
+    return A_ordenada, b[filas], [variables[var_idx] for var_idx in columnas]
+
+def verificar_dominancia_diagonal(A, estricta=False):
+    """
+    Criterio de dominancia diagonal usado por los métodos iterativos: 2|a_ii| >= sum_j |a_ij|.
+    Con estricta=True exige 2|a_ii| > sum_j |a_ij| en todas las filas, la condición que sí
+    garantiza la convergencia de Jacobi y Gauss-Seidel.
+    """
+    suma_filas = np.asarray(abs(A).sum(axis=1)).ravel()
+    diagonal = 2 * np.abs(A.diagonal())
+    return bool(np.all(diagonal > suma_filas if estricta else diagonal >= suma_filas))
@@ -0,0 +1,181 @@
+from flask import Flask, request, jsonify
+import numpy as np
+from scipy import sparse
+import urllib.parse
+from sympy import Eq, parse_expr
+from sympy.parsing.sympy_parser import standard_transformations, implicit_multiplication_application
+from flask_cors import CORS
+from factorizacion import clave_matriz, cache_factorizaciones, MatrizSingular
+from sistemas import (ecuaciones_a_matriz, matriz_desde_json, matriz_desde_binario, variables_numericas,
+                      leer_matriz)
+
+app = Flask(__name__)
+CORS(app)
+
+# Transformaciones para el parser de ecuaciones
+transformations = (standard_transformations + (implicit_multiplication_application,))
+
+def decode_equation(eq):
+    """Decodifica la ecuación reemplazando %3D por = y otros caracteres especiales"""
+    decoded = urllib.parse.unquote(eq)  # Decodifica %3D a =
+    decoded = decoded.replace(" ", "")  # Elimina espacios
+    return decoded
+
+def _booleano(valor):
+    return str(valor).lower() == 'true'
+
+def _lados_derechos_json(data):
+    """Lee 'B' (n x k, un lado derecho por columna) o 'b' (vector) de un cuerpo JSON."""
+    if 'B' in data:
+        B = np.array(data['B'], dtype=float)
+        if B.ndim != 2:
+            raise ValueError("'B' debe ser una matriz n x k con un lado derecho por columna.")
+        return B
+    return np.array(data['b'], dtype=float).flatten()
+
+def _verificar_finitos(A, B):
+    """LU no admite NaN ni infinitos en A ni en los lados derechos."""
+    if A is not None and not np.all(np.isfinite(A.data if sparse.issparse(A) else A)):
+        raise ValueError("'A' contiene valores no finitos (NaN o infinito).")
+    if B is not None and not np.all(np.isfinite(B)):
+        raise ValueError("Los lados derechos contienen valores no finitos (NaN o infinito).")
+
+@app.route('/lu', methods=['GET', 'POST'])
+def metodo_lu():
+    """
+    Resuelve A x = b (o A X = B) por factorización LU con pivoteo parcial. La factorización se
+    guarda en caché con una huella de A como clave: las peticiones siguientes con la misma A, o
+    solo con la 'clave' devuelta, se resuelven con sustituciones, sin volver a factorizar.
+    """
+    try:
+        A = B = clave = None
+        variables = None
+        if request.method == 'POST' and request.is_json:
+            data = request.get_json()
+            ecuaciones = data.get('ecuaciones', [])
+            clave = data.get('clave')
+            try:
+                if 'A' in data and 'B' in data:
+                    B = _lados_derechos_json(data)
+                    A = leer_matriz(data['A'], B.shape[0])
+                    if len(A.shape) != 2 or A.shape[0] != A.shape[1] or A.shape[0] != B.shape[0]:
+                        raise ValueError(f"'A' debe ser cuadrada con {B.shape[0]} filas, se recibió una de forma {A.shape}.")
+                elif 'A' in data:
+                    A, B = matriz_desde_json(data)
+                elif clave is not None and ('b' in data or 'B' in data):
+                    B = _lados_derechos_json(data)
+            except Exception as e:
+                return jsonify({"error": f"Error en la matriz: {str(e)}"}), 400
+            parametros = data
+        elif request.method == 'POST':
+            # Carga binaria (.npy o float64 crudos); los parámetros van en la URL o en el formulario
+            try:
+                A, B = matriz_desde_binario(request)
+            except Exception as e:
+                return jsonify({"error": f"Error en la matriz: {str(e)}"}), 400
+            ecuaciones = []
+            parametros = request.values
+        else:
+            # Para GET, decodificar cada ecuación
+            ecuaciones = [decode_equation(eq) for eq in request.args.getlist('ecuaciones[]')]
+            parametros = request.args
+
+        disperso = _booleano(parametros.get('disperso', False))
+
+        # Validar parámetros mínimos
+        if A is None and B is None and not ecuaciones:
+            return jsonify({"error": "Debes proporcionar 'ecuaciones', 'A' y 'b' (o 'B'), o una 'clave' con 'b' (o 'B')."}), 400
+
+        if A is None and B is None:
+            # Procesar ecuaciones
+            try:
+                sym_ecuaciones = []
+                for eq in ecuaciones:
+                    if "=" not in eq:
+                        return jsonify({"error": f"La ecuación '{eq}' no contiene '='."}), 400
+                    lado_izq, lado_der = eq.split("=", 1)  # Split en el primer = solamente
+                    expr_izq = parse_expr(lado_izq, transformations=transformations)
+                    expr_der = parse_expr(lado_der, transformations=transformations)
+                    sym_ecuaciones.append(Eq(expr_izq, expr_der))
+
+                # Extraer variables en orden alfabético
+                variables = sorted(set().union(*[eq.free_symbols for eq in sym_ecuaciones]), key=lambda v: str(v))
+                variables = [str(var) for var in variables]
+            except Exception as e:
+                return jsonify({"error": f"Error al procesar ecuaciones: {str(e)}"}), 400
+
+            # Convertir a forma matricial
+            try:
+                A, B = ecuaciones_a_matriz(sym_ecuaciones, variables)
+            except Exception as e:
+                return jsonify({"error": f"Error al convertir a matriz: {str(e)}"}), 400
+            if A.shape[0] != A.shape[1]:
+                return jsonify({"error": f"El sistema tiene {A.shape[0]} ecuaciones y {A.shape[1]} incógnitas; LU requiere un sistema cuadrado."}), 400
+        else:
+            # Nombres de las incógnitas opcionales (por ejemplo, los devueltos al enviar ecuaciones)
+            variables = parametros.get('variables') if request.is_json else None
+            if variables is None:
+                variables = variables_numericas(B.shape[0])
+            elif not isinstance(variables, list) or len(variables) != B.shape[0]:
+                return jsonify({"error": f"'variables' debe ser una lista de {B.shape[0]} nombres."}), 400
+            variables = [str(v) for v in variables]
+
+        try:
+            _verificar_finitos(A, B)
+        except ValueError as e:
+            return jsonify({"error": f"Error en la matriz: {str(e)}"}), 400
+
+        # Con A se busca (o crea) la factorización por su huella; sin A, por la clave recibida
+        en_cache = True
+        if A is not None:
+            if disperso or sparse.issparse(A):
+                A = sparse.csr_matrix(A, dtype=float)
+            clave = clave_matriz(A)
+            try:
+                factorizacion, en_cache = cache_factorizaciones.obtener(clave, A)
+            except MatrizSingular as e:
+                return jsonify({"error": str(e)}), 400
+        else:
+            factorizacion = cache_factorizaciones.buscar(clave)
+            if factorizacion is None:
+                return jsonify({"error": "No hay una factorización en caché con esa 'clave' (pudo ser desalojada); envíe 'A' de nuevo."}), 400
+
+        try:
+            X = factorizacion.resolver(B)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        # Residuo ||A X - B||_inf, solo si la matriz vino en la petición
+        residuo = None
+        if A is not None:
+            residuo = float(np.abs(A @ X - B).max()) if B.size else 0.0
+
+        respuesta = {
+            "clave": clave,
+            "en_cache": en_cache,
+            "variables": variables,
+            "residuo": residuo,
+            "condicion": factorizacion.condicion,
+            "disperso": factorizacion.disperso,
+            "bytes_factorizacion": factorizacion.bytes
+        }
+        if X.ndim == 1:
+            respuesta["solucion"] = dict(zip(variables, X.tolist()))
+        else:
+            # Una solución por columna de B
+            respuesta["X"] = X.tolist()
+            respuesta["soluciones"] = [dict(zip(variables, columna)) for columna in X.T.tolist()]
+        return jsonify(respuesta)
+
+    except Exception as e:
+        return jsonify({"error": f"Error inesperado: {str(e)}"}), 500
+
+@app.route('/lu/cache', methods=['GET', 'DELETE'])
+def cache_lu():
+    """Estadísticas de la caché de factorizaciones; con DELETE la vacía."""
+    if request.method == 'DELETE':
+        cache_factorizaciones.vaciar()
+    return jsonify(cache_factorizaciones.estadisticas())
+
+if __name__ == '__main__':
+    app.run(host='0.0.0.0', port=5014, debug=True)
@@ -0,0 +1,161 @@
+import hashlib
+import os
+import threading
+import warnings
+from collections import OrderedDict
+import numpy as np
+from scipy import sparse
+from scipy.linalg import lu_factor, lu_solve, LinAlgWarning
+from scipy.linalg.lapack import dgecon
+from scipy.sparse.linalg import splu
+
+# Por debajo de este recíproco del número de condición la solución pierde casi todos los dígitos
+RCOND_MINIMO = np.finfo(float).eps
+
+class MatrizSingular(ValueError):
+    """La matriz no tiene inversa: la factorización encontró un pivote nulo."""
+
+def clave_matriz(A):
+    """
+    Huella SHA-256 de A (forma, formato y valores). Las matrices densas y dispersas con los
+    mismos valores dan claves distintas porque se factorizan de forma distinta.
+    """
+    h = hashlib.sha256()
+    if sparse.issparse(A):
+        A = sparse.csr_matrix(A, dtype=float)
+        A.sum_duplicates()
+        A.sort_indices()
+        h.update(f"csr{A.shape}".encode())
+        for arreglo in (A.indptr, A.indices, A.data):
+            h.update(np.ascontiguousarray(arreglo).tobytes())
+    else:
+        A = np.ascontiguousarray(A, dtype=float)
+        h.update(f"densa{A.shape}".encode())
+        h.update(A.tobytes())
+    return h.hexdigest()
+
+class Factorizacion:
+    """
+    Factorización P A = L U con pivoteo parcial, lista para resolver A X = B con solo
+    sustituciones hacia adelante y hacia atrás (O(n^2) por columna de B en densa).
+    - densa: LAPACK getrf, con estimación del número de condición en norma 1 (gecon)
+    - dispersa (CSR/CSC): SuperLU, pivoteo parcial con umbral y reordenamiento de columnas
+      para limitar el relleno; no se estima la condición
+    """
+    def __init__(self, A):
+        self.n = A.shape[0]
+        self.disperso = sparse.issparse(A)
+        self.condicion = None
+        if self.disperso:
+            try:
+                self._lu = splu(sparse.csc_matrix(A, dtype=float))
+            except RuntimeError as e:
+                raise MatrizSingular(f"La matriz es singular: {e}.")
+            # L y U: valores float64 e índices int32 por no cero, más punteros y permutaciones
+            self.bytes = int(self._lu.nnz * 12 + 4 * (self.n + 1) * 4)
+            return
+
+        A = np.asarray(A, dtype=float)
+        # La singularidad se detecta abajo con los pivotes y gecon; el aviso de SciPy sobra
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", LinAlgWarning)
+            lu, piv = lu_factor(A, check_finite=True)
+        diagonal = np.abs(np.diag(lu))
+        if np.any(diagonal == 0):
+            raise MatrizSingular(f"La matriz es singular (pivote nulo en la columna {int(np.argmin(diagonal))}).")
+        rcond, _ = dgecon(lu, np.abs(A).sum(axis=0).max(), norm='1')
+        if rcond < RCOND_MINIMO:
+            raise MatrizSingular(f"La matriz es numéricamente singular (número de condición ~ {1 / max(rcond, 1e-300):.3g}).")
+        self.condicion = float(1 / rcond)
+        self._lu = (lu, piv)
+        self.bytes = int(lu.nbytes + piv.nbytes)
+
+    def resolver(self, B):
+        """Resuelve A X = B; B puede ser un vector (n) o una matriz (n x k) con un lado derecho por columna."""
+        B = np.asarray(B, dtype=float)
+        if B.shape[0] != self.n or B.ndim > 2:
+            raise ValueError(f"El lado derecho debe tener {self.n} filas, se recibió uno de forma {B.shape}.")
+        if self.disperso:
+            return self._lu.solve(np.ascontiguousarray(B) if B.ndim == 1 else np.asfortranarray(B))
+        return lu_solve(self._lu, B, check_finite=False)
+
+class CacheFactorizaciones:
+    """
+    Caché LRU de factorizaciones, segura para hilos, acotada por número de entradas y por
+    memoria (bytes de los factores L y U). Al superar cualquiera de los dos límites se
+    desalojan las menos usadas; una factorización más grande que la capacidad en bytes se
+    devuelve sin guardarse.
+    """
+    def __init__(self, max_entradas, max_bytes):
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self._datos = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.rechazados = 0
+
+    def buscar(self, clave):
+        """Devuelve la factorización guardada con esa clave, o None."""
+        with self._lock:
+            factorizacion = self._datos.get(clave)
+            if factorizacion is None:
+                self.fallos += 1
+                return None
+            self._datos.move_to_end(clave)
+            self.aciertos += 1
+            return factorizacion
+
+    def obtener(self, clave, A):
+        """
+        Devuelve (factorización, en_cache) para A, factorizándola si no estaba.
+        Si la factorización falla (matriz singular) la excepción se propaga y no se guarda nada.
+        """
+        factorizacion = self.buscar(clave)
+        if factorizacion is not None:
+            return factorizacion, True
+
+        # Se factoriza fuera del candado para no bloquear a las demás peticiones
+        factorizacion = Factorizacion(A)
+        with self._lock:
+            if factorizacion.bytes > self.max_bytes or self.max_entradas <= 0:
+                self.rechazados += 1
+                return factorizacion, False
+            anterior = self._datos.pop(clave, None)
+            if anterior is not None:
+                self.bytes -= anterior.bytes
+            self._datos[clave] = factorizacion
+            self.bytes += factorizacion.bytes
+            while len(self._datos) > self.max_entradas or self.bytes > self.max_bytes:
+                _, desalojada = self._datos.popitem(last=False)
+                self.bytes -= desalojada.bytes
+                self.desalojos += 1
+        return factorizacion, False
+
+    def vaciar(self):
+        """Elimina todas las factorizaciones guardadas."""
+        with self._lock:
+            self._datos.clear()
+            self.bytes = 0
+
+    def estadisticas(self):
+        """Contadores de uso y memoria ocupada."""
+        with self._lock:
+            return {
+                "entradas": len(self._datos),
+                "max_entradas": self.max_entradas,
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "desalojos": self.desalojos,
+                "rechazados": self.rechazados
+            }
+
+# Caché del proceso; por defecto hasta 64 factorizaciones y 256 MiB
+cache_factorizaciones = CacheFactorizaciones(
+    int(os.environ.get("CACHE_LU_ENTRADAS", 64)),
+    int(os.environ.get("CACHE_LU_BYTES", 256 * 1024 * 1024))
+)
@@ -1,14 +1,13 @@
 from flask import Flask, request, jsonify
-from sympy import symbols, diff, N
-from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application
 from flask_cors import CORS
 import numpy as np
+from expresiones import obtener_ecuacion, derivada, evaluar_grilla, cache_ecuaciones
+from lotes import leer_lote, resolver_lote, numero
+from nucleo_newton import newton_vectorizado, newton, VARIANTES
 
 app = Flask(__name__)
 CORS(app)
 
-transformations = (standard_transformations + (implicit_multiplication_application,))
-
 @app.route('/newton_raphson', methods=['GET'])
 def metodo_newton_raphson():
     try:
@@ -25,72 +24,49 @@ def metodo_newton_raphson():
         if tol_error < 1e-10 or tol_error > 0.999999:
             return jsonify({"error": "El valor de 'tol_error' debe estar entre 0.0000000001 y 0.999999."}), 400
 
-        # Convertir la ecuación a expresión simbólica
-        x = symbols('x')
+        # Variante del método (clasico, amortiguado o multiple) y multiplicidad opcional
+        variante = request.args.get('metodo', 'clasico')
+        multiplicidad = request.args.get('multiplicidad', type=int)
+        incluir_g_prima = request.args.get('incluir_g_prima', 'false').lower() in ('1', 'true', 'si', 'sí')
+
+        if variante not in VARIANTES:
+            return jsonify({"error": f"El parámetro 'metodo' debe ser uno de: {', '.join(VARIANTES)}."}), 400
+
+        if multiplicidad is not None and (variante != 'multiple' or multiplicidad < 1):
+            return jsonify({"error": "'multiplicidad' debe ser un entero >= 1 y solo se usa con metodo=multiple."}), 400
+
+        # Convertir la ecuación a expresión simbólica; f, f' y (si hace falta) f'' compiladas quedan en la caché
         try:
-            f = parse_expr(ecuacion_str, transformations=transformations)  # f(x)
-            f_prima = diff(f, x)  # f'(x)
-            g = x - ((f / f_prima))  # g(x) = x - f(x)/f'(x)
-            g_prima = diff(g, x)  # g'(x)
+            ecuacion = obtener_ecuacion(ecuacion_str)
+            f_num = ecuacion["f"]  # f(x)
+            _, f_prima_num = derivada(ecuacion)  # f'(x)
+            # f''(x): para g'(x) = f f'' / f'^2 en la tabla y para la variante para raíces múltiples
+            necesita_f_segunda = (variante == 'clasico' and incluir_g_prima) or \
+                (variante == 'multiple' and multiplicidad is None)
+            f_segunda_num = derivada(ecuacion, 2)[1] if necesita_f_segunda else None
         except Exception as e:
             return jsonify({"error": f"Error en la sintaxis de la ecuación: {str(e)}"}), 400
 
-        # Mostrar por consola la ecuación g(x) y su derivada g'(x)
-        print(f)
-        print(f_prima)
-        print("Ecuación g(x):", g)
-        print("Derivada g'(x):", g_prima)
+        # Algoritmo de Newton-Raphson
+        try:
+            resultado = newton(f_num, f_prima_num, x0, tol_error, variante, f_segunda_num, multiplicidad)
+        except ZeroDivisionError:
+            return jsonify({"error": "División por cero encontrada. El método no puede continuar."}), 400
+        except Exception as e:
+            return jsonify({"error": f"Error durante la iteración: {str(e)}"}), 400
 
-        # Variables de iteración
-        nIteracion = 0
-        error = 1.0
-        x_actual = x0
-        tabla = []
-        x_hist = [x0]
-        fx_hist = [float(N(f.subs(x, x0)))]
+        # Tabla de iteraciones con los valores redondeados a 4 decimales
+        tabla = [{clave: valor if clave == "nIteracion" else round(valor, 4) for clave, valor in fila.items()}
+                 for fila in resultado["filas"]]
 
-        # Algoritmo de Newton-Raphson
-        while error >= tol_error:
-            nIteracion += 1
-
-            try:
-                # Calcular el siguiente valor de x usando g(x)
-                x_siguiente = float(g.subs(x, x_actual))
-
-                # Calcular el error absoluto
-                error = abs(x_siguiente - x_actual)
-
-                # Calcular f(x_actual) y g'(x_actual) para fines de visualización
-                fxi = float(f.subs(x, x_actual))
-                g_prima_valor = float(g_prima.subs(x, x_actual))
-
-                # Agregar la iteración a la tabla de resultados
-                tabla.append({
-                    "nIteracion": nIteracion,
-                    "xi": round(x_actual, 4),  # Redondear a 4 decimales
-                    "fxi": round(fxi, 4),  # Redondear a 4 decimales
-                    "g_prima": round(g_prima_valor, 4),  # Redondear a 4 decimales
-                    "error": round(error, 4)  # Redondear a 4 decimales
-                })
-
-                # Guardar historial para gráfica
-                x_hist.append(x_siguiente)
-                fx_hist.append(float(N(f.subs(x, x_siguiente))))
-
-                # Actualizar el valor de x para la siguiente iteración
-                x_actual = x_siguiente
-
-                # Verificar si el método no converge después de un número máximo de iteraciones
-                if nIteracion >= 100:
-                    return jsonify({
-                        "error": "El método no convergió después del número máximo de iteraciones.",
-                        "tabla": tabla
-                    }), 400
-
-            except ZeroDivisionError:
-                return jsonify({"error": "División por cero encontrada. El método no puede continuar."}), 400
-            except Exception as e:
-                return jsonify({"error": f"Error durante la iteración: {str(e)}"}), 400
+        # Verificar si el método no converge después de un número máximo de iteraciones
+        if not resultado["convergio"]:
+            return jsonify({
+                "error": "El método no convergió después del número máximo de iteraciones.",
+                "tabla": tabla
+            }), 400
+
+        x_hist, fx_hist = resultado["x_hist"], resultado["fx_hist"]
 
         # Para la gráfica: evaluamos f(x) en un rango que cubra todos los valores de x_hist
         min_x = min(x_hist)
@@ -99,13 +75,7 @@ def metodo_newton_raphson():
             min_x -= 1
             max_x += 1
         grafico_x = np.linspace(min_x, max_x, 100)
-        grafico_y = []
-        for val in grafico_x:
-            try:
-                yval = float(N(f.subs(x, val)))
-            except:
-                yval = None
-            grafico_y.append(yval)
+        grafico_y = evaluar_grilla(f_num, grafico_x)
 
         # Retornar la tabla de iteraciones y la gráfica
         return jsonify({
@@ -113,12 +83,63 @@ def metodo_newton_raphson():
             "grafico_x": grafico_x.tolist(),
             "grafico_y": grafico_y,
             "x_hist": x_hist,
-            "fx_hist": fx_hist
+            "fx_hist": fx_hist,
+            "metodo": variante,
+            "evaluaciones": resultado["evaluaciones"]
         })
 
     except Exception as e:
         return jsonify({"error": f"Error inesperado: {str(e)}"}), 500
 
 
+def validar_problema(problema):
+    """Valida un problema del lote con las mismas reglas que /newton_raphson."""
+    ecuacion_str = problema.get('ecuacion')
+    if not isinstance(ecuacion_str, str) or not ecuacion_str.strip():
+        raise ValueError("Falta el parámetro 'ecuacion'.")
+    x0, tol_error = numero(problema, 'x0'), numero(problema, 'tol_error')
+    if tol_error < 1e-10 or tol_error > 0.999999:
+        raise ValueError("El valor de 'tol_error' debe estar entre 0.0000000001 y 0.999999.")
+    return ecuacion_str, (x0, tol_error)
+
+def resolver_grupo(ecuacion, parametros):
+    """Todos los valores iniciales de una misma ecuación iteran a la vez."""
+    x0, tol_error = (np.array(columna) for columna in zip(*parametros))
+    try:
+        _, f_prima = derivada(ecuacion)
+    except Exception as e:
+        return [{"ok": False, "error": f"Error en la sintaxis de la ecuación: {str(e)}"}] * len(parametros)
+    r = newton_vectorizado(ecuacion["f"], f_prima, x0, tol_error)
+    resultados = []
+    for i, mensaje in enumerate(r["mensajes"]):
+        if mensaje:
+            resultados.append({"ok": False, "error": mensaje, "iteraciones": int(r["iteraciones"][i])})
+        else:
+            resultados.append({"ok": True, "raiz": float(r["raiz"][i]), "fx": float(r["fx"][i]),
+                               "error_aproximado": float(r["error"][i]),
+                               "iteraciones": int(r["iteraciones"][i])})
+    return resultados
+
+@app.route('/newton_raphson/lote', methods=['POST'])
+def metodo_newton_raphson_lote():
+    try:
+        # Recibe {"problemas": [{"ecuacion", "x0", "tol_error"}, ...]} y devuelve un
+        # resultado por problema, en el mismo orden, con su propio error si falla
+        try:
+            problemas = leer_lote(request.get_json(silent=True))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        return jsonify({"resultados": resolver_lote(problemas, validar_problema, resolver_grupo)})
+
+    except Exception as e:
+        return jsonify({"error": f"Error inesperado: {str(e)}"}), 500
+
+
+@app.route('/cache', methods=['GET'])
+def estadisticas_cache():
+    # Aciertos, fallos y desalojos de la caché de ecuaciones parseadas y compiladas
+    return jsonify(cache_ecuaciones.estadisticas())
+
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5003)
\ No newline at end of file
@@ -0,0 +1,151 @@
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+import numpy as np
+from sympy import symbols, lambdify, diff
+from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application
+
+x = symbols('x')
+
+# Transformaciones para permitir multiplicación implícita
+transformations = (standard_transformations + (implicit_multiplication_application,))
+
+def compilar(expr, variable=x):
+    """
+    Convierte una expresión de sympy en una función numérica basada en NumPy.
+    Se compila una sola vez y sirve tanto para valores escalares como para arreglos.
+    """
+    return lambdify(variable, expr, modules=["numpy", "sympy"])
+
+def _a_real(valor):
+    """Convierte el resultado de una evaluación a float; devuelve nan si no es un número real."""
+    try:
+        if isinstance(valor, complex) or np.iscomplexobj(valor):
+            return float(valor.real) if valor.imag == 0 else math.nan
+        return float(valor)
+    except Exception:
+        return math.nan
+
+def evaluar(f, valor):
+    """
+    Evalúa la función compilada en un punto.
+    Lanza ValueError si el resultado no es un número real finito (igual que fallaba float(N(...))).
+    """
+    with np.errstate(all='ignore'):
+        resultado = _a_real(f(valor))
+    if not math.isfinite(resultado):
+        raise ValueError(f"La función no está definida en x = {valor}")
+    return resultado
+
+def evaluar_arreglo(f, xs):
+    """
+    Evalúa la función compilada sobre todo el arreglo xs de una vez.
+    Los puntos donde la evaluación falla o no es real quedan como nan.
+    """
+    xs = np.asarray(xs, dtype=float)
+    with np.errstate(all='ignore'):
+        try:
+            ys = np.broadcast_to(np.asarray(f(xs)), xs.shape)
+            if np.iscomplexobj(ys):
+                ys = np.where(ys.imag == 0, ys.real, np.nan)
+            return np.array(ys, dtype=float)
+        except Exception:
+            # Algunas funciones no aceptan arreglos: se evalúa punto a punto
+            ys = np.empty_like(xs)
+            for i, val in enumerate(xs):
+                try:
+                    ys[i] = _a_real(f(float(val)))
+                except Exception:
+                    ys[i] = math.nan
+            return ys
+
+def evaluar_grilla(f, xs):
+    """Evalúa f sobre xs y devuelve una lista para JSON, con None donde la evaluación falla."""
+    return [v if math.isfinite(v) else None for v in evaluar_arreglo(f, xs).tolist()]
+
+class CacheLRU:
+    """
+    Caché LRU acotada y segura para hilos, con expiración por tiempo (TTL, en segundos).
+    Con capacidad 0 no se guarda nada; con ttl 0 las entradas no expiran.
+    """
+    def __init__(self, capacidad, ttl):
+        self.capacidad = capacidad
+        self.ttl = ttl
+        self._datos = OrderedDict()
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.expirados = 0
+
+    def obtener(self, clave, construir):
+        """Devuelve el valor de la clave, construyéndolo con construir() si no está o expiró."""
+        with self._lock:
+            entrada = self._datos.get(clave)
+            if entrada is not None:
+                valor, creado = entrada
+                if self.ttl <= 0 or time.monotonic() - creado < self.ttl:
+                    self._datos.move_to_end(clave)
+                    self.aciertos += 1
+                    return valor
+                del self._datos[clave]
+                self.expirados += 1
+            self.fallos += 1
+
+        # Se construye fuera del candado; si falla, la excepción se propaga y no se guarda nada
+        valor = construir()
+        if self.capacidad <= 0:
+            return valor
+
+        with self._lock:
+            self._datos[clave] = (valor, time.monotonic())
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.capacidad:
+                self._datos.popitem(last=False)
+                self.desalojos += 1
+        return valor
+
+    def estadisticas(self):
+        """Contadores de uso de la caché."""
+        with self._lock:
+            return {
+                "tamano": len(self._datos),
+                "capacidad": self.capacidad,
+                "ttl": self.ttl,
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "desalojos": self.desalojos,
+                "expirados": self.expirados
+            }
+
+# Caché del proceso con las ecuaciones ya parseadas y compiladas
+cache_ecuaciones = CacheLRU(
+    int(os.environ.get("CACHE_ECUACIONES_TAMANO", 256)),
+    float(os.environ.get("CACHE_ECUACIONES_TTL", 3600))
+)
+
+def obtener_ecuacion(ecuacion_str):
+    """
+    Devuelve la entrada de la caché para la ecuación: {"expr", "f", "derivadas"}.
+    El parseo y la compilación se pagan solo la primera vez que llega cada ecuación.
+    """
+    def construir():
+        expr = parse_expr(ecuacion_str, transformations=transformations)
+        return {"expr": expr, "f": compilar(expr), "derivadas": {}}
+    return cache_ecuaciones.obtener(ecuacion_str, construir)
+
+def memorizar(ecuacion, clave, construir):
+    """
+    Guarda en la entrada de la caché una expresión obtenida a partir de la ecuación
+    (derivadas, g(x) de Newton, ...) junto con su versión compilada. Devuelve (expr, f).
+    """
+    if clave not in ecuacion["derivadas"]:
+        expr = construir(ecuacion["expr"])
+        ecuacion["derivadas"].setdefault(clave, (expr, compilar(expr)))
+    return ecuacion["derivadas"][clave]
+
+def derivada(ecuacion, orden=1):
+    """Devuelve (expr, f) de la derivada de orden dado, calculada una sola vez por ecuación."""
+    return memorizar(ecuacion, orden, lambda expr: diff(expr, x, orden))
@@ -0,0 +1,63 @@
+import math
+import os
+from collections import OrderedDict
+from expresiones import obtener_ecuacion
+
+# Máximo de problemas por solicitud de lote
+LIMITE_LOTE = int(os.environ.get("LIMITE_LOTE", 10000))
+
+def leer_lote(datos):
+    """
+    Lista de problemas del cuerpo JSON: {"problemas": [...]} o directamente una lista.
+    Lanza ValueError si el cuerpo no tiene esa forma o supera LIMITE_LOTE.
+    """
+    problemas = datos.get("problemas") if isinstance(datos, dict) else datos
+    if not isinstance(problemas, list) or not problemas:
+        raise ValueError("El cuerpo debe ser una lista no vacía de problemas o {\"problemas\": [...]}.")
+    if len(problemas) > LIMITE_LOTE:
+        raise ValueError(f"El lote tiene {len(problemas)} problemas; el máximo es {LIMITE_LOTE}.")
+    return problemas
+
+def resolver_lote(problemas, validar, resolver_grupo):
+    """
+    Resuelve un lote de problemas y devuelve los resultados en el mismo orden.
+    - validar(problema) devuelve (ecuacion_str, parametros) o lanza ValueError con el mensaje
+    - resolver_grupo(ecuacion, lista_de_parametros) resuelve de una vez todos los problemas
+      que comparten ecuación (ecuacion es la entrada de la caché) y devuelve un resultado
+      por problema
+    Cada ecuación se parsea y compila una sola vez. Un problema inválido no hace fallar
+    al lote: su resultado es {"indice", "ok": False, "error"}.
+    """
+    resultados = [None] * len(problemas)
+    grupos = OrderedDict()
+    for indice, problema in enumerate(problemas):
+        try:
+            if not isinstance(problema, dict):
+                raise ValueError("Cada problema debe ser un objeto JSON.")
+            ecuacion_str, parametros = validar(problema)
+        except (ValueError, TypeError) as e:
+            resultados[indice] = {"indice": indice, "ok": False, "error": str(e)}
+            continue
+        grupos.setdefault(ecuacion_str, []).append((indice, parametros))
+
+    for ecuacion_str, miembros in grupos.items():
+        indices = [indice for indice, _ in miembros]
+        try:
+            ecuacion = obtener_ecuacion(ecuacion_str)
+        except Exception as e:
+            for indice in indices:
+                resultados[indice] = {"indice": indice, "ok": False, "error": f"Error en la ecuación: {str(e)}"}
+            continue
+        for indice, resultado in zip(indices, resolver_grupo(ecuacion, [p for _, p in miembros])):
+            resultados[indice] = {"indice": indice, **resultado}
+    return resultados
+
+def numero(problema, nombre):
+    """Lee un parámetro numérico obligatorio de un problema del lote."""
+    valor = problema.get(nombre)
+    if valor is None or isinstance(valor, bool):
+        raise ValueError(f"Falta el parámetro numérico '{nombre}'.")
+    valor = float(valor)
+    if not math.isfinite(valor):
+        raise ValueError(f"El parámetro '{nombre}' debe ser un número finito.")
+    return valor
@@ -0,0 +1,137 @@
+import numpy as np
+from expresiones import evaluar, evaluar_arreglo
+
+VARIANTES = ('clasico', 'amortiguado', 'multiple')
+
+def newton_vectorizado(f, f_prima, x0, tol_error, max_iter=100):
+    """
+    Newton-Raphson desde muchos valores iniciales a la vez, con el criterio de /newton_raphson:
+    |x_{k+1} - x_k| < tol_error, o error de no convergencia tras max_iter iteraciones.
+    En cada iteración f y f' se evalúan una sola vez sobre los puntos que siguen activos.
+    Devuelve arreglos con la raíz, f(raíz), el error, las iteraciones y una lista de
+    mensajes de error (None si el problema convergió).
+    """
+    x = np.array(x0, dtype=float)
+    tol_error = np.broadcast_to(np.asarray(tol_error, dtype=float), x.shape)
+    m = x.size
+    mensajes = [None] * m
+    error = np.ones(m)
+    iteraciones = np.zeros(m, dtype=int)
+    activos = np.ones(m, dtype=bool)
+
+    for n_iteracion in range(1, max_iter + 1):
+        idx = np.flatnonzero(activos)
+        if idx.size == 0:
+            break
+        xi = x[idx]
+        derivadas = evaluar_arreglo(f_prima, xi)
+        division_por_cero = derivadas == 0
+        for i in idx[division_por_cero]:
+            mensajes[i] = "División por cero encontrada. El método no puede continuar."
+            activos[i] = False
+        idx, xi, derivadas = idx[~division_por_cero], xi[~division_por_cero], derivadas[~division_por_cero]
+        with np.errstate(all='ignore'):
+            x_siguiente = xi - evaluar_arreglo(f, xi) / derivadas
+
+        invalidos = ~np.isfinite(x_siguiente)
+        for i, punto in zip(idx[invalidos], xi[invalidos]):
+            mensajes[i] = f"Error durante la iteración: La función no está definida en x = {punto}"
+            activos[i] = False
+        idx, xi, x_siguiente = idx[~invalidos], xi[~invalidos], x_siguiente[~invalidos]
+
+        error[idx] = np.abs(x_siguiente - xi)
+        x[idx] = x_siguiente
+        iteraciones[idx] = n_iteracion
+        activos[idx[error[idx] < tol_error[idx]]] = False
+
+    for i in np.flatnonzero(activos):
+        mensajes[i] = "El método no convergió después del número máximo de iteraciones."
+    return {"raiz": x, "fx": evaluar_arreglo(f, x), "error": error, "iteraciones": iteraciones,
+            "mensajes": mensajes}
+
+def newton(f, f_prima, x0, tol_error, variante='clasico', f_segunda=None, multiplicidad=None,
+           max_iter=100, max_reducciones=30):
+    """
+    Newton-Raphson desde un valor inicial, con el paso calculado numéricamente a partir
+    de f y f' compiladas (sin construir g(x) = x - f/f' ni su derivada simbólica).
+    Variantes:
+    - 'clasico': x - f/f'
+    - 'amortiguado': x + lambda * (-f/f'), con lambda = 1, 1/2, 1/4, ... hasta que |f|
+      disminuya (búsqueda lineal con backtracking, a lo sumo max_reducciones mitades)
+    - 'multiple': con multiplicidad m conocida, x - m f/f'; si no, el método modificado
+      x - f f' / (f'^2 - f f''), que recupera la convergencia cuadrática en raíces múltiples
+    Si se pasa f_segunda, cada fila incluye g'(x) = f f'' / f'^2 (la derivada de la
+    iteración clásica). Criterio de parada de /newton_raphson: |x_{k+1} - x_k| < tol_error.
+    Devuelve un diccionario con las filas (sin redondear), x_hist, fx_hist, evaluaciones
+    y convergio. Lanza ZeroDivisionError si el denominador del paso es 0 y ValueError
+    si f no está definida en algún punto. Si f(x) == 0 el paso es 0 y el método termina.
+    """
+    x_actual = x0
+    fx = evaluar(f, x0)
+    evaluaciones = 1
+    filas = []
+    x_hist = [x0]
+    fx_hist = [fx]
+    convergio = False
+
+    for n_iteracion in range(1, max_iter + 1):
+        fpx = evaluar(f_prima, x_actual)
+        evaluaciones += 1
+        fila = {"nIteracion": n_iteracion, "xi": x_actual, "fxi": fx}
+
+        fppx = None
+        if f_segunda is not None:
+            fppx = evaluar(f_segunda, x_actual)
+            evaluaciones += 1
+            if variante == 'clasico' and fpx != 0:
+                fila["g_prima"] = fx * fppx / fpx ** 2
+
+        if fx == 0:
+            # Raíz exacta: no hace falta dividir (f' puede ser 0 en una raíz múltiple)
+            paso = 0.0
+        elif variante == 'multiple' and multiplicidad is None:
+            denominador = fpx ** 2 - fx * fppx
+            if denominador == 0:
+                raise ZeroDivisionError
+            paso = -fx * fpx / denominador
+        else:
+            if fpx == 0:
+                raise ZeroDivisionError
+            paso = -fx / fpx * (multiplicidad if variante == 'multiple' else 1)
+
+        if variante == 'amortiguado':
+            lam = 1.0
+            for _ in range(max_reducciones + 1):
+                try:
+                    fx_siguiente = evaluar(f, x_actual + lam * paso)
+                    evaluaciones += 1
+                    if abs(fx_siguiente) < abs(fx):
+                        break
+                except ValueError:
+                    pass
+                lam /= 2
+            else:
+                # Ninguna reducción disminuyó |f|: se toma el paso completo
+                lam = 1.0
+                fx_siguiente = evaluar(f, x_actual + paso)
+                evaluaciones += 1
+            fila["lambda"] = lam
+            x_siguiente = x_actual + lam * paso
+        else:
+            x_siguiente = x_actual + paso
+            fx_siguiente = evaluar(f, x_siguiente)
+            evaluaciones += 1
+
+        error = abs(x_siguiente - x_actual)
+        fila["error"] = error
+        filas.append(fila)
+        x_hist.append(x_siguiente)
+        fx_hist.append(fx_siguiente)
+        x_actual, fx = x_siguiente, fx_siguiente
+
+        if error < tol_error:
+            convergio = True
+            break
+
+    return {"filas": filas, "x_hist": x_hist, "fx_hist": fx_hist, "evaluaciones": evaluaciones,
+            "convergio": convergio}
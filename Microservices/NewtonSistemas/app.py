@@ -0,0 +1,105 @@
+from flask import Flask, request, jsonify
+from flask_cors import CORS
+from expresiones import cache_ecuaciones
+from no_lineales import decode_equation, leer_vector, obtener_sistema
+from nucleo_newton_sistemas import newton_sistema, METODOS
+
+app = Flask(__name__)
+CORS(app)
+
+def _booleano(valor):
+    return str(valor).lower() == 'true'
+
+@app.route('/newton_sistemas', methods=['GET', 'POST'])
+def metodo_newton_sistemas():
+    try:
+        # Obtener parámetros según el método HTTP usado
+        if request.method == 'POST':
+            data = request.get_json(silent=True) or {}
+            ecuaciones = data.get('ecuaciones', [])
+            x0_str = data.get('x0')
+            tol_error = data.get('tol_error')
+            max_iter = data.get('max_iter', 100)
+            metodo = data.get('metodo', 'newton')
+            incluir_valores = _booleano(data.get('incluir_valores', True))
+        else:
+            # Para GET, decodificar cada ecuación
+            ecuaciones = [decode_equation(eq) for eq in request.args.getlist('ecuaciones[]')]
+            x0_str = request.args.get('x0')
+            tol_error = request.args.get('tol_error', type=float)
+            max_iter = request.args.get('max_iter', type=int, default=100)
+            metodo = request.args.get('metodo', 'newton')
+            incluir_valores = _booleano(request.args.get('incluir_valores', True))
+
+        # Validar parámetros mínimos
+        if not ecuaciones or x0_str is None or tol_error is None:
+            return jsonify({"error": "Debes proporcionar 'ecuaciones', 'x0' y 'tol_error'."}), 400
+
+        if not isinstance(ecuaciones, list) or not all(isinstance(eq, str) for eq in ecuaciones):
+            return jsonify({"error": "'ecuaciones' debe ser una lista de textos como 'x**2 + y**2 = 4'."}), 400
+
+        if metodo not in METODOS:
+            return jsonify({"error": f"El parámetro 'metodo' debe ser uno de: {', '.join(METODOS)}."}), 400
+
+        try:
+            tol_error, max_iter = float(tol_error), int(max_iter)
+        except (TypeError, ValueError):
+            return jsonify({"error": "'tol_error' y 'max_iter' deben ser numéricos."}), 400
+
+        if tol_error <= 0 or max_iter < 1:
+            return jsonify({"error": "Se requiere tol_error > 0 y max_iter >= 1."}), 400
+
+        # Parsear, derivar el jacobiano y compilar F y J (o tomarlos de la caché)
+        try:
+            sistema = obtener_sistema(ecuaciones)
+        except Exception as e:
+            return jsonify({"error": f"Error al procesar ecuaciones: {str(e)}"}), 400
+        variables = sistema["variables"]
+
+        # Convertir y validar vector inicial
+        try:
+            x0 = leer_vector(x0_str)
+            if len(x0) != len(variables):
+                return jsonify({"error": "El tamaño del vector inicial no coincide con el número de variables."}), 400
+        except Exception as e:
+            return jsonify({"error": f"Error en el vector inicial: {str(e)}"}), 400
+
+        # Newton con LU (o Broyden) sobre F y J compiladas
+        try:
+            resultado = newton_sistema(sistema["F"], sistema["J"], x0, tol_error, max_iter, metodo,
+                                       incluir_valores)
+        except ValueError as e:
+            return jsonify({"error": f"Error durante la iteración: {str(e)}"}), 400
+
+        tabla = []
+        for fila in resultado["historial"]:
+            if fila["valores"] is not None:
+                fila["valores"] = dict(zip(variables, fila["valores"].tolist()))
+            else:
+                del fila["valores"]
+            tabla.append(fila)
+
+        return jsonify({
+            "convergio": resultado["convergio"],
+            "iteraciones": resultado["iteraciones"],
+            "error_final": resultado["error"],
+            "residuo_final": resultado["residuo"],
+            "solucion": dict(zip(variables, resultado["x"].tolist())) if resultado["convergio"] else None,
+            "variables": variables,
+            "jacobiano": sistema["jacobiano"],
+            "metodo": metodo,
+            "evaluaciones": resultado["evaluaciones"],
+            "evaluaciones_jacobiano": resultado["evaluaciones_jacobiano"],
+            "tabla": tabla
+        })
+
+    except Exception as e:
+        return jsonify({"error": f"Error inesperado: {str(e)}"}), 500
+
+@app.route('/cache', methods=['GET'])
+def estadisticas_cache():
+    # Aciertos, fallos y desalojos de la caché de sistemas parseados y compilados
+    return jsonify(cache_ecuaciones.estadisticas())
+
+if __name__ == '__main__':
+    app.run(host='0.0.0.0', port=5012, debug=True)
@@ -0,0 +1,57 @@
+import json
+import urllib.parse
+import numpy as np
+from sympy import Matrix, lambdify
+from expresiones import parse_expr, transformations, cache_ecuaciones
+
+def decode_equation(eq):
+    """Decodifica la ecuación reemplazando %3D por = y otros caracteres especiales"""
+    decoded = urllib.parse.unquote(eq)  # Decodifica %3D a =
+    decoded = decoded.replace(" ", "")  # Elimina espacios
+    return decoded
+
+def leer_vector(valor):
+    """Acepta el vector inicial como texto JSON ("[0, 0]") o como lista."""
+    if isinstance(valor, str):
+        valor = json.loads(valor)
+    return np.array(valor, dtype=float).flatten()
+
+def _construir_sistema(ecuaciones):
+    """Parsea las ecuaciones, deriva el jacobiano simbólico y compila F y J con NumPy."""
+    residuos = []
+    for eq in ecuaciones:
+        if "=" not in eq:
+            raise ValueError(f"La ecuación '{eq}' no contiene '='.")
+        lado_izq, lado_der = eq.split("=", 1)  # Split en el primer = solamente
+        residuos.append(parse_expr(lado_izq, transformations=transformations)
+                        - parse_expr(lado_der, transformations=transformations))
+
+    variables = sorted(set().union(*[r.free_symbols for r in residuos]), key=lambda v: str(v))
+    if len(variables) != len(residuos):
+        raise ValueError(f"El sistema tiene {len(residuos)} ecuaciones y {len(variables)} variables; "
+                         "deben coincidir.")
+
+    F_sym = Matrix(residuos)
+    J_sym = F_sym.jacobian(variables)
+    n = len(variables)
+    F_num = lambdify(variables, list(F_sym), modules="numpy")
+    J_num = lambdify(variables, list(J_sym), modules="numpy")
+
+    def F(x):
+        with np.errstate(all='ignore'):
+            return np.array(F_num(*x), dtype=float)
+
+    def J(x):
+        with np.errstate(all='ignore'):
+            return np.array(J_num(*x), dtype=float).reshape(n, n)
+
+    return {"variables": [str(v) for v in variables], "F": F, "J": J,
+            "jacobiano": [[str(J_sym[i, j]) for j in range(n)] for i in range(n)]}
+
+def obtener_sistema(ecuaciones):
+    """
+    Devuelve el sistema compilado {"variables", "F", "J", "jacobiano"} desde la caché.
+    El jacobiano se deriva y compila una sola vez por lista de ecuaciones.
+    Lanza ValueError si una ecuación no tiene '=' o el sistema no es cuadrado.
+    """
+    return cache_ecuaciones.obtener(tuple(ecuaciones), lambda: _construir_sistema(ecuaciones))
@@ -0,0 +1,93 @@
+import warnings
+import numpy as np
+from scipy.linalg import lu_factor, lu_solve, LinAlgWarning
+
+METODOS = ('newton', 'broyden')
+
+def _norma(v):
+    """Norma infinito, la misma que usan Jacobi y Gauss-Seidel para el error y el residuo."""
+    return float(np.max(np.abs(v))) if v.size else 0.0
+
+def _evaluar_F(F, x):
+    """Evalúa F y lanza ValueError si algún componente no es un número real finito."""
+    with np.errstate(all='ignore'):
+        fx = F(x)
+    if not np.all(np.isfinite(fx)):
+        raise ValueError(f"El sistema no está definido en x = {x.tolist()}")
+    return fx
+
+def _factorizar(J, x):
+    """
+    Factorización LU del jacobiano en x; lanza ValueError si es singular o no finito.
+    Los avisos de NumPy y SciPy se silencian: esos casos ya se informan con el ValueError.
+    """
+    with np.errstate(all='ignore'):
+        jx = J(x)
+    if not np.all(np.isfinite(jx)):
+        raise ValueError(f"El jacobiano no está definido en x = {x.tolist()}")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", LinAlgWarning)
+        lu, piv = lu_factor(jx, check_finite=False)
+    if np.any(np.diag(lu) == 0):
+        raise ValueError(f"El jacobiano es singular en x = {x.tolist()}")
+    return lu, piv
+
+def newton_sistema(F, J, x0, tol_error, max_iter, metodo='newton', guardar_valores=True):
+    """
+    Newton multivariable: J(x_k) dx = -F(x_k) se resuelve con una factorización LU por
+    iteración. Con metodo='broyden' el jacobiano se evalúa y factoriza solo en x0 y después
+    se actualiza su inversa con la fórmula de Broyden (Sherman-Morrison), O(n^2) por iteración
+    y sin volver a evaluar J.
+    Criterio de parada: ||x_{k+1} - x_k||_inf < tol_error.
+    Devuelve un diccionario con la solución, el error, el residuo ||F||_inf, los contadores
+    de evaluaciones y el historial por iteración. Lanza ValueError si F o J no están
+    definidos o J es singular.
+    """
+    x = np.array(x0, dtype=float)
+    fx = _evaluar_F(F, x)
+    evaluaciones, evaluaciones_jacobiano = 1, 0
+    if metodo == 'broyden':
+        lu, piv = _factorizar(J, x)
+        evaluaciones_jacobiano += 1
+        # Inversa aproximada del jacobiano: H = J(x0)^-1
+        H = lu_solve((lu, piv), np.eye(len(x)), check_finite=False)
+
+    historial = []
+    error = residuo = float("inf")
+    for iteracion in range(1, max_iter + 1):
+        if metodo == 'broyden':
+            dx = -H @ fx
+        else:
+            dx = -lu_solve(_factorizar(J, x), fx, check_finite=False)
+            evaluaciones_jacobiano += 1
+
+        x = x + dx
+        fx_siguiente = _evaluar_F(F, x)
+        evaluaciones += 1
+
+        if metodo == 'broyden':
+            # H_{k+1} = H_k + (dx - H_k dF) dx^T H_k / (dx^T H_k dF)
+            dF = fx_siguiente - fx
+            H_dF = H @ dF
+            denominador = dx @ H_dF
+            if denominador != 0:
+                H += np.outer(dx - H_dF, dx @ H) / denominador
+        fx = fx_siguiente
+
+        error = _norma(dx)
+        residuo = _norma(fx)
+        historial.append({
+            "iteracion": iteracion,
+            "valores": x.copy() if guardar_valores else None,
+            "error": error,
+            "residuo": residuo
+        })
+
+        if error < tol_error:
+            return {"x": x, "convergio": True, "iteraciones": iteracion, "error": error,
+                    "residuo": residuo, "evaluaciones": evaluaciones,
+                    "evaluaciones_jacobiano": evaluaciones_jacobiano, "historial": historial}
+
+    return {"x": x, "convergio": False, "iteraciones": max_iter, "error": error,
+            "residuo": residuo, "evaluaciones": evaluaciones,
+            "evaluaciones_jacobiano": evaluaciones_jacobiano, "historial": historial}
@@ -1,14 +1,12 @@
 from flask import Flask, request, jsonify
-from sympy import symbols, sqrt
-from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application
 from flask_cors import CORS
+import numpy as np
+from expresiones import obtener_ecuacion, evaluar_arreglo, cache_ecuaciones
+from nucleo_punto_fijo import punto_fijo, ACELERACIONES
 
 app = Flask(__name__)
 CORS(app)
 
-# Transformaciones para permitir multiplicación implícita (por ejemplo, 2x en lugar de 2*x)
-transformations = (standard_transformations + (implicit_multiplication_application,))
-
 @app.route('/punto_fijo', methods=['GET'])
 def metodo_punto_fijo():
     try:
@@ -26,54 +24,53 @@ def metodo_punto_fijo():
         if tol_error < 1e-10 or tol_error > 0.999999:
             return jsonify({"error": "El valor de 'tol_error' debe estar entre 0.0000000001 y 0.999999."}), 400
 
-        # Convertir la ecuación y la transformada a expresiones simbólicas
-        x = symbols('x')
+        # Aceleración opcional: ninguna (por defecto), aitken o steffensen
+        aceleracion = request.args.get('aceleracion', 'ninguna')
+        if aceleracion not in ACELERACIONES:
+            return jsonify({"error": f"El parámetro 'aceleracion' debe ser uno de: {', '.join(ACELERACIONES)}."}), 400
+
+        # Convertir la ecuación y la transformada a funciones compiladas (o tomarlas de la caché)
         try:
-            ecuacion = parse_expr(ecuacion_str, transformations=transformations)
-            transformada = parse_expr(transformada_str, transformations=transformations)
+            ecuacion = obtener_ecuacion(ecuacion_str)["f"]
+            transformada = obtener_ecuacion(transformada_str)["f"]
         except Exception as e:
             return jsonify({"error": f"Error en la sintaxis de la ecuación o transformada: {str(e)}"}), 400
 
-        # Variables de iteración
-        nIteracion = 0
-        error = 1.0
-        x_actual = x0
-        tabla = []
-
-        # Algoritmo de punto fijo
-        while error >= tol_error:
-            nIteracion += 1
-
-            # Calcular el siguiente valor de x usando la función de iteración
-            x_siguiente = float(transformada.subs(x, x_actual))
-
-            # Calcular el error relativo
-            if x_siguiente != 0:
-                error = abs((x_siguiente - x_actual) / x_siguiente)
-            else:
-                error = 0  # Si x_siguiente es 0, evitamos división por 0
-
-            # Calcular f(x_actual) para fines de visualización
-            fxi = float(abs(ecuacion.subs(x, x_actual)))
-
-            # Agregar la iteración a la tabla de resultados
-            tabla.append({
-                "nIteracion": nIteracion,
-                "fxi": round(fxi, 4),  # Redondear a 4 decimales
-                "x_actual": round(x_actual, 4),  # Redondear a 4 decimales
-                "x_siguiente": round(x_siguiente, 4),  # Redondear a 4 decimales
-                "error": round(float(error), 4)  # Redondear a 4 decimales
-            })
-
-            # Actualizar el valor de x para la siguiente iteración
-            x_actual = x_siguiente
-
-            # Verificar si el método no converge después de un número máximo de iteraciones
-            if nIteracion >= 100:
-                return jsonify({
-                    "error": "El método no convergió después del número máximo de iteraciones.",
-                    "tabla": tabla
-                }), 400
+        # Algoritmo de punto fijo (con monitor de divergencia)
+        try:
+            resultado = punto_fijo(transformada, x0, tol_error, aceleracion)
+        except ValueError as e:
+            return jsonify({"error": f"Error durante la iteración: {str(e)}"}), 400
+
+        # f(x_actual) solo se muestra en la tabla: se evalúa al final, de una vez sobre todo el historial
+        filas = resultado["filas"]
+        fxis = np.abs(evaluar_arreglo(ecuacion, [fila["x_actual"] for fila in filas]))
+        tabla = [{
+            "nIteracion": fila["nIteracion"],
+            "fxi": round(float(fxi), 4) if np.isfinite(fxi) else None,  # Redondear a 4 decimales
+            "x_actual": round(fila["x_actual"], 4),  # Redondear a 4 decimales
+            "x_siguiente": round(fila["x_siguiente"], 4),  # Redondear a 4 decimales
+            "error": round(float(fila["error"]), 4)  # Redondear a 4 decimales
+        } for fila, fxi in zip(filas, fxis)]
+
+        # Divergencia detectada antes de agotar las iteraciones
+        if resultado["diagnostico"] is not None:
+            diagnostico = resultado["diagnostico"]
+            g_prima = diagnostico["g_prima_estimada"]
+            estimacion = f" (|g'(x)| estimado ≈ {g_prima:.4g})" if g_prima is not None else ""
+            return jsonify({
+                "error": f"El método diverge: {diagnostico['motivo']}{estimacion}. "
+                         "Pruebe otra transformada g(x) con |g'(x)| < 1 cerca de la raíz o aceleracion=steffensen.",
+                "diagnostico": diagnostico,
+                "tabla": tabla
+            }), 400
+
+        # Verificar si el método no converge después de un número máximo de iteraciones
+        if not resultado["convergio"]:
+            return jsonify({
+                "error": "El método no convergió después del número máximo de iteraciones.",
+                "tabla": tabla
+            }), 400
 
         # Retornar la tabla de iteraciones
         return jsonify(tabla)
@@ -82,5 +79,10 @@ def metodo_punto_fijo():
         return jsonify({"error": f"Error inesperado: {str(e)}"}), 500
 
 
+@app.route('/cache', methods=['GET'])
+def estadisticas_cache():
+    # Aciertos, fallos y desalojos de la caché de ecuaciones parseadas y compiladas
+    return jsonify(cache_ecuaciones.estadisticas())
+
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5001)
\ No newline at end of file
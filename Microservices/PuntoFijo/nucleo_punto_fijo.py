@@ -0,0 +1,118 @@
+import math
+from expresiones import evaluar
+
+ACELERACIONES = ('ninguna', 'aitken', 'steffensen')
+
+# Iteraciones seguidas con |g'(x)| estimada > 1 (o, en Steffensen, con pasos crecientes)
+# que se toman como divergencia
+ITERACIONES_DIVERGENCIA = 4
+
+# Magnitud de x a partir de la cual se declara divergencia sin esperar más
+MAGNITUD_MAXIMA = 1e150
+
+def _error_relativo(x_siguiente, x_actual):
+    """Error relativo de /punto_fijo (0 si x_siguiente es 0)."""
+    return abs((x_siguiente - x_actual) / x_siguiente) if x_siguiente != 0 else 0.0
+
+def _aitken(p0, p1, p2):
+    """Extrapolación Δ² de Aitken; si el denominador es 0 la sucesión ya es estacionaria y se devuelve p2."""
+    denominador = p2 - 2 * p1 + p0
+    return p0 - (p1 - p0) ** 2 / denominador if denominador != 0 else p2
+
+def _razon(paso, paso_anterior):
+    """|paso| / |paso_anterior|, o None si el anterior es 0."""
+    return abs(paso) / abs(paso_anterior) if paso_anterior else None
+
+def punto_fijo(g, x0, tol_error, aceleracion='ninguna', max_iter=100):
+    """
+    Iteración de punto fijo x_{k+1} = g(x_k) sobre g compilada, con aceleración opcional:
+    - 'aitken': Δ² de Aitken sobre la sucesión x, g(x), g(g(x)), ... (una evaluación de
+      g por iteración tras la primera)
+    - 'steffensen': cada iteración reinicia desde el valor de Aitken (dos evaluaciones de g);
+      converge cuadráticamente incluso si |g'(x*)| > 1
+    En cada iteración se estima |g'(x)| con el cociente de pasos sucesivos de la sucesión
+    sin acelerar. Si la estimación supera 1 durante ITERACIONES_DIVERGENCIA iteraciones
+    seguidas (o x se dispara) la iteración se corta con un diagnóstico en lugar de agotar
+    max_iter. Steffensen converge aunque |g'| > 1, así que en él se vigila en cambio que sus
+    propios pasos crezcan ITERACIONES_DIVERGENCIA veces seguidas.
+    Criterio de parada de /punto_fijo: error relativo entre iteraciones < tol_error; con
+    aceleración, además, el valor extrapolado x debe cumplir |g(x) - x| / |x| < tol_error.
+    Devuelve un diccionario con las filas (sin f(x) ni redondeo), convergio, diagnostico
+    (None si no hubo divergencia), g_prima_estimada y evaluaciones. Lanza ValueError si g
+    no está definida en algún punto.
+    """
+    filas = []
+    evaluaciones = 0
+    g_prima = None
+    paso_anterior = None
+    crecientes = 0
+    x_actual = x0
+
+    # Sucesión sin acelerar para Aitken: últimos tres términos
+    p = [x0]
+    if aceleracion == 'aitken':
+        p.append(evaluar(g, x0))
+        evaluaciones += 1
+
+    for n_iteracion in range(1, max_iter + 1):
+        if aceleracion == 'ninguna':
+            x_siguiente = evaluar(g, x_actual)
+            evaluaciones += 1
+            g_prima = _razon(x_siguiente - x_actual, paso_anterior) if paso_anterior is not None else g_prima
+        elif aceleracion == 'aitken':
+            p.append(evaluar(g, p[-1]))
+            evaluaciones += 1
+            p = p[-3:]
+            x_siguiente = _aitken(*p)
+            g_prima = _razon(p[2] - p[1], p[1] - p[0])
+        else:
+            p1 = evaluar(g, x_actual)
+            p2 = evaluar(g, p1)
+            evaluaciones += 2
+            x_siguiente = _aitken(x_actual, p1, p2)
+            g_prima = _razon(p2 - p1, p1 - x_actual)
+
+        error = _error_relativo(x_siguiente, x_actual)
+        filas.append({
+            "nIteracion": n_iteracion,
+            "x_actual": x_actual,
+            "x_siguiente": x_siguiente,
+            "error": error
+        })
+
+        if error < tol_error and aceleracion != 'ninguna':
+            # El valor extrapolado debe ser de verdad un punto fijo: Aitken sobre una sucesión
+            # que oscila sin converger (p. ej. g(x) = 2/x) da valores constantes que no lo son
+            g_siguiente = evaluar(g, x_siguiente)
+            evaluaciones += 1
+            if _error_relativo(g_siguiente, x_siguiente) >= tol_error:
+                error = float("inf")
+
+        if error < tol_error:
+            return {"filas": filas, "convergio": True, "diagnostico": None,
+                    "g_prima_estimada": g_prima, "evaluaciones": evaluaciones}
+
+        # Monitor de divergencia: |g'(x)| estimada > 1 sostenida (pasos del método en Steffensen)
+        paso = x_siguiente - x_actual
+        if aceleracion == 'steffensen':
+            aumenta = paso_anterior is not None and abs(paso) > abs(paso_anterior)
+        else:
+            aumenta = g_prima is not None and g_prima > 1
+        crecientes = crecientes + 1 if aumenta else 0
+        if crecientes >= ITERACIONES_DIVERGENCIA or not math.isfinite(x_siguiente) \
+                or abs(x_siguiente) > MAGNITUD_MAXIMA:
+            if crecientes < ITERACIONES_DIVERGENCIA:
+                motivo = f"|x| superó {MAGNITUD_MAXIMA:g}"
+            elif aceleracion == 'steffensen':
+                motivo = f"los pasos crecieron {crecientes} iteraciones seguidas"
+            else:
+                motivo = f"|g'(x)| estimada > 1 durante {crecientes} iteraciones seguidas"
+            return {"filas": filas, "convergio": False, "g_prima_estimada": g_prima,
+                    "evaluaciones": evaluaciones,
+                    "diagnostico": {"iteracion": n_iteracion, "motivo": motivo,
+                                    "g_prima_estimada": g_prima}}
+        paso_anterior = paso
+        x_actual = x_siguiente
+
+    return {"filas": filas, "convergio": False, "diagnostico": None, "g_prima_estimada": g_prima,
+            "evaluaciones": evaluaciones}
@@ -1,14 +1,13 @@
 from flask import Flask, request, jsonify
-from sympy import symbols, diff, N
-from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application
 from flask_cors import CORS
 import numpy as np
+from expresiones import obtener_ecuacion, evaluar_grilla, cache_ecuaciones
+from lotes import leer_lote, resolver_lote, numero
+from nucleo_secante import secante_vectorizada, secante, VARIANTES
 
 app = Flask(__name__)
 CORS(app)
 
-transformations = (standard_transformations + (implicit_multiplication_application,))
-
 @app.route('/secante', methods=['GET'])
 def metodo_secante():
     try:
@@ -26,69 +25,37 @@ def metodo_secante():
         if tol_error < 1e-10 or tol_error > 0.999999:
             return jsonify({"error": "El valor de 'tol_error' debe estar entre 0.0000000001 y 0.999999."}), 400
 
-        # Convertir la ecuación a expresión simbólica
-        x = symbols('x')
+        # Variante: secante (por defecto), interpolacion_inversa o muller
+        variante = request.args.get('metodo', 'secante')
+        if variante not in VARIANTES:
+            return jsonify({"error": f"El parámetro 'metodo' debe ser uno de: {', '.join(VARIANTES)}."}), 400
+
+        # Convertir la ecuación a una función compilada (o tomarla de la caché)
         try:
-            f = parse_expr(ecuacion_str, transformations=transformations)  # f(x)
+            f = obtener_ecuacion(ecuacion_str)["f"]  # f(x)
         except Exception as e:
             return jsonify({"error": f"Error en la sintaxis de la ecuación: {str(e)}"}), 400
 
-        # Variables de iteración
-        nIteracion = 0
-        error = 1.0
-        x_actual = x0
-        x_anterior = x1
-        tabla = []
-        x_hist = [x0, x1]  # Guardar los puntos utilizados
-        fx_hist = [float(N(f.subs(x, x0))), float(N(f.subs(x, x1)))]
-
-        # Algoritmo de la secante
-        while error >= tol_error:
-            nIteracion += 1
-
-            try:
-                # Calcular f(x_actual) y f(x_anterior)
-                f_actual = float(f.subs(x, x_actual))
-                f_anterior = float(f.subs(x, x_anterior))
-
-                # Calcular el siguiente valor de x usando la fórmula de la secante
-                x_siguiente = x_actual - (f_actual * (x_actual - x_anterior)) / (f_actual - f_anterior)
-
-                # Calcular el error absoluto
-                error = abs(x_siguiente - x_actual)
-
-                # Calcular f(x_siguiente) para fines de visualización
-                f_siguiente = float(f.subs(x, x_siguiente))
-
-                # Agregar la iteración a la tabla de resultados
-                tabla.append({
-                    "nIteracion": nIteracion,
-                    "x_actual": round(x_actual, 4),  # Redondear a 4 decimales
-                    "x_anterior": round(x_anterior, 4),  # Redondear a 4 decimales
-                    "x_siguiente": round(x_siguiente, 4),  # Redondear a 4 decimales
-                    "f_siguiente": round(f_siguiente, 4),  # Redondear a 4 decimales
-                    "error": round(error, 4)  # Redondear a 4 decimales
-                })
-
-                # Guardar historial para gráfica
-                x_hist.append(x_siguiente)
-                fx_hist.append(float(N(f.subs(x, x_siguiente))))
-
-                # Actualizar los valores de x para la siguiente iteración
-                x_anterior = x_actual
-                x_actual = x_siguiente
-
-                # Verificar si el método no converge después de un número máximo de iteraciones
-                if nIteracion >= 100:
-                    return jsonify({
-                        "error": "El método no convergió después del número máximo de iteraciones.",
-                        "tabla": tabla
-                    }), 400
-
-            except ZeroDivisionError:
-                return jsonify({"error": "División por cero encontrada. El método no puede continuar."}), 400
-            except Exception as e:
-                return jsonify({"error": f"Error durante la iteración: {str(e)}"}), 400
+        # Algoritmo de la secante (una evaluación de f por iteración)
+        try:
+            resultado = secante(f, x0, x1, tol_error, variante)
+        except ZeroDivisionError:
+            return jsonify({"error": "División por cero encontrada. El método no puede continuar."}), 400
+        except Exception as e:
+            return jsonify({"error": f"Error durante la iteración: {str(e)}"}), 400
+
+        # Tabla de iteraciones con los valores redondeados a 4 decimales
+        tabla = [{clave: valor if clave in ("nIteracion", "paso") else round(valor, 4) for clave, valor in fila.items()}
+                 for fila in resultado["filas"]]
+
+        # Verificar si el método no converge después de un número máximo de iteraciones
+        if not resultado["convergio"]:
+            return jsonify({
+                "error": "El método no convergió después del número máximo de iteraciones.",
+                "tabla": tabla
+            }), 400
+
+        x_hist, fx_hist = resultado["x_hist"], resultado["fx_hist"]
 
         # Para la gráfica: evaluamos f(x) en un rango que cubra todos los valores de x_hist
         min_x = min(x_hist)
@@ -97,13 +64,7 @@ def metodo_secante():
             min_x -= 1
             max_x += 1
         grafico_x = np.linspace(min_x, max_x, 100)
-        grafico_y = []
-        for val in grafico_x:
-            try:
-                yval = float(N(f.subs(x, val)))
-            except:
-                yval = None
-            grafico_y.append(yval)
+        grafico_y = evaluar_grilla(f, grafico_x)
 
         # Retornar la tabla de iteraciones y los datos de la gráfica
         return jsonify({
@@ -111,12 +72,59 @@ def metodo_secante():
             "grafico_x": grafico_x.tolist(),
             "grafico_y": grafico_y,
             "x_hist": x_hist,
-            "fx_hist": fx_hist
+            "fx_hist": fx_hist,
+            "metodo": variante,
+            "evaluaciones": resultado["evaluaciones"]
         })
 
     except Exception as e:
         return jsonify({"error": f"Error inesperado: {str(e)}"}), 500
 
 
+def validar_problema(problema):
+    """Valida un problema del lote con las mismas reglas que /secante."""
+    ecuacion_str = problema.get('ecuacion')
+    if not isinstance(ecuacion_str, str) or not ecuacion_str.strip():
+        raise ValueError("Falta el parámetro 'ecuacion'.")
+    x0, x1, tol_error = numero(problema, 'x0'), numero(problema, 'x1'), numero(problema, 'tol_error')
+    if tol_error < 1e-10 or tol_error > 0.999999:
+        raise ValueError("El valor de 'tol_error' debe estar entre 0.0000000001 y 0.999999.")
+    return ecuacion_str, (x0, x1, tol_error)
+
+def resolver_grupo(ecuacion, parametros):
+    """Todos los pares iniciales de una misma ecuación iteran a la vez."""
+    x0, x1, tol_error = (np.array(columna) for columna in zip(*parametros))
+    r = secante_vectorizada(ecuacion["f"], x0, x1, tol_error)
+    resultados = []
+    for i, mensaje in enumerate(r["mensajes"]):
+        if mensaje:
+            resultados.append({"ok": False, "error": mensaje, "iteraciones": int(r["iteraciones"][i])})
+        else:
+            resultados.append({"ok": True, "raiz": float(r["raiz"][i]), "fx": float(r["fx"][i]),
+                               "error_aproximado": float(r["error"][i]),
+                               "iteraciones": int(r["iteraciones"][i])})
+    return resultados
+
+@app.route('/secante/lote', methods=['POST'])
+def metodo_secante_lote():
+    try:
+        # Recibe {"problemas": [{"ecuacion", "x0", "x1", "tol_error"}, ...]} y devuelve un
+        # resultado por problema, en el mismo orden, con su propio error si falla
+        try:
+            problemas = leer_lote(request.get_json(silent=True))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        return jsonify({"resultados": resolver_lote(problemas, validar_problema, resolver_grupo)})
+
+    except Exception as e:
+        return jsonify({"error": f"Error inesperado: {str(e)}"}), 500
+
+
+@app.route('/cache', methods=['GET'])
+def estadisticas_cache():
+    # Aciertos, fallos y desalojos de la caché de ecuaciones parseadas y compiladas
+    return jsonify(cache_ecuaciones.estadisticas())
+
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5004)
\ No newline at end of file
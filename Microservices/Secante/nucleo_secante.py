@@ -0,0 +1,158 @@
+import numpy as np
+from expresiones import evaluar, evaluar_arreglo
+
+VARIANTES = ('secante', 'interpolacion_inversa', 'muller')
+
+def secante_vectorizada(f, x0, x1, tol_error, max_iter=100):
+    """
+    Método de la secante desde muchos pares (x0, x1) a la vez, con el criterio de /secante:
+    |x_{k+1} - x_k| < tol_error, o error de no convergencia tras max_iter iteraciones.
+    Cada iteración evalúa f una sola vez sobre los puntos nuevos de los problemas activos
+    (los valores anteriores se conservan). Devuelve arreglos con la raíz, f(raíz), el
+    error, las iteraciones y una lista de mensajes de error (None si convergió).
+    """
+    x_actual = np.array(x0, dtype=float)
+    x_anterior = np.array(x1, dtype=float)
+    tol_error = np.broadcast_to(np.asarray(tol_error, dtype=float), x_actual.shape)
+    m = x_actual.size
+    mensajes = [None] * m
+    f_actual = evaluar_arreglo(f, x_actual)
+    f_anterior = evaluar_arreglo(f, x_anterior)
+    error = np.ones(m)
+    iteraciones = np.zeros(m, dtype=int)
+
+    activos = np.isfinite(f_actual) & np.isfinite(f_anterior)
+    for i in np.flatnonzero(~activos):
+        punto = x_actual[i] if not np.isfinite(f_actual[i]) else x_anterior[i]
+        mensajes[i] = f"Error durante la iteración: La función no está definida en x = {punto}"
+
+    for n_iteracion in range(1, max_iter + 1):
+        idx = np.flatnonzero(activos)
+        if idx.size == 0:
+            break
+        xa, xp, fa, fp = x_actual[idx], x_anterior[idx], f_actual[idx], f_anterior[idx]
+
+        division_por_cero = fa == fp
+        for i in idx[division_por_cero]:
+            mensajes[i] = "División por cero encontrada. El método no puede continuar."
+            activos[i] = False
+        validos = ~division_por_cero
+        idx, xa, xp, fa, fp = idx[validos], xa[validos], xp[validos], fa[validos], fp[validos]
+
+        x_siguiente = xa - (fa * (xa - xp)) / (fa - fp)
+        f_siguiente = evaluar_arreglo(f, x_siguiente)
+        invalidos = ~np.isfinite(f_siguiente)
+        for i, punto in zip(idx[invalidos], x_siguiente[invalidos]):
+            mensajes[i] = f"Error durante la iteración: La función no está definida en x = {punto}"
+            activos[i] = False
+        validos = ~invalidos
+        idx, xa, fa = idx[validos], xa[validos], fa[validos]
+        x_siguiente, f_siguiente = x_siguiente[validos], f_siguiente[validos]
+
+        error[idx] = np.abs(x_siguiente - xa)
+        x_anterior[idx], f_anterior[idx] = xa, fa
+        x_actual[idx], f_actual[idx] = x_siguiente, f_siguiente
+        iteraciones[idx] = n_iteracion
+        activos[idx[error[idx] < tol_error[idx]]] = False
+
+    for i in np.flatnonzero(activos):
+        mensajes[i] = "El método no convergió después del número máximo de iteraciones."
+    return {"raiz": x_actual, "fx": f_actual, "error": error, "iteraciones": iteraciones,
+            "mensajes": mensajes}
+
+def _paso_secante(ventana):
+    """Secante con los dos puntos más recientes de la ventana."""
+    (xp, fp), (xa, fa) = ventana[-2:]
+    if fa == fp:
+        raise ZeroDivisionError
+    return xa - (fa * (xa - xp)) / (fa - fp)
+
+def _paso_interpolacion_inversa(ventana):
+    """Interpolación cuadrática inversa: x = P(0), con P el polinomio que interpola x en función de f."""
+    (xa, fa), (xb, fb), (xc, fc) = ventana
+    if fa == fb or fa == fc or fb == fc:
+        raise ZeroDivisionError
+    return (xa * fb * fc / ((fa - fb) * (fa - fc))
+            + xb * fa * fc / ((fb - fa) * (fb - fc))
+            + xc * fa * fb / ((fc - fa) * (fc - fb)))
+
+def _paso_muller(ventana):
+    """
+    Método de Muller: raíz de la parábola que pasa por los tres puntos, la más cercana
+    al punto más reciente. Solo raíces reales: si el discriminante es negativo se toma el vértice.
+    """
+    (xa, fa), (xb, fb), (xc, fc) = ventana
+    h1, h2 = xb - xa, xc - xb
+    d1, d2 = (fb - fa) / h1, (fc - fb) / h2
+    a = (d2 - d1) / (h2 + h1)
+    b = a * h2 + d2
+    discriminante = b * b - 4 * fc * a
+    if discriminante < 0:
+        # Sin raíces reales (a != 0): el vértice, donde |P| es mínimo
+        return xc - b / (2 * a)
+    raiz_discriminante = discriminante ** 0.5
+    denominador = b + raiz_discriminante if b >= 0 else b - raiz_discriminante
+    if denominador == 0:
+        raise ZeroDivisionError
+    return xc - 2 * fc / denominador
+
+PASOS = {"interpolacion_inversa": _paso_interpolacion_inversa, "muller": _paso_muller}
+
+def secante(f, x0, x1, tol_error, variante='secante', max_iter=100):
+    """
+    Secante y sus variantes de orden superior sobre una ventana con los últimos puntos y
+    sus valores de f: cada iteración hace exactamente una evaluación nueva de f.
+    - 'secante': los dos puntos más recientes, igual que /secante (x0 es el primer x_actual)
+    - 'interpolacion_inversa' y 'muller': los tres puntos más recientes; el primer paso,
+      con solo dos puntos, y cualquier paso con valores de f repetidos usan la secante
+    Criterio de parada: |x_{k+1} - x_k| < tol_error. Devuelve un diccionario con las filas
+    (sin redondear), x_hist, fx_hist, evaluaciones y convergio. Lanza ZeroDivisionError si
+    la secante divide entre cero y ValueError si f no está definida en algún punto.
+    """
+    f0, f1 = evaluar(f, x0), evaluar(f, x1)
+    evaluaciones = 2
+    # Ventana del punto más antiguo al más reciente
+    ventana = [(x1, f1), (x0, f0)]
+    filas = []
+    x_hist = [x0, x1]
+    fx_hist = [f0, f1]
+    convergio = False
+
+    for n_iteracion in range(1, max_iter + 1):
+        paso = 'secante'
+        x_siguiente = None
+        if variante in PASOS and len(ventana) == 3:
+            try:
+                x_siguiente = PASOS[variante](ventana)
+                paso = variante
+            except ZeroDivisionError:
+                pass
+        if x_siguiente is None:
+            x_siguiente = _paso_secante(ventana)
+
+        (x_anterior, _), (x_actual, _) = ventana[-2:]
+        f_siguiente = evaluar(f, x_siguiente)
+        evaluaciones += 1
+        error = abs(x_siguiente - x_actual)
+
+        fila = {
+            "nIteracion": n_iteracion,
+            "x_actual": x_actual,
+            "x_anterior": x_anterior,
+            "x_siguiente": x_siguiente,
+            "f_siguiente": f_siguiente,
+            "error": error
+        }
+        if variante != 'secante':
+            fila["paso"] = paso
+        filas.append(fila)
+        x_hist.append(x_siguiente)
+        fx_hist.append(f_siguiente)
+
+        ventana = ventana[-2:] + [(x_siguiente, f_siguiente)]
+        if error < tol_error:
+            convergio = True
+            break
+
+    return {"filas": filas, "x_hist": x_hist, "fx_hist": fx_hist, "evaluaciones": evaluaciones,
+            "convergio": convergio}
@@ -1,81 +1,134 @@
 from flask import Flask, request, jsonify
-from sympy import symbols, integrate, N
-from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application
 from flask_cors import CORS
+from expresiones import obtener_ecuacion, cache_ecuaciones
+from cuadratura import simpson, simpson_adaptativo
+from referencia import integral_referencia, cache_referencias, MODOS
 
 app = Flask(__name__)
 CORS(app)
 
-# Transformaciones para permitir multiplicación implícita
-transformations = (standard_transformations + (implicit_multiplication_application,))
+def preparar_integral(validar_n=None):
+    """
+    Lee y valida ecuacion, a, b (y n si se da validar_n, que devuelve un mensaje de error
+    o None), toma la ecuación compilada de la caché y calcula la integral de referencia.
+    Devuelve (datos, None) o (None, respuesta_de_error).
+    """
+    ecuacion_str = request.args.get('ecuacion')
+    a = request.args.get('a', type=float)
+    b = request.args.get('b', type=float)
+    n = request.args.get('n', type=int)
 
-@app.route('/simpson', methods=['GET'])
-def metodo_simpson():
-    try:
-        # Obtener parámetros
-        ecuacion_str = request.args.get('ecuacion')
-        a = request.args.get('a', type=float)
-        b = request.args.get('b', type=float)
-        n = request.args.get('n', type=int)
+    # Validaciones básicas
+    if validar_n and None in (ecuacion_str, a, b, n):
+        return None, (jsonify({"error": "Parámetros faltantes: necesita 'ecuacion', 'a', 'b' y 'n'"}), 400)
+    if None in (ecuacion_str, a, b):
+        return None, (jsonify({"error": "Parámetros faltantes: necesita 'ecuacion', 'a' y 'b'"}), 400)
 
-        # Validaciones básicas
-        if None in (ecuacion_str, a, b, n):
-            return jsonify({"error": "Parámetros faltantes: necesita 'ecuacion', 'a', 'b' y 'n'"}), 400
+    if a >= b:
+        return None, (jsonify({"error": "El valor de 'a' debe ser menor que 'b'"}), 400)
 
-        if a >= b:
-            return jsonify({"error": "El valor de 'a' debe ser menor que 'b'"}), 400
+    if validar_n and validar_n(n):
+        return None, (jsonify({"error": validar_n(n)}), 400)
 
-        if n <= 0 or n % 2 != 0:
-            return jsonify({"error": "El número de subintervalos 'n' debe ser un entero positivo y par"}), 400
+    # Parsear ecuación (o tomarla de la caché)
+    try:
+        entrada = obtener_ecuacion(ecuacion_str)
+    except Exception as e:
+        return None, (jsonify({"error": f"Error en la ecuación: {str(e)}"}), 400)
 
-        # Parsear ecuación
-        x = symbols('x')
-        try:
-            ecuacion = parse_expr(ecuacion_str, transformations=transformations)
-        except Exception as e:
-            return jsonify({"error": f"Error en la ecuación: {str(e)}"}), 400
+    # Integral de referencia: simbólica con límite de tiempo o numérica, guardada en caché
+    modo_referencia = request.args.get('referencia', 'auto')
+    if modo_referencia not in MODOS:
+        return None, (jsonify({"error": f"La 'referencia' debe ser una de: {', '.join(MODOS)}."}), 400)
+    referencia = integral_referencia(ecuacion_str, entrada, a, b, modo_referencia)
 
-        # Calcular la integral real (simbólica)
-        try:
-            integral_real = float(N(integrate(ecuacion, (x, a, b))))
-        except Exception as e:
-            return jsonify({"error": f"No se pudo calcular la integral exacta: {str(e)}"}), 400
+    return {"f": entrada["f"], "a": a, "b": b, "n": n, "referencia": referencia}, None
+
+def comparar_con_referencia(datos, integral):
+    """Campos comunes de la respuesta: referencia usada y error absoluto frente a ella."""
+    integral_real = datos["referencia"]["valor"]
+    return {
+        "integral_real": integral_real,
+        "error_absoluto": None if integral_real is None else abs(integral_real - integral),
+        "referencia": datos["referencia"]["tipo"],
+        "error_referencia": datos["referencia"]["error_estimado"],
+        "motivo_referencia": datos["referencia"]["motivo"]
+    }
 
-        # Método de Simpson y datos para graficar
-        h = (b - a) / n
-        suma = 0
-        xi_list = []
-        fxi_list = []
+@app.route('/simpson', methods=['GET'])
+def metodo_simpson():
+    try:
+        # Parámetros, ecuación compilada e integral de referencia
+        datos, error = preparar_integral(
+            lambda n: "El número de subintervalos 'n' debe ser un entero positivo y par"
+            if n <= 0 or n % 2 != 0 else None)
+        if error:
+            return error
+        a, b, n = datos["a"], datos["b"], datos["n"]
+
+        # Método de Simpson y datos para graficar: la función compilada se evalúa en
+        # todos los nodos a la vez y se pondera con los pesos 1, 4, 2, ..., 4, 1
         try:
-            for i in range(n + 1):
-                xi = a + i * h
-                fxi = N(ecuacion.subs(x, xi))
-                xi_list.append(float(xi))
-                fxi_list.append(float(fxi))
-                if i == 0 or i == n:
-                    suma += fxi
-                elif i % 2 == 0:
-                    suma += 2 * fxi
-                else:
-                    suma += 4 * fxi
+            resultado, h, xi, fxi = simpson(datos["f"], a, b, n)
         except Exception as e:
             return jsonify({"error": f"Error al evaluar la función: {str(e)}"}), 400
 
-        resultado = float((h / 3) * suma)
-        error = abs(integral_real - resultado)
-
         return jsonify({
             "integral_simpson": resultado,
-            "integral_real": integral_real,
-            "error_absoluto": error,
+            **comparar_con_referencia(datos, resultado),
             "h": float(h),
             "n": n,
-            "xi": xi_list,
-            "fxi": fxi_list
+            "xi": xi.tolist(),
+            "fxi": fxi.tolist()
         })
 
     except Exception as e:
         return jsonify({"error": f"Error inesperado: {str(e)}"}), 500
 
+@app.route('/simpson/adaptativo', methods=['GET'])
+def metodo_simpson_adaptativo():
+    try:
+        # Parámetros: ecuacion, a, b, tol (por defecto 1e-10) y max_evaluaciones
+        tol = request.args.get('tol', 1e-10, type=float)
+        max_evaluaciones = request.args.get('max_evaluaciones', 100000, type=int)
+        if tol <= 0:
+            return jsonify({"error": "La tolerancia 'tol' debe ser mayor que 0"}), 400
+        if max_evaluaciones < 3:
+            return jsonify({"error": "El valor de 'max_evaluaciones' debe ser al menos 3"}), 400
+
+        datos, error = preparar_integral()
+        if error:
+            return error
+
+        # Subdivide solo donde la estimación de error lo pide; cada punto se evalúa una vez
+        try:
+            r = simpson_adaptativo(datos["f"], datos["a"], datos["b"], tol, max_evaluaciones)
+        except Exception as e:
+            return jsonify({"error": f"Error al evaluar la función: {str(e)}"}), 400
+
+        return jsonify({
+            "integral_simpson": r["valor"],
+            **comparar_con_referencia(datos, r["valor"]),
+            "error_estimado": r["error_estimado"],
+            "convergio": r["convergio"],
+            "evaluaciones": r["evaluaciones"],
+            "tol": tol,
+            "xi": r["xs"].tolist(),
+            "fxi": r["fxs"].tolist()
+        })
+
+    except Exception as e:
+        return jsonify({"error": f"Error inesperado: {str(e)}"}), 500
+
+@app.route('/cache', methods=['GET'])
+def estadisticas_cache():
+    # Aciertos, fallos y desalojos de la caché de ecuaciones parseadas y compiladas
+    return jsonify(cache_ecuaciones.estadisticas())
+
+@app.route('/cache/referencias', methods=['GET'])
+def estadisticas_cache_referencias():
+    # Aciertos, fallos y desalojos de la caché de integrales de referencia
+    return jsonify(cache_referencias.estadisticas())
+
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5008, debug=True)
\ No newline at end of file
@@ -0,0 +1,78 @@
+import numpy as np
+from expresiones import evaluar, evaluar_arreglo
+
+def pesos_simpson(n):
+    """Pesos de la regla de Simpson 1/3 compuesta (n par): 1, 4, 2, 4, ..., 2, 4, 1."""
+    pesos = np.ones(n + 1)
+    pesos[1:-1:2] = 4.0
+    pesos[2:-1:2] = 2.0
+    return pesos
+
+def evaluar_nodos(f, xs):
+    """
+    Evalúa f en todos los nodos de una vez. Lanza ValueError con el primer nodo donde
+    la función no da un número real finito.
+    """
+    fxs = evaluar_arreglo(f, xs)
+    invalidos = ~np.isfinite(fxs)
+    if invalidos.any():
+        raise ValueError(f"La función no está definida en x = {xs[np.argmax(invalidos)]}")
+    return fxs
+
+def regla_compuesta(f, a, b, n, pesos, divisor):
+    """
+    Aplica una regla de Newton-Cotes compuesta sobre los n + 1 nodos equiespaciados:
+    integral = h / divisor * sum(pesos * f(x_i)). Devuelve (integral, h, xs, fxs).
+    """
+    h = (b - a) / n
+    xs = a + h * np.arange(n + 1)
+    fxs = evaluar_nodos(f, xs)
+    return float(h / divisor * np.dot(pesos, fxs)), h, xs, fxs
+
+def simpson(f, a, b, n):
+    """Regla de Simpson 1/3 compuesta con n subintervalos (n par)."""
+    return regla_compuesta(f, a, b, n, pesos_simpson(n), 3)
+
+def simpson_adaptativo(f, a, b, tol=1e-10, max_evaluaciones=100000, profundidad_maxima=50):
+    """
+    Simpson adaptativo: un intervalo se divide en dos mientras la diferencia entre
+    Simpson sobre el intervalo y sobre sus mitades supere 15 * tol (la tolerancia se
+    reparte entre las mitades). Cada punto se evalúa una sola vez. Devuelve un
+    diccionario con el valor, el error estimado, los contadores y los puntos evaluados.
+    """
+    valores = {}
+
+    def fx(t):
+        if t not in valores:
+            try:
+                valores[t] = evaluar(f, t)
+            except (ZeroDivisionError, OverflowError):
+                # Python lanza estas en vez de devolver inf (por ejemplo 1/x en x = 0)
+                raise ValueError(f"La función no está definida en x = {t}")
+        return valores[t]
+
+    def simpson_simple(izq, der):
+        return (der - izq) / 6 * (fx(izq) + 4 * fx((izq + der) / 2) + fx(der))
+
+    pendientes = [(a, b, simpson_simple(a, b), tol, 0)]
+    total, error_total = 0.0, 0.0
+    convergio = True
+    while pendientes:
+        izq, der, entero, tol_local, profundidad = pendientes.pop()
+        medio = (izq + der) / 2
+        s_izq = simpson_simple(izq, medio)
+        s_der = simpson_simple(medio, der)
+        diferencia = s_izq + s_der - entero
+        if abs(diferencia) <= 15 * tol_local or profundidad >= profundidad_maxima \
+                or len(valores) >= max_evaluaciones:
+            if abs(diferencia) > 15 * tol_local:
+                convergio = False
+            total += s_izq + s_der + diferencia / 15
+            error_total += abs(diferencia) / 15
+        else:
+            pendientes.append((medio, der, s_der, tol_local / 2, profundidad + 1))
+            pendientes.append((izq, medio, s_izq, tol_local / 2, profundidad + 1))
+
+    xs = np.array(sorted(valores))
+    return {"valor": float(total), "error_estimado": float(error_total), "convergio": convergio,
+            "evaluaciones": len(valores), "xs": xs, "fxs": np.array([valores[t] for t in xs.tolist()])}
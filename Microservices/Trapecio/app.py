@@ -1,83 +1,171 @@
 from flask import Flask, request, jsonify
-from sympy import symbols, N, integrate
-from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application
 from flask_cors import CORS
+from expresiones import obtener_ecuacion, cache_ecuaciones
+from cuadratura import trapecio, romberg, gauss_legendre
+from referencia import integral_referencia, cache_referencias, MODOS
+
+# Romberg evalúa 2^(niveles - 1) + 1 puntos: con 20 niveles, unas 5 * 10^5 evaluaciones
+MAX_NIVELES_ROMBERG = 20
 
 app = Flask(__name__)
 CORS(app)
 
-# Transformaciones para permitir multiplicación implícita
-transformations = (standard_transformations + (implicit_multiplication_application,))
+def preparar_integral(validar_n=None):
+    """
+    Lee y valida ecuacion, a, b (y n si se da validar_n, que devuelve un mensaje de error
+    o None), toma la ecuación compilada de la caché y calcula la integral de referencia.
+    Devuelve (datos, None) o (None, respuesta_de_error).
+    """
+    ecuacion_str = request.args.get('ecuacion')
+    a = request.args.get('a', type=float)
+    b = request.args.get('b', type=float)
+    n = request.args.get('n', type=int)
+
+    # Validaciones básicas
+    if validar_n and None in (ecuacion_str, a, b, n):
+        return None, (jsonify({"error": "Parámetros faltantes: necesita 'ecuacion', 'a', 'b' y 'n'"}), 400)
+    if None in (ecuacion_str, a, b):
+        return None, (jsonify({"error": "Parámetros faltantes: necesita 'ecuacion', 'a' y 'b'"}), 400)
+
+    if a >= b:
+        return None, (jsonify({"error": "El valor de 'a' debe ser menor que 'b'"}), 400)
+
+    if validar_n and validar_n(n):
+        return None, (jsonify({"error": validar_n(n)}), 400)
+
+    # Parsear ecuación (o tomarla de la caché)
+    try:
+        entrada = obtener_ecuacion(ecuacion_str)
+    except Exception as e:
+        return None, (jsonify({"error": f"Error en la ecuación: {str(e)}"}), 400)
+
+    # Integral de referencia: simbólica con límite de tiempo o numérica, guardada en caché
+    modo_referencia = request.args.get('referencia', 'auto')
+    if modo_referencia not in MODOS:
+        return None, (jsonify({"error": f"La 'referencia' debe ser una de: {', '.join(MODOS)}."}), 400)
+    referencia = integral_referencia(ecuacion_str, entrada, a, b, modo_referencia)
+
+    return {"f": entrada["f"], "a": a, "b": b, "n": n, "referencia": referencia}, None
+
+def comparar_con_referencia(datos, integral):
+    """Campos comunes de la respuesta: referencia usada y error absoluto frente a ella."""
+    integral_real = datos["referencia"]["valor"]
+    return {
+        "integral_real": integral_real,
+        "error_absoluto": None if integral_real is None else abs(integral_real - integral),
+        "referencia": datos["referencia"]["tipo"],
+        "error_referencia": datos["referencia"]["error_estimado"],
+        "motivo_referencia": datos["referencia"]["motivo"]
+    }
 
 @app.route('/trapecio', methods=['GET'])
 def metodo_trapecio():
     try:
-        # Obtener parámetros
-        ecuacion_str = request.args.get('ecuacion')
-        a = request.args.get('a', type=float)
-        b = request.args.get('b', type=float)
-        n = request.args.get('n', type=int)
-
-        # Validaciones básicas
-        if None in (ecuacion_str, a, b, n):
-            return jsonify({"error": "Parámetros faltantes: necesita 'ecuacion', 'a', 'b' y 'n'"}), 400
+        # Parámetros, ecuación compilada e integral de referencia
+        datos, error = preparar_integral(
+            lambda n: "El número de subdivisiones 'n' debe ser mayor que 0" if n <= 0 else None)
+        if error:
+            return error
+        a, b, n = datos["a"], datos["b"], datos["n"]
+
+        # Calcular la integral por el método del trapecio y recolectar datos para graficar:
+        # la función compilada se evalúa en todos los nodos a la vez (pesos 1, 2, ..., 2, 1)
+        try:
+            integral_trapecio, h, xi, fxi = trapecio(datos["f"], a, b, n)
+        except Exception as e:
+            return jsonify({"error": f"Error al calcular la integral: {str(e)}"}), 400
 
-        if a >= b:
-            return jsonify({"error": "El valor de 'a' debe ser menor que 'b'"}), 400
+        return jsonify({
+            "integral_trapecio": integral_trapecio,
+            **comparar_con_referencia(datos, integral_trapecio),
+            "h": float(h),
+            "n": n,
+            "xi": xi.tolist(),
+            "fxi": fxi.tolist()
+        })
 
-        if n <= 0:
-            return jsonify({"error": "El número de subdivisiones 'n' debe ser mayor que 0"}), 400
+    except Exception as e:
+        return jsonify({"error": f"Error inesperado: {str(e)}"}), 500
 
-        # Parsear ecuación
-        x = symbols('x')
+@app.route('/romberg', methods=['GET'])
+def metodo_romberg():
+    try:
+        # Parámetros: ecuacion, a, b, tol (por defecto 1e-10) y max_niveles (por defecto 20)
+        tol = request.args.get('tol', 1e-10, type=float)
+        max_niveles = request.args.get('max_niveles', MAX_NIVELES_ROMBERG, type=int)
+        if tol <= 0:
+            return jsonify({"error": "La tolerancia 'tol' debe ser mayor que 0"}), 400
+        if not 2 <= max_niveles <= MAX_NIVELES_ROMBERG:
+            return jsonify({"error": f"El valor de 'max_niveles' debe estar entre 2 y {MAX_NIVELES_ROMBERG}"}), 400
+
+        datos, error = preparar_integral()
+        if error:
+            return error
+
+        # Trapecios sucesivos que reutilizan los puntos ya evaluados + extrapolación de Richardson
         try:
-            ecuacion = parse_expr(ecuacion_str, transformations=transformations)
+            r = romberg(datos["f"], datos["a"], datos["b"], tol, max_niveles)
         except Exception as e:
-            return jsonify({"error": f"Error en la ecuación: {str(e)}"}), 400
+            return jsonify({"error": f"Error al calcular la integral: {str(e)}"}), 400
 
-        # Calcular la integral real (simbólica)
-        try:
-            integral_real = float(N(integrate(ecuacion, (x, a, b))))
-        except Exception as e:
-            return jsonify({"error": f"No se pudo calcular la integral exacta: {str(e)}"}), 400
+        return jsonify({
+            "integral_romberg": r["valor"],
+            **comparar_con_referencia(datos, r["valor"]),
+            "error_estimado": r["error_estimado"],
+            "convergio": r["convergio"],
+            "niveles": r["niveles"],
+            "evaluaciones": r["evaluaciones"],
+            "tabla": r["tabla"],
+            "tol": tol,
+            "xi": r["xs"].tolist(),
+            "fxi": r["fxs"].tolist()
+        })
 
-        # Calcular la integral por el método del trapecio y recolectar datos para graficar
-        try:
-            h = (b - a) / n
-            suma = 0.0
-            xi_list = []
-            fxi_list = []
-
-            for i in range(n + 1):
-                xi = a + i * h
-                fxi = N(ecuacion.subs(x, xi))
-                xi_list.append(float(xi))
-                fxi_list.append(float(fxi))
-
-                # Ponderar los extremos
-                if i == 0 or i == n:
-                    suma += fxi
-                else:
-                    suma += 2 * fxi
-
-            integral_trapecio = float((h / 2) * suma)
-            error = abs(integral_real - integral_trapecio)
+    except Exception as e:
+        return jsonify({"error": f"Error inesperado: {str(e)}"}), 500
 
+@app.route('/gauss-legendre', methods=['GET'])
+def metodo_gauss_legendre():
+    try:
+        # Parámetros: ecuacion, a, b, orden (puntos por subintervalo) y subintervalos
+        orden = request.args.get('orden', 5, type=int)
+        subintervalos = request.args.get('subintervalos', 1, type=int)
+        if not 1 <= orden <= 200:
+            return jsonify({"error": "El 'orden' debe estar entre 1 y 200"}), 400
+        if subintervalos < 1:
+            return jsonify({"error": "El número de 'subintervalos' debe ser mayor que 0"}), 400
+
+        datos, error = preparar_integral()
+        if error:
+            return error
+
+        try:
+            integral, xi, fxi = gauss_legendre(datos["f"], datos["a"], datos["b"], orden, subintervalos)
         except Exception as e:
             return jsonify({"error": f"Error al calcular la integral: {str(e)}"}), 400
 
         return jsonify({
-            "integral_trapecio": integral_trapecio,
-            "integral_real": integral_real,
-            "error_absoluto": error,
-            "h": float(h),
-            "n": n,
-            "xi": xi_list,
-            "fxi": fxi_list
+            "integral_gauss_legendre": integral,
+            **comparar_con_referencia(datos, integral),
+            "orden": orden,
+            "subintervalos": subintervalos,
+            "evaluaciones": len(xi),
+            "xi": xi.tolist(),
+            "fxi": fxi.tolist()
         })
 
     except Exception as e:
         return jsonify({"error": f"Error inesperado: {str(e)}"}), 500
 
+@app.route('/cache', methods=['GET'])
+def estadisticas_cache():
+    # Aciertos, fallos y desalojos de la caché de ecuaciones parseadas y compiladas
+    return jsonify(cache_ecuaciones.estadisticas())
+
+@app.route('/cache/referencias', methods=['GET'])
+def estadisticas_cache_referencias():
+    # Aciertos, fallos y desalojos de la caché de integrales de referencia
+    return jsonify(cache_referencias.estadisticas())
+
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5007, debug=True)
\ No newline at end of file
@@ -0,0 +1,90 @@
+from functools import lru_cache
+import numpy as np
+from expresiones import evaluar_arreglo
+
+def pesos_trapecio(n):
+    """Pesos de la regla del trapecio compuesta: 1, 2, 2, ..., 2, 1."""
+    pesos = np.full(n + 1, 2.0)
+    pesos[0] = pesos[-1] = 1.0
+    return pesos
+
+def evaluar_nodos(f, xs):
+    """
+    Evalúa f en todos los nodos de una vez. Lanza ValueError con el primer nodo donde
+    la función no da un número real finito.
+    """
+    fxs = evaluar_arreglo(f, xs)
+    invalidos = ~np.isfinite(fxs)
+    if invalidos.any():
+        raise ValueError(f"La función no está definida en x = {xs[np.argmax(invalidos)]}")
+    return fxs
+
+def regla_compuesta(f, a, b, n, pesos, divisor):
+    """
+    Aplica una regla de Newton-Cotes compuesta sobre los n + 1 nodos equiespaciados:
+    integral = h / divisor * sum(pesos * f(x_i)). Devuelve (integral, h, xs, fxs).
+    """
+    h = (b - a) / n
+    xs = a + h * np.arange(n + 1)
+    fxs = evaluar_nodos(f, xs)
+    return float(h / divisor * np.dot(pesos, fxs)), h, xs, fxs
+
+def trapecio(f, a, b, n):
+    """Regla del trapecio compuesta con n subintervalos."""
+    return regla_compuesta(f, a, b, n, pesos_trapecio(n), 2)
+
+def romberg(f, a, b, tol=1e-10, max_niveles=20):
+    """
+    Extrapolación de Romberg sobre trapecios sucesivos con h, h/2, h/4, ...
+    Cada refinamiento evalúa (de una vez) solo los puntos medios nuevos y reutiliza
+    la suma del nivel anterior. Se detiene cuando dos diagonales consecutivas difieren
+    menos que tol (a partir del tercer nivel). Devuelve un diccionario con el valor,
+    el error estimado, la tabla de Romberg, los contadores y los puntos evaluados.
+    """
+    xs = [np.array([a, b])]
+    fxs = [evaluar_nodos(f, xs[0])]
+    tabla = [[(b - a) / 2 * (fxs[0][0] + fxs[0][1])]]
+    evaluaciones = 2
+    error = float("inf")
+    convergio = False
+    for k in range(1, max_niveles):
+        h = (b - a) / 2 ** k
+        nuevos = a + h * (2 * np.arange(2 ** (k - 1)) + 1)
+        fnuevos = evaluar_nodos(f, nuevos)
+        xs.append(nuevos)
+        fxs.append(fnuevos)
+        evaluaciones += len(nuevos)
+
+        fila = [tabla[-1][0] / 2 + h * float(np.sum(fnuevos))]
+        for j in range(1, k + 1):
+            fila.append(fila[j - 1] + (fila[j - 1] - tabla[-1][j - 1]) / (4 ** j - 1))
+        tabla.append(fila)
+        error = abs(fila[-1] - tabla[-2][-1])
+        if k >= 2 and error < tol:
+            convergio = True
+            break
+
+    xs, fxs = np.concatenate(xs), np.concatenate(fxs)
+    orden = np.argsort(xs)
+    return {"valor": float(tabla[-1][-1]), "error_estimado": float(error), "convergio": convergio,
+            "niveles": len(tabla), "evaluaciones": evaluaciones,
+            "tabla": [[float(v) for v in fila] for fila in tabla],
+            "xs": xs[orden], "fxs": fxs[orden]}
+
+@lru_cache(maxsize=64)
+def nodos_gauss_legendre(orden):
+    """Nodos y pesos de Gauss-Legendre en [-1, 1], calculados una vez por orden."""
+    return np.polynomial.legendre.leggauss(orden)
+
+def gauss_legendre(f, a, b, orden=5, subintervalos=1):
+    """
+    Gauss-Legendre de orden dado, compuesto sobre subintervalos iguales. Todos los
+    nodos (orden * subintervalos) se evalúan de una vez. Devuelve (integral, xs, fxs).
+    """
+    nodos, pesos = nodos_gauss_legendre(orden)
+    bordes = np.linspace(a, b, subintervalos + 1)
+    centros = (bordes[:-1] + bordes[1:]) / 2
+    radio = (b - a) / (2 * subintervalos)
+    xs = (centros[:, None] + radio * nodos[None, :]).ravel()
+    fxs = evaluar_nodos(f, xs)
+    return float(radio * np.dot(np.tile(pesos, subintervalos), fxs)), xs, fxs
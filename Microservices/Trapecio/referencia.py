@@ -0,0 +1,118 @@
+import math
+import multiprocessing
+import os
+import warnings
+import numpy as np
+from scipy.integrate import quad, IntegrationWarning
+from sympy import integrate, N
+from expresiones import x, CacheLRU, _a_real
+
+MODOS = ('auto', 'simbolica', 'numerica', 'ninguna')
+
+# Tiempo máximo (segundos) para la integral simbólica antes de pasar a la numérica
+TIEMPO_SIMBOLICA = float(os.environ.get("TIEMPO_INTEGRAL_SIMBOLICA", 2))
+
+# Caché de integrales de referencia por (ecuación, a, b, modo)
+cache_referencias = CacheLRU(
+    int(os.environ.get("CACHE_REFERENCIAS_TAMANO", 256)),
+    float(os.environ.get("CACHE_REFERENCIAS_TTL", 3600))
+)
+
+def _integrar_en_hijo(expr, a, b, conexion):
+    """Cuerpo del proceso hijo: integral simbólica evaluada numéricamente."""
+    try:
+        conexion.send(("ok", float(N(integrate(expr, (x, a, b))))))
+    except Exception as e:
+        conexion.send(("error", str(e)))
+    finally:
+        conexion.close()
+
+def integral_simbolica(expr, a, b, tiempo=TIEMPO_SIMBOLICA):
+    """
+    Calcula integrate(expr, (x, a, b)) en un proceso aparte que se termina si supera el
+    tiempo dado, para que una integral que sympy no resuelve no bloquee al servicio.
+    Devuelve el valor, o lanza TimeoutError o ValueError.
+    """
+    metodos = multiprocessing.get_all_start_methods()
+    contexto = multiprocessing.get_context("fork" if "fork" in metodos else None)
+    receptor, emisor = contexto.Pipe(duplex=False)
+    proceso = contexto.Process(target=_integrar_en_hijo, args=(expr, a, b, emisor), daemon=True)
+    proceso.start()
+    emisor.close()
+    try:
+        if not receptor.poll(tiempo):
+            raise TimeoutError(f"La integral simbólica superó {tiempo} s.")
+        estado, valor = receptor.recv()
+    except EOFError:
+        raise ValueError("El cálculo simbólico terminó sin resultado.")
+    finally:
+        receptor.close()
+        if proceso.is_alive():
+            proceso.terminate()
+        proceso.join()
+    if estado != "ok":
+        raise ValueError(valor)
+    if not math.isfinite(valor):
+        raise ValueError("La integral simbólica no es finita.")
+    return valor
+
+class _NoDefinida(Exception):
+    """Señal interna: el integrando no es finito en el punto dado."""
+
+def integral_numerica(f, a, b):
+    """
+    Referencia numérica con cuadratura adaptativa de Gauss-Kronrod (QUADPACK).
+    Devuelve (valor, error_estimado); lanza ValueError si no da un número finito.
+    """
+    def integrando(t):
+        # Un punto donde f falla o no es finita detiene la cuadratura: QUADPACK no admite NaN
+        # (con limit=200 corrompe su lista de subintervalos y el proceso termina)
+        try:
+            with np.errstate(all='ignore'):
+                valor = _a_real(f(t))
+        except Exception:
+            valor = math.nan
+        if not math.isfinite(valor):
+            raise _NoDefinida(t)
+        return valor
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", IntegrationWarning)
+            valor, error = quad(integrando, a, b, limit=200, epsabs=1e-13, epsrel=1e-12)
+    except _NoDefinida as e:
+        raise ValueError(f"La función no está definida en x = {e.args[0]:.6g}.")
+    if not math.isfinite(valor):
+        raise ValueError("La función no es integrable numéricamente en el intervalo.")
+    return float(valor), float(error)
+
+def integral_referencia(ecuacion_str, entrada, a, b, modo='auto'):
+    """
+    Integral de referencia para calcular error_absoluto, guardada en caché por (ecuación, a, b, modo):
+    - 'auto': simbólica con límite de tiempo; si falla o se agota, numérica
+    - 'simbolica': solo simbólica (con límite de tiempo)
+    - 'numerica': solo numérica (Gauss-Kronrod adaptativa)
+    - 'ninguna': no se calcula
+    Devuelve {"valor", "tipo", "error_estimado", "motivo"}; "tipo" indica la referencia usada.
+    Si la referencia pedida no se puede calcular (por ejemplo, una singularidad en el intervalo)
+    se devuelve tipo 'ninguna' con el motivo, y el fallo también se guarda en caché.
+    """
+    if modo == 'ninguna':
+        return {"valor": None, "tipo": "ninguna", "error_estimado": None, "motivo": None}
+
+    def construir():
+        try:
+            if modo != 'numerica':
+                try:
+                    return {"valor": integral_simbolica(entrada["expr"], a, b), "tipo": "simbolica",
+                            "error_estimado": 0.0, "motivo": None}
+                except (TimeoutError, ValueError):
+                    if modo == 'simbolica':
+                        raise
+            valor, error = integral_numerica(entrada["f"], a, b)
+            return {"valor": valor, "tipo": "numerica", "error_estimado": error, "motivo": None}
+        except Exception as e:
+            return {"valor": None, "tipo": "ninguna", "error_estimado": None,
+                    "motivo": f"No se pudo calcular la integral exacta: {str(e)}"}
+
+    return cache_referencias.obtener((ecuacion_str, a, b, modo), construir)
@@ -9,7 +9,11 @@ methods = [
     {"id": 3, "name": "Newton-Raphson", "description": "Método iterativo para hallar raíces", "url": "http://localhost:5003/newton_raphson"},
     {"id": 4, "name": "Secante", "description": "Método numérico para encontrar raíces sin derivadas", "url": "http://localhost:5004/secante"},
     {"id": 4, "name": "jacobi", "description": "Método numérico iterativo para para resolver ecuaciones lineales", "url": "http://localhost:5005/jacobi"},
-    {"id": 4, "name": "gauss-seidel", "description": "Método numérico iterativo para para resolver ecuaciones lineales con presicion albitraria", "url": "http://localhost:5006/gauss-seidel"}
+    {"id": 4, "name": "gauss-seidel", "description": "Método numérico iterativo para para resolver ecuaciones lineales con presicion albitraria", "url": "http://localhost:5006/gauss-seidel"},
+    {"id": 5, "name": "Brent", "description": "Raíces con intervalo: Brent y regla falsa de Illinois, siempre convergentes", "url": "http://localhost:5011/brent"},
+    {"id": 6, "name": "Newton para sistemas", "description": "Newton multivariable con jacobiano simbólico y LU, o Broyden, para sistemas no lineales", "url": "http://localhost:5012/newton_sistemas"},
+    {"id": 7, "name": "Krylov", "description": "Gradiente conjugado, GMRES y BiCGSTAB con precondicionadores Jacobi e ILU(0) para sistemas lineales grandes", "url": "http://localhost:5013/krylov"},
+    {"id": 8, "name": "LU", "description": "Solución directa por factorización LU con pivoteo parcial, guardada en caché para nuevos lados derechos", "url": "http://localhost:5014/lu"}
 ]
 
 
@@ -0,0 +1,82 @@
+"""
+Latencia de /trapecio y /simpson contra n: bucle original (subs + N en cada nodo y suma
+de números de sympy) frente a la función compilada evaluada sobre toda la malla con
+los vectores de pesos de cuadratura.py.
+
+Se mide solo la parte numérica (la integral simbólica de referencia es igual en ambos).
+La ecuación se compila antes de medir (en el servicio queda en la caché tras la primera
+solicitud). El bucle original solo se mide hasta n = 10^3.
+
+Uso: python benchmarks/bench_cuadratura.py
+"""
+import importlib.util
+import os
+import sys
+import time
+
+from sympy import symbols, N
+from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application
+
+RAIZ = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Microservices")
+sys.path.insert(0, os.path.join(RAIZ, "Trapecio"))
+from expresiones import obtener_ecuacion  # noqa: E402
+from cuadratura import trapecio  # noqa: E402
+
+
+def cargar_modulo(nombre, ruta):
+    """Cada servicio tiene su propio cuadratura.py; el de Simpson se carga con otro nombre."""
+    spec = importlib.util.spec_from_file_location(nombre, ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+simpson = cargar_modulo("cuadratura_simpson", os.path.join(RAIZ, "Simpson", "cuadratura.py")).simpson
+
+transformations = (standard_transformations + (implicit_multiplication_application,))
+x = symbols('x')
+ECUACION = "sin(x)*exp(-x**2) + x**3"
+
+
+def original(ecuacion_str, a, b, n, regla):
+    """Bucle de los servicios originales."""
+    ecuacion = parse_expr(ecuacion_str, transformations=transformations)
+    h = (b - a) / n
+    suma = 0
+    for i in range(n + 1):
+        fxi = N(ecuacion.subs(x, a + i * h))
+        if i == 0 or i == n:
+            suma += fxi
+        elif regla == "simpson":
+            suma += 4 * fxi if i % 2 else 2 * fxi
+        else:
+            suma += 2 * fxi
+    return float(h / (3 if regla == "simpson" else 2) * suma)
+
+
+def vectorizado(ecuacion_str, a, b, n, regla):
+    f = obtener_ecuacion(ecuacion_str)["f"]
+    return (simpson if regla == "simpson" else trapecio)(f, a, b, n)[0]
+
+
+def cronometrar(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return (time.perf_counter() - inicio) * 1000, resultado
+
+
+def main():
+    obtener_ecuacion(ECUACION)
+    print(f"{'regla':>9}{'n':>9}{'original (ms)':>16}{'vectorizado (ms)':>18}{'dif.':>10}")
+    for regla in ("trapecio", "simpson"):
+        for n in (10, 100, 1000, 10**4, 10**5, 10**6):
+            t_nuevo, valor = cronometrar(lambda: vectorizado(ECUACION, 0.0, 2.0, n, regla))
+            if n <= 1000:
+                t_orig, valor_orig = cronometrar(lambda: original(ECUACION, 0.0, 2.0, n, regla))
+                print(f"{regla:>9}{n:>9}{t_orig:>16.1f}{t_nuevo:>18.2f}{abs(valor - valor_orig):>10.1e}")
+            else:
+                print(f"{regla:>9}{n:>9}{'-':>16}{t_nuevo:>18.2f}{'-':>10}")
+
+
+if __name__ == "__main__":
+    main()
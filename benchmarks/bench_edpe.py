@@ -0,0 +1,63 @@
+"""
+Tiempo de solución de la placa calentada (EDPE) para n = 10, 100, 500 con cada método
+de placa.py, comparado con el doble bucle de Gauss-Seidel original.
+
+El bucle original solo se mide para n = 10 (para n = 100 tarda minutos) y Jacobi
+vectorizado solo hasta n = 100, porque necesita O(n^2) barridos para converger.
+
+Uso: python benchmarks/bench_edpe.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Microservices", "EDPE"))
+from placa import inicializar_placa, resolver  # noqa: E402
+
+TOL = 1e-4
+MAX_ITER = 100000
+
+
+def placa_original(n, tol=TOL, max_iter=MAX_ITER):
+    """Doble bucle de Gauss-Seidel del servicio original."""
+    T = inicializar_placa(n, 100, 100, 0, 0)
+    for _ in range(max_iter):
+        T_old = T.copy()
+        for i in range(1, n + 1):
+            for j in range(1, n + 1):
+                T[i, j] = 0.25 * (T[i + 1, j] + T[i - 1, j] + T[i, j + 1] + T[i, j - 1])
+        if np.max(np.abs(T - T_old)) < tol:
+            break
+    return T
+
+
+def cronometrar(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return (time.perf_counter() - inicio) * 1000, resultado
+
+
+def main():
+    metodos = ("sor", "jacobi", "directo", "multigrid")
+    print(f"{'n':>5}{'original':>12}" + "".join(f"{m:>16}" for m in metodos) + "   (ms / iteraciones)")
+    for n in (10, 100, 500):
+        fila = f"{n:>5}"
+        if n <= 10:
+            t, _ = cronometrar(lambda: placa_original(n))
+            fila += f"{t:>12.1f}"
+        else:
+            fila += f"{'-':>12}"
+        for metodo in metodos:
+            if metodo == "jacobi" and n > 100:
+                fila += f"{'-':>16}"
+                continue
+            T = inicializar_placa(n, 100, 100, 0, 0)
+            t, iteraciones = cronometrar(lambda: resolver(T, metodo, TOL, MAX_ITER))
+            fila += f"{f'{t:.1f} / {iteraciones}':>16}"
+        print(fila)
+
+
+if __name__ == "__main__":
+    main()
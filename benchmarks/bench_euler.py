@@ -0,0 +1,74 @@
+"""
+Método de Euler: bucle original con eval() en cada paso contra la función compilada una
+vez y los arreglos preasignados de integradores.py.
+
+Se mide f = x + y (depende de y, bucle con la lambda compilada) y f = np.cos(x)
+(no depende de y, totalmente vectorizado). El bucle original solo se mide hasta 10^5 pasos.
+Al final se mide la petición completa a /euler (integración + JSON) con la respuesta
+submuestreada por defecto y con max_puntos=0 (todos los puntos).
+
+Uso: python benchmarks/bench_euler.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Microservices", "Euler"))
+from funciones import compilar_funcion  # noqa: E402
+from integradores import euler  # noqa: E402
+from app import app  # noqa: E402
+
+
+def euler_original(f_str, x0, y0, xf, n):
+    """Bucle del servicio original: eval() compila la cadena en cada paso."""
+    def f(x, y):
+        return eval(f_str, {"x": x, "y": y, "np": np, "__builtins__": {}})
+
+    h = (xf - x0) / n
+    xs, ys, fs = [x0], [y0], []
+    for _ in range(n):
+        fn = f(xs[-1], ys[-1])
+        fs.append(fn)
+        ys.append(ys[-1] + h * fn)
+        xs.append(xs[-1] + h)
+    fs.append(f(xs[-1], ys[-1]))
+    return xs, ys, fs
+
+
+def euler_compilado(f_str, x0, y0, xf, n):
+    f, usadas = compilar_funcion(f_str)
+    return euler(f, x0, y0, xf, n, depende_de_y="y" in usadas)
+
+
+def cronometrar(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return (time.perf_counter() - inicio) * 1000, resultado
+
+
+def main():
+    print(f"{'f':>12}{'n':>10}{'original (ms)':>16}{'compilado (ms)':>16}{'dif. máx.':>12}")
+    for f_str in ("x + y", "np.cos(x)"):
+        for n in (10**3, 10**5, 10**6):
+            t_nuevo, (_, ys, _) = cronometrar(lambda: euler_compilado(f_str, 0.0, 1.0, 1.0, n))
+            if n <= 10**5:
+                t_orig, (_, ys_orig, _) = cronometrar(lambda: euler_original(f_str, 0.0, 1.0, 1.0, n))
+                diferencia = float(np.max(np.abs(np.asarray(ys_orig) - ys)))
+                print(f"{f_str:>12}{n:>10}{t_orig:>16.1f}{t_nuevo:>16.1f}{diferencia:>12.1e}")
+            else:
+                print(f"{f_str:>12}{n:>10}{'-':>16}{t_nuevo:>16.1f}{'-':>12}")
+
+    cliente = app.test_client()
+    print(f"\n{'f':>12}{'n':>10}{'submuestreada (ms)':>20}{'completa (ms)':>16}")
+    for f_str in ("x + y", "np.cos(x)"):
+        for n in (10**4, 10**5, 10**6):
+            consulta = {"f": f_str, "y0": 1.0, "n": n}
+            t_sub, _ = cronometrar(lambda: cliente.get("/euler", query_string=consulta))
+            t_todo, _ = cronometrar(lambda: cliente.get("/euler", query_string={**consulta, "max_puntos": 0}))
+            print(f"{f_str:>12}{n:>10}{t_sub:>20.1f}{t_todo:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Compara la latencia por solicitud de los servicios de raíces evaluando la ecuación
+con sympy (subs + N, como se hacía antes) contra la función compilada de expresiones.py.
+
+Uso: python benchmarks/bench_expresiones.py
+"""
+import importlib.util
+import os
+import sys
+import time
+
+import numpy as np
+from sympy import symbols, diff, N
+from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+transformations = (standard_transformations + (implicit_multiplication_application,))
+x = symbols('x')
+
+
+def cargar_app(servicio):
+    """Importa el app.py de un microservicio con su carpeta en sys.path."""
+    carpeta = os.path.join(RAIZ, "Microservices", servicio)
+    sys.path.insert(0, carpeta)
+    for modulo in [m for m in sys.modules if m in ("expresiones",)]:
+        del sys.modules[modulo]
+    spec = importlib.util.spec_from_file_location(f"app_{servicio}", os.path.join(carpeta, "app.py"))
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    sys.path.remove(carpeta)
+    return modulo.app.test_client()
+
+
+def biseccion_sympy(ecuacion_str, xo, xu, tol_error):
+    """Reproduce la evaluación original de /biseccion con subs y N."""
+    ecuacion = parse_expr(ecuacion_str, transformations=transformations)
+    a, b = xo, xu
+    fxo = N(ecuacion.subs(x, xo))
+    error, xm_previo, n = 1.0, xo, 0
+    while error >= tol_error and n < 100:
+        n += 1
+        xm = (xo + xu) / 2
+        fxm = N(ecuacion.subs(x, xm))
+        if n > 1:
+            error = abs((xm - xm_previo) / xm)
+        if fxo * fxm < 0:
+            xu = xm
+        else:
+            xo, fxo = xm, fxm
+        xm_previo = xm
+    return [float(N(ecuacion.subs(x, val))) for val in np.linspace(a, b, 100)]
+
+
+def newton_sympy(ecuacion_str, x0, tol_error):
+    """Reproduce la evaluación original de /newton_raphson con subs y N."""
+    f = parse_expr(ecuacion_str, transformations=transformations)
+    g = x - f / diff(f, x)
+    g_prima = diff(g, x)
+    x_actual, error, x_hist = x0, 1.0, [x0]
+    while error >= tol_error:
+        x_siguiente = float(g.subs(x, x_actual))
+        error = abs(x_siguiente - x_actual)
+        float(f.subs(x, x_actual))
+        float(g_prima.subs(x, x_actual))
+        float(N(f.subs(x, x_siguiente)))
+        x_hist.append(x_siguiente)
+        x_actual = x_siguiente
+    return [float(N(f.subs(x, val))) for val in np.linspace(min(x_hist), max(x_hist), 100)]
+
+
+def secante_sympy(ecuacion_str, x0, x1, tol_error):
+    """Reproduce la evaluación original de /secante con subs y N."""
+    f = parse_expr(ecuacion_str, transformations=transformations)
+    x_actual, x_anterior, error, x_hist = x0, x1, 1.0, [x0, x1]
+    while error >= tol_error:
+        f_actual = float(f.subs(x, x_actual))
+        f_anterior = float(f.subs(x, x_anterior))
+        x_siguiente = x_actual - (f_actual * (x_actual - x_anterior)) / (f_actual - f_anterior)
+        error = abs(x_siguiente - x_actual)
+        float(f.subs(x, x_siguiente))
+        float(N(f.subs(x, x_siguiente)))
+        x_hist.append(x_siguiente)
+        x_anterior, x_actual = x_actual, x_siguiente
+    return [float(N(f.subs(x, val))) for val in np.linspace(min(x_hist), max(x_hist), 100)]
+
+
+def punto_fijo_sympy(ecuacion_str, transformada_str, x0, tol_error):
+    """Reproduce la evaluación original de /punto_fijo con subs."""
+    ecuacion = parse_expr(ecuacion_str, transformations=transformations)
+    transformada = parse_expr(transformada_str, transformations=transformations)
+    x_actual, error = x0, 1.0
+    while error >= tol_error:
+        x_siguiente = float(transformada.subs(x, x_actual))
+        error = abs((x_siguiente - x_actual) / x_siguiente)
+        float(abs(ecuacion.subs(x, x_actual)))
+        x_actual = x_siguiente
+
+
+def cronometrar(funcion, repeticiones):
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) / repeticiones * 1000
+
+
+def main():
+    repeticiones = 10
+    casos = [
+        ("Biseccion", "/biseccion?ecuacion=x**3-2x-5&xo=2&xu=3&tol_error=0.000001",
+         lambda: biseccion_sympy("x**3-2x-5", 2.0, 3.0, 1e-6)),
+        ("NewtonRaphson", "/newton_raphson?ecuacion=exp(-x)-x&x0=0&tol_error=0.000001",
+         lambda: newton_sympy("exp(-x)-x", 0.0, 1e-6)),
+        ("Secante", "/secante?ecuacion=cos(x)-x&x0=0&x1=1&tol_error=0.000001",
+         lambda: secante_sympy("cos(x)-x", 0.0, 1.0, 1e-6)),
+        ("PuntoFijo", "/punto_fijo?ecuacion=cos(x)-x&transformada=cos(x)&x0=1&tol_error=0.000001",
+         lambda: punto_fijo_sympy("cos(x)-x", "cos(x)", 1.0, 1e-6)),
+    ]
+    print(f"{'servicio':<15}{'sympy subs (ms)':>18}{'compilado (ms)':>18}")
+    for servicio, url, antiguo in casos:
+        cliente = cargar_app(servicio)
+        assert cliente.get(url).status_code == 200
+        t_nuevo = cronometrar(lambda: cliente.get(url), repeticiones)
+        t_antiguo = cronometrar(antiguo, repeticiones)
+        print(f"{servicio:<15}{t_antiguo:>18.2f}{t_nuevo:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
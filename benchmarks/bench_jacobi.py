@@ -0,0 +1,77 @@
+"""
+Escalamiento del método de Jacobi para n = 10 ... 10^5 incógnitas.
+
+Compara el bucle por filas original con el núcleo vectorizado de nucleo_jacobi.py,
+con la matriz densa y en formato CSR. El bucle original y la versión densa solo se
+miden mientras la matriz cabe cómodamente en memoria.
+
+Uso: python benchmarks/bench_jacobi.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+from scipy import sparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Microservices", "Jacobi"))
+from nucleo_jacobi import jacobi  # noqa: E402
+
+TOL = 1e-8
+MAX_ITER = 200
+
+
+def sistema(n, semilla=0):
+    """Sistema disperso, estrictamente diagonal dominante, con ~5 coeficientes por fila."""
+    rng = np.random.default_rng(semilla)
+    filas = np.repeat(np.arange(n), 4)
+    columnas = rng.integers(0, n, size=4 * n)
+    fuera = sparse.csr_matrix((rng.standard_normal(4 * n), (filas, columnas)), shape=(n, n))
+    fuera.setdiag(0)
+    fuera.eliminate_zeros()
+    diagonal = np.asarray(abs(fuera).sum(axis=1)).ravel() + 1.0
+    A = (fuera + sparse.diags(diagonal)).tocsr()
+    b = rng.standard_normal(n)
+    return A, b
+
+
+def jacobi_original(A, b, x0):
+    """Bucle por filas del servicio original (sin la construcción de la tabla)."""
+    n = len(b)
+    x = x0.copy()
+    for _ in range(MAX_ITER):
+        x_nuevo = np.zeros_like(x)
+        for i in range(n):
+            suma = np.dot(A[i, :], x) - A[i, i] * x[i]
+            x_nuevo[i] = (b[i] - suma) / A[i, i]
+        error = np.linalg.norm(x_nuevo - x, ord=np.inf)
+        np.linalg.norm(np.dot(A, x_nuevo) - b, ord=np.inf)
+        if error < TOL:
+            return x_nuevo
+        x = x_nuevo.copy()
+    return x
+
+
+def cronometrar(funcion):
+    inicio = time.perf_counter()
+    funcion()
+    return (time.perf_counter() - inicio) * 1000
+
+
+def main():
+    print(f"{'n':>8}{'original (ms)':>16}{'densa (ms)':>14}{'CSR (ms)':>12}{'iteraciones':>14}")
+    for n in (10, 100, 1000, 10_000, 100_000):
+        A, b = sistema(n)
+        x0 = np.zeros(n)
+        resultado = {}
+        t_csr = cronometrar(lambda: resultado.update(jacobi(A, b, x0, TOL, MAX_ITER, guardar_valores=False)))
+        t_densa = t_original = float("nan")
+        if n <= 1000:
+            densa = A.toarray()
+            t_densa = cronometrar(lambda: jacobi(densa, b, x0, TOL, MAX_ITER, guardar_valores=False))
+            t_original = cronometrar(lambda: jacobi_original(densa, b, x0))
+        print(f"{n:>8}{t_original:>16.1f}{t_densa:>14.1f}{t_csr:>12.1f}{resultado['iteraciones']:>14}")
+
+
+if __name__ == "__main__":
+    main()
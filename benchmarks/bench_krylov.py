@@ -0,0 +1,67 @@
+"""
+Métodos de Krylov (krylov.py) frente a los servicios iterativos existentes, Jacobi
+(nucleo_jacobi.py) y Gauss-Seidel rojo-negro (nucleo_gauss_seidel.py), sobre la ecuación
+de Poisson 2D con el esquema de 5 puntos en CSR, mal condicionada al crecer la malla.
+
+Jacobi y Gauss-Seidel se detienen por el cambio entre iteraciones y los métodos de Krylov
+por el residuo relativo, así que para comparar se informa el residuo relativo final
+||b - A x|| / ||b|| de todos. Los métodos estacionarios se cortan en MAX_ITER iteraciones.
+
+Uso: python benchmarks/bench_krylov.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+from scipy import sparse
+
+RAIZ = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Microservices")
+for servicio in ("Jacobi", "GaussSeidel", "Krylov"):
+    sys.path.insert(0, os.path.join(RAIZ, servicio))
+from nucleo_jacobi import jacobi  # noqa: E402
+from nucleo_gauss_seidel import gauss_seidel  # noqa: E402
+from krylov import resolver  # noqa: E402
+
+TOL = 1e-8
+MAX_ITER = 5000
+
+
+def poisson(m):
+    """Laplaciano 2D de 5 puntos en una malla m x m (n = m^2 incógnitas)."""
+    T = sparse.diags([-1.0, 2.0, -1.0], [-1, 0, 1], shape=(m, m))
+    return sparse.kronsum(T, T).tocsr()
+
+
+def cronometrar(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return (time.perf_counter() - inicio) * 1000, resultado
+
+
+def main():
+    print(f"{'n':>7}{'método':>24}{'iter.':>8}{'tiempo (ms)':>14}{'residuo rel.':>15}")
+    for m in (20, 50, 100):
+        A = poisson(m)
+        n = A.shape[0]
+        b = np.ones(n)
+        x0 = np.zeros(n)
+        casos = [
+            ("jacobi", lambda: jacobi(A, b, x0, TOL, MAX_ITER, False)),
+            ("gauss-seidel rojo-negro", lambda: gauss_seidel(A, b, x0, TOL, MAX_ITER, 'rojo_negro')),
+            ("cg", lambda: resolver(A, b, x0, TOL, MAX_ITER, 'cg', 'ninguno', guardar_valores=False)),
+            ("cg + ilu0", lambda: resolver(A, b, x0, TOL, MAX_ITER, 'cg', 'ilu0', guardar_valores=False)),
+            ("gmres(30) + ilu0", lambda: resolver(A, b, x0, TOL, MAX_ITER, 'gmres', 'ilu0', 30, False)),
+            ("bicgstab + jacobi", lambda: resolver(A, b, x0, TOL, MAX_ITER, 'bicgstab', 'jacobi',
+                                                   guardar_valores=False)),
+            ("bicgstab + ilu0", lambda: resolver(A, b, x0, TOL, MAX_ITER, 'bicgstab', 'ilu0',
+                                                 guardar_valores=False)),
+        ]
+        for nombre, funcion in casos:
+            tiempo, resultado = cronometrar(funcion)
+            residuo = np.linalg.norm(b - A @ resultado["x"]) / np.linalg.norm(b)
+            print(f"{n:>7}{nombre:>24}{resultado['iteraciones']:>8}{tiempo:>14.1f}{residuo:>15.2e}")
+
+
+if __name__ == "__main__":
+    main()
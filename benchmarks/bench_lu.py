@@ -0,0 +1,72 @@
+"""
+Peticiones repetidas con la misma matriz A y distintos lados derechos b.
+
+Compara, para sistemas densos diagonal dominantes de n incógnitas:
+- jacobi: el servicio /jacobi, que itera desde cero en cada petición
+- lu (primera): huella de A + factorización + sustituciones (fallo de caché)
+- lu (caché): huella de A + sustituciones, la factorización ya está guardada
+- lu (clave): solo sustituciones, la petición trae la clave en lugar de A
+- lu 32 lados: un solo A X = B con 32 columnas, tiempo por lado derecho
+
+Uso: python benchmarks/bench_lu.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+RAIZ = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Microservices")
+for servicio in ("Jacobi", "LU"):
+    sys.path.insert(0, os.path.join(RAIZ, servicio))
+from nucleo_jacobi import jacobi  # noqa: E402
+from factorizacion import CacheFactorizaciones, clave_matriz  # noqa: E402
+
+TOL = 1e-8
+MAX_ITER = 1000
+REPETICIONES = 5
+
+
+def sistema(n, semilla=0):
+    """Matriz densa estrictamente diagonal dominante y un lado derecho aleatorio."""
+    rng = np.random.default_rng(semilla)
+    A = rng.standard_normal((n, n))
+    A += np.diag(np.abs(A).sum(axis=1) + 1.0)
+    return A, rng.standard_normal(n)
+
+
+def cronometrar(funcion, repeticiones=REPETICIONES):
+    """Mediana en milisegundos."""
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return float(np.median(tiempos))
+
+
+def main():
+    print(f"{'n':>6}{'jacobi (ms)':>13}{'lu primera':>12}{'lu caché':>10}{'lu clave':>10}{'32 lados / lado':>17}")
+    for n in (100, 500, 1000, 2000):
+        A, b = sistema(n)
+        x0 = np.zeros(n)
+        B = np.random.default_rng(1).standard_normal((n, 32))
+
+        t_jacobi = cronometrar(lambda: jacobi(A, b, x0, TOL, MAX_ITER, guardar_valores=False))
+
+        def primera():
+            cache = CacheFactorizaciones(8, 1 << 30)
+            cache.obtener(clave_matriz(A), A)[0].resolver(b)
+
+        cache = CacheFactorizaciones(8, 1 << 30)
+        clave = clave_matriz(A)
+        cache.obtener(clave, A)
+        t_primera = cronometrar(primera)
+        t_cache = cronometrar(lambda: cache.obtener(clave_matriz(A), A)[0].resolver(b))
+        t_clave = cronometrar(lambda: cache.buscar(clave).resolver(b))
+        t_multiple = cronometrar(lambda: cache.buscar(clave).resolver(B)) / B.shape[1]
+        print(f"{n:>6}{t_jacobi:>13.2f}{t_primera:>12.2f}{t_cache:>10.2f}{t_clave:>10.3f}{t_multiple:>17.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Reordenamiento de ecuaciones para Jacobi/Gauss-Seidel: orden voraz original contra la
+asignación de máximo peso de reordenamiento.py (densa y dispersa).
+
+Cada sistema es diagonal dominante después de una permutación aleatoria de filas,
+así que un buen reordenamiento debe recuperar la dominancia diagonal.
+
+Uso: python benchmarks/bench_reordenamiento.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+from scipy import sparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Microservices", "Jacobi"))
+from reordenamiento import orden_pivoteo  # noqa: E402
+
+
+def sistema_permutado(n, semilla=0):
+    """Matriz dispersa diagonal dominante con las filas desordenadas."""
+    rng = np.random.default_rng(semilla)
+    filas = np.repeat(np.arange(n), 4)
+    columnas = rng.integers(0, n, size=4 * n)
+    fuera = sparse.csr_matrix((rng.standard_normal(4 * n), (filas, columnas)), shape=(n, n))
+    fuera.setdiag(0)
+    fuera.eliminate_zeros()
+    diagonal = np.asarray(abs(fuera).sum(axis=1)).ravel() + 1.0
+    A = (fuera + sparse.diags(diagonal)).tocsr()
+    return A[rng.permutation(n)]
+
+
+def orden_voraz(A):
+    """Reordenamiento voraz del servicio original (O(n^4) en Python)."""
+    n = A.shape[0]
+    nuevo_orden = []
+    ecuaciones_disponibles = list(range(n))
+    variables_disponibles = list(range(n))
+    for _ in range(n):
+        mejor_ecuacion = None
+        mejor_puntaje = -1
+        for eq_idx in ecuaciones_disponibles:
+            for var_idx in variables_disponibles:
+                if A[eq_idx, var_idx] != 0:
+                    puntaje = abs(A[eq_idx, var_idx]) - sum(abs(A[eq_idx, j]) for j in range(n) if j != var_idx)
+                    if puntaje > mejor_puntaje:
+                        mejor_puntaje = puntaje
+                        mejor_ecuacion = eq_idx
+                        mejor_variable = var_idx
+        nuevo_orden.append((mejor_ecuacion, mejor_variable))
+        ecuaciones_disponibles.remove(mejor_ecuacion)
+        variables_disponibles.remove(mejor_variable)
+    return nuevo_orden
+
+
+def dominante(A, orden):
+    """Indica si la matriz queda diagonal dominante con el orden dado."""
+    filas = [f for f, _ in orden]
+    columnas = [c for _, c in orden]
+    B = A[np.ix_(filas, columnas)]
+    return bool(np.all(2 * np.abs(np.diag(B)) >= np.abs(B).sum(axis=1)))
+
+
+def cronometrar(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return (time.perf_counter() - inicio) * 1000, resultado
+
+
+def main():
+    print(f"{'n':>6}{'voraz (ms)':>14}{'húngaro (ms)':>15}{'disperso (ms)':>15}{'dominante':>11}")
+    for n in (10, 30, 100, 1000, 2000, 5000):
+        A = sistema_permutado(n)
+        densa = A.toarray()
+        t_voraz = float("nan")
+        if n <= 30:
+            t_voraz, _ = cronometrar(lambda: orden_voraz(densa))
+        t_denso, orden = cronometrar(lambda: orden_pivoteo(densa))
+        t_disperso, orden_disperso = cronometrar(lambda: orden_pivoteo(A))
+        ok = dominante(densa, orden) and dominante(densa, orden_disperso)
+        print(f"{n:>6}{t_voraz:>14.1f}{t_denso:>15.1f}{t_disperso:>15.1f}{str(ok):>11}")
+
+
+if __name__ == "__main__":
+    main()